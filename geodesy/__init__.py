@@ -34,33 +34,138 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(__file__))
     del os, sys
 
-from datum import *  # PYCHOK __all__
-from dms   import *  # PYCHOK __all__
-from lcc   import *  # PYCHOK __all__
-from mgrs  import *  # PYCHOK __all__
-from osgr  import *  # PYCHOK __all__
-from utils import *  # PYCHOK __all__
-from utm   import *  # PYCHOK __all__
-import ellipsoidalNvector  # PYCHOK false
-import ellipsoidalVincenty  # PYCHOK false
-import sphericalNvector  # PYCHOK false
-import sphericalTrigonometry  # PYCHOK false
-
-VincentyError = ellipsoidalVincenty.VincentyError
+# public names lifted from each module, see each module's __all__
+_names = dict(
+    datum=('R_KM', 'R_M', 'R_NM', 'R_SM',
+           'Datum', 'Ellipsoid', 'Transform',
+           'Datums', 'Ellipsoids', 'Transforms'),
+    dms=('F_D', 'F_DM', 'F_DMS', 'F_RAD',
+         'S_DEG', 'S_MIN', 'S_SEC', 'S_SEP',
+         'bearingDMS', 'compassDMS', 'compassPoint', 'latDMS', 'lonDMS',
+         'normDMS', 'parseDMS', 'parse3llh', 'precision', 'toDMS'),
+    ellipsoidalBase=('DatumTransformer', 'to3llhs', 'to3xyzs'),
+    ellipsoidalPolygon=('PolygonArea', 'polygonArea', 'polygonAreas'),
+    geojsonStream=('coordinatesOf', 'datumConverter',
+                   'mapFeatures', 'readFeatures', 'writeFeatures'),
+    mgrs=('Mgrs', 'parseMGRS', 'toMgrs'),
+    osgr=('Osgr', 'parseOSGR', 'toOsgr'),
+    packed=('PackedPoints', 'PointStore',
+            'packLatLons', 'packMgrs', 'packUtms', 'pack', 'storePoints',
+            'unpack', 'unpackLatLons', 'unpackMgrs', 'unpackUtms'),
+    parallel=('parallelBatch', 'parallelMap'),
+    sphericalPolygon=('PolygonIndex', 'PreparedPolygon',
+                      'areEnclosedBy', 'areasOf', 'isEnclosedBy',
+                      'perimetersOf'),
+    simplify=('simplifyDP', 'simplifyStream', 'simplifyVW'),
+    sphericalRoute=('Route', 'Snapper', 'intersectionsOf'),
+    utm=('Utm', 'parseUTM', 'toUtm'),
+    utils=('EPS', 'EPS1', 'EPS2', 'PI', 'PI2', 'PI_2',
+           'FastMath', 'cbrt', 'degrees', 'degrees90', 'degrees180',
+           'degrees360', 'false2f', 'fastmath', 'fdot', 'fdot3', 'fStr',
+           'fsum', 'halfs', 'hypot1', 'hypot3', 'isint', 'isscalar',
+           'len2', 'map2', 'radians', 'radiansPI', 'radiansPI2',
+           'radiansPI_2', 'sin_2', 'tanPI_2_2', 'wrap90', 'wrap180',
+           'wrapPI', 'wrapPI2', 'wrapPI_2'),
+    lcc=('Conic', 'Conics', 'Lcc', 'toLcc'))
 
 # all public contants, classes and functions
-__all__ = ('ellipsoidalNvector', 'ellipsoidalVincenty',
-           'sphericalNvector', 'sphericalTrigonometry',
+__all__ = ('convert', 'ellipsoidalNvector', 'ellipsoidalVincenty',
+           'sphericalNvector', 'sphericalTrigonometry', 'vector3d',
            'VincentyError')  # extended below
-__version__ = '17.02.01'
-
-# lift all public constants, functions, etc.
-import datum as _datum, dms as _dms, mgrs as _mgrs, \
-       utils as _utils, utm as _utm, osgr as _osgr, \
-       lcc as _lcc  # PYCHOK expected
-for m in (_datum, _dms, _mgrs, _osgr, _utm, _utils, _lcc):
-    __all__ += m.__all__
-del m, _datum, _dms, _mgrs, _osgr, _utm, _utils, _lcc
+__version__ = '17.02.07'
+
+# module name for each public name
+_modules = dict((_, _) for _ in __all__[:-1])
+_modules['VincentyError'] = 'ellipsoidalVincenty'
+for _ in ('datum', 'dms', 'ellipsoidalBase', 'mgrs',
+          'osgr', 'utm', 'utils', 'lcc', 'packed', 'geojsonStream',
+          'parallel', 'sphericalPolygon', 'ellipsoidalPolygon',
+          'sphericalRoute', 'simplify'):
+    __all__ += _names[_]
+    _modules.update((n, _) for n in _names[_])
+del _, _names
+
+
+def _lazy():
+    # import modules lazily on Python 3.7+, unless
+    # environment variable GEODESY_LAZY is set to 0
+    import os, sys  # PYCHOK expected
+    return sys.version_info[:2] >= (3, 7) and \
+           os.environ.get('GEODESY_LAZY', '') != '0'
+
+
+if _lazy():  # PEP 562
+
+    def __getattr__(name):
+        '''Import the module of a public name on first use.
+        '''
+        try:
+            m = _modules[name]
+        except KeyError:
+            raise AttributeError('module %r has no attribute %r' % (__name__, name))
+        from importlib import import_module
+        m = import_module(m)
+        if name != m.__name__:
+            m = getattr(m, name)
+        globals()[name] = m  # once only
+        return m
+
+    def __dir__():
+        return sorted(set(globals()).union(__all__))
+
+else:  # import all modules and lift all names
+    from datum import *  # PYCHOK __all__
+    from dms   import *  # PYCHOK __all__
+    from ellipsoidalBase import *  # PYCHOK __all__
+    from ellipsoidalPolygon import *  # PYCHOK __all__
+    from geojsonStream import *  # PYCHOK __all__
+    from lcc   import *  # PYCHOK __all__
+    from mgrs  import *  # PYCHOK __all__
+    from osgr  import *  # PYCHOK __all__
+    from packed import *  # PYCHOK __all__
+    from parallel import *  # PYCHOK __all__
+    from simplify import *  # PYCHOK __all__
+    from sphericalPolygon import *  # PYCHOK __all__
+    from sphericalRoute import *  # PYCHOK __all__
+    from utils import *  # PYCHOK __all__
+    from utm   import *  # PYCHOK __all__
+    import convert  # PYCHOK false
+    import ellipsoidalNvector  # PYCHOK false
+    import ellipsoidalVincenty  # PYCHOK false
+    import sphericalNvector  # PYCHOK false
+    import sphericalTrigonometry  # PYCHOK false
+    import vector3d  # PYCHOK false
+
+    VincentyError = ellipsoidalVincenty.VincentyError
+
+del _lazy
+
+if __name__ == '__main__':
+
+    from os import environ
+    from os.path import abspath, dirname
+    from subprocess import call
+    import sys
+    from timeit import timeit
+
+    def _import(lazy, stmt='import geodesy'):
+        e = dict(environ, GEODESY_LAZY=lazy)
+        c = [sys.executable, '-W', 'ignore', '-c', stmt]
+        d = dirname(dirname(abspath(__file__)))
+        return timeit(lambda: call(c, env=e, cwd=d), number=n) * 1e3 / n
+
+    n = 50
+    b = _import('0', 'pass')  # interpreter startup
+    for t in ('import geodesy', 'from geodesy import toUtm',
+              'from geodesy import ellipsoidalVincenty'):
+        print('%s: eager %.1f vs lazy %.1f ms' % (t,
+              _import('0', t) - b, _import('1', t) - b))
+
+    # Typical result (on Python 3.11.7 64bit):
+
+    # import geodesy: eager 113.1 vs lazy 7.8 ms
+    # from geodesy import toUtm: eager 109.1 vs lazy 53.2 ms
+    # from geodesy import ellipsoidalVincenty: eager 108.0 vs lazy 62.4 ms
 
 # **) MIT License
 #
@@ -8,14 +8,15 @@
 # and <http://www.movable-type.co.uk/scripts/latlong-vectors.html>
 
 from dms import F_D, F_DMS, latDMS, lonDMS, parseDMS
-from math import cos, radians, sin
+from math import cos, degrees, radians, sin
 
 # all public contants, classes and functions
 __all__ = ()  # none
-__version__ = '16.11.11'
+__version__ = '17.02.07'
 
 
 class _Base(object):
+    __slots__ = ()  # no __dict__, see subclasses
 
     def __repr__(self):
         return self.toStr2()
@@ -55,12 +56,69 @@ class _Base(object):
 
 _VectorBase = _Base  # used by vector3d
 
+_fastNews = {}  # fast constructors, keyed by LatLon class
+
+
+def _fastNew(cls):
+    # return a function creating cls instances without calling
+    # cls.__init__, copying all other attributes from a prototype
+    try:
+        return _fastNews[cls]
+    except KeyError:
+        pass
+
+    p = cls(0, 0)  # prototype
+    avs = []
+    for c in cls.__mro__:
+        s = c.__dict__.get('__slots__', ())
+        for a in ((s,) if isinstance(s, str) else s):
+            if a not in ('_height', '_lat', '_lon') and \
+               not a.startswith('__') and hasattr(p, a):
+                avs.append((a, getattr(p, a)))
+    avs = tuple(avs)
+    d = getattr(p, '__dict__', None)  # unslotted subclass
+    new = cls.__new__
+
+    def _new(lat, lon, height, datum):
+        q = new(cls)
+        q._lat = lat
+        q._lon = lon
+        q._height = height
+        for a, v in avs:
+            setattr(q, a, v)
+        if d:
+            q.__dict__.update(d)
+        if datum is not None:
+            q._datum = datum  # not validated
+        return q
+
+    _fastNews[cls] = _new
+    return _new
+
+
+def _latlonRef(ll):
+    # back reference to a LatLon for the Osgr and Utm caches, with
+    # a snapshot of the lat-, longitude, height and datum to detect
+    # any later update of that LatLon, see _latlonOf
+    return ll, ll.lat, ll.lon, ll.height, ll.datum
+
+
+def _latlonOf(ref, LatLon, datum):
+    # return the LatLon of a back reference, provided it
+    # is a LatLon on the datum and has not been updated
+    if ref is not None:
+        ll = ref[0]
+        if ll.__class__ is LatLon and ll.datum == datum \
+                                  and ref == _latlonRef(ll):
+            return ll
+    return None
+
 
 class _LatLonHeightBase(_Base):
     '''Base class for LatLon points on sphereical
        or ellipsiodal earth models.
     '''
-    _height = 0
+    __slots__ = ('_cache', '_height', '_lat', '_lon')
 
     def __init__(self, lat, lon, height=0):
         '''Create a new LatLon instance from the given lat-,
@@ -84,8 +142,8 @@ class _LatLonHeightBase(_Base):
         '''
         self._lat = parseDMS(lat, suffix='NS')
         self._lon = parseDMS(lon, suffix='EW')
-        if height:  # elevation
-            self._height = float(height)
+        self._height = float(height) if height else 0  # elevation
+        self._cache = None  # see _cached
 
     def __eq__(self, other):
         return self.equals(other)
@@ -96,10 +154,90 @@ class _LatLonHeightBase(_Base):
     def __str__(self):
         return self.toStr(form=F_D, prec=6)
 
+    @classmethod
+    def fromArrays(cls, lats, lons, heights=None, datum=None):
+        '''Create LatLon instances from sequences of lat-, longitudes
+           and heights in degrees, see method fromDegrees.
+
+           @param {degrees[]} lats - Latitudes in degrees.
+           @param {degrees[]} lons - Longitudes in degrees.
+           @param {meter[]} [heights=None] - Heights in meter or
+                                             None for all zero.
+           @param {Datum} [datum=None] - Datum for all instances
+                                         or None for the default.
+
+           @returns {LatLon[]} List of LatLon instances.
+
+           @example
+           ps = LatLon.fromArrays((52.205, 48.857), (0.119, 2.351))
+        '''
+        new = _fastNew(cls)
+        if heights is None:
+            return [new(a, b, 0, datum) for a, b in zip(lats, lons)]
+        else:
+            return [new(a, b, h, datum) for a, b, h in zip(lats, lons, heights)]
+
+    @classmethod
+    def fromDegrees(cls, lat, lon, height=0, datum=None):
+        '''Create a LatLon instance from trusted, numeric lat- and
+           longitude in degrees, much faster than the constructor.
+
+           The lat-, longitude and height are used as-is, not parsed,
+           converted nor checked and the datum is not validated.  All
+           other attributes are copied from an instance created by
+           the constructor as cls(0, 0), once for each class.
+
+           @param {degrees} lat - Latitude in degrees.
+           @param {degrees} lon - Longitude in degrees.
+           @param {meter} [height=0] - Height in meter.
+           @param {Datum} [datum=None] - Datum or None for the default
+                                         (ellipsoidal and spherical
+                                          LatLon only).
+
+           @returns {LatLon} LatLon instance.
+
+           @example
+           p = LatLon.fromDegrees(52.205, 0.119)
+        '''
+        return _fastNew(cls)(lat, lon, height, datum)
+
+    @classmethod
+    def fromRadians(cls, lat, lon, height=0, datum=None):
+        '''Create a LatLon instance from trusted, numeric lat- and
+           longitude in radians, see method fromDegrees.
+
+           @param {radians} lat - Latitude in radians.
+           @param {radians} lon - Longitude in radians.
+           @param {meter} [height=0] - Height in meter.
+           @param {Datum} [datum=None] - Datum or None for the default.
+
+           @returns {LatLon} LatLon instance.
+        '''
+        return _fastNew(cls)(degrees(lat), degrees(lon), height, datum)
+
     def _alter(self, other, f=0.5):
         # adjust elevations
         return self.height + f * (other.height - self.height)
 
+    def _cached(self, name, func):
+        # return the cached result of func(), computed once.  All
+        # results are kept in a dict, installed before func() runs
+        # and replaced by _update, such that a result computed
+        # while this point is updated in another thread is never
+        # cached, without locking
+        c = self._cache
+        if c is None:
+            self._cache = c = {}
+        r = c.get(name, None)
+        if r is None:
+            c[name] = r = func()
+        return r
+
+    def _update(self, updated):
+        # reset all caches, after updating an attribute
+        if updated:
+            self._cache = None
+
     def copy(self):
         '''Return a copy of this LatLon point.
 
@@ -139,8 +277,9 @@ class _LatLonHeightBase(_Base):
     def height(self, height):
         '''Set height in meter.
         '''
-        self._update(height != self._height)
+        u = height != self._height
         self._height = height
+        self._update(u)
 
     @property
     def lat(self):
@@ -152,8 +291,9 @@ class _LatLonHeightBase(_Base):
     def lat(self, lat):
         '''Set latitude in degrees.
         '''
-        self._update(lat != self._lat)
+        u = lat != self._lat
         self._lat = lat
+        self._update(u)
 
     @property
     def lon(self):
@@ -165,8 +305,9 @@ class _LatLonHeightBase(_Base):
     def lon(self, lon):
         '''Set longitude in degrees.
         '''
-        self._update(lon != self._lon)
+        u = lon != self._lon
         self._lon = lon
+        self._update(u)
 
     def toradians(self):
         '''Return this point's lat-/longitude in radians.
@@ -209,6 +350,76 @@ class _LatLonHeightBase(_Base):
         ca = cos(a)
         return ca * cos(b), ca * sin(b), sin(a)
 
+
+if __name__ == '__main__':
+
+    import sys
+
+    from ellipsoidalNvector import LatLon as eLatLon, Nvector
+    from ellipsoidalVincenty import LatLon as vLatLon
+    from sphericalTrigonometry import LatLon as sLatLon
+    from utm import toUtm
+    from vector3d import Vector3d
+
+    class _Dict(object):  # instance with __dict__
+        pass
+
+    def _sizes(inst):
+        # bytes per instance, slotted and with a __dict__ holding
+        # the same, not-None attributes (ignoring attribute values)
+        d = _Dict()
+        for c in inst.__class__.__mro__:
+            for a in getattr(c, '__slots__', ()):
+                v = getattr(inst, a, None)
+                if v is not None:
+                    setattr(d, a, v)
+        return sys.getsizeof(inst), sys.getsizeof(d) + sys.getsizeof(d.__dict__)
+
+    for t in (eLatLon(52.205, 0.119), vLatLon(52.205, 0.119, 42),
+              sLatLon(52.205, 0.119), Vector3d(1, 2, 3),
+              Nvector(0.5, 0.5, 0.7071), toUtm(vLatLon(48.8582, 2.2945))):
+        s, d = _sizes(t)
+        print('%s.%s: %d bytes slotted vs %d bytes with __dict__' % (t.__module__,
+              t.__class__.__name__, s, d))
+
+    # Typical result (on Python 3.11.7 64bit):
+
+    # ellipsoidalNvector.LatLon: 112 bytes slotted vs 352 bytes with __dict__
+    # ellipsoidalVincenty.LatLon: 112 bytes slotted vs 344 bytes with __dict__
+    # sphericalTrigonometry.LatLon: 72 bytes slotted vs 336 bytes with __dict__
+    # vector3d.Vector3d: 72 bytes slotted vs 328 bytes with __dict__
+    # ellipsoidalNvector.Nvector: 88 bytes slotted vs 320 bytes with __dict__
+    # utm.Utm: 112 bytes slotted vs 312 bytes with __dict__
+
+    from timeit import timeit
+
+    from datum import Datums
+
+    n = 100000
+    d = Datums.NAD83
+    for C in (eLatLon, vLatLon, sLatLon):
+        c = timeit(lambda: C(52.205, 0.119, 42), number=n)
+        f = timeit(lambda: C.fromDegrees(52.205, 0.119, 42), number=n)
+        print('%s.%s(...) %.2f vs .fromDegrees(...) %.2f usec' % (C.__module__,
+              C.__name__, c * 1e6 / n, f * 1e6 / n))
+    c = timeit(lambda: vLatLon(52.205, 0.119, datum=d), number=n)
+    f = timeit(lambda: vLatLon.fromDegrees(52.205, 0.119, datum=d), number=n)
+    print('ellipsoidalVincenty.LatLon(..., datum) %.2f vs .fromDegrees(..., datum) %.2f usec' % (
+          c * 1e6 / n, f * 1e6 / n))
+    a = [52.205 + i * 1e-5 for i in range(n)]
+    b = [0.119 + i * 1e-5 for i in range(n)]
+    c = timeit(lambda: [vLatLon(x, y) for x, y in zip(a, b)], number=1)
+    f = timeit(lambda: vLatLon.fromArrays(a, b), number=1)
+    print('ellipsoidalVincenty.LatLon %d points %.3f vs .fromArrays %.3f sec' % (n, c, f))
+
+    # Typical result (on Python 3.11.7 64bit):
+
+    # ellipsoidalNvector.LatLon(...) 1.58 vs .fromDegrees(...) 0.95 usec
+    # ellipsoidalVincenty.LatLon(...) 1.50 vs .fromDegrees(...) 0.91 usec
+    # sphericalTrigonometry.LatLon(...) 1.31 vs .fromDegrees(...) 0.68 usec
+    # ellipsoidalVincenty.LatLon(..., datum) 2.39 vs .fromDegrees(..., datum) 1.03 usec
+    # ellipsoidalVincenty.LatLon 100000 points 0.186 vs .fromArrays 0.111 sec
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1@Gmail.com
@@ -0,0 +1,330 @@
+
+# -*- coding: utf-8 -*-
+
+# Streaming conversion of delimited text (CSV or TSV) coordinates
+# between lat-/longitude, UTM, MGRS, OSGR and LCC, as API and as
+# command line tool, see function _main below or run
+
+#   python -m geodesy.convert -help
+
+# The input is read, converted and written in chunks of rows, such
+# that memory use is constant, regardless of the input size.
+
+from datum import Datums
+from ellipsoidalBase import DatumTransformer
+from ellipsoidalVincenty import LatLon
+from lcc import Conics, toLcc
+from mgrs import parseMGRS
+from osgr import parseOSGR, toOsgr
+from parallel import _chunks, _pooled
+from utm import parseUTM, toUtm
+
+import csv
+import sys
+
+# all public contants, classes and functions
+__all__ = ('KINDS',  # constants
+           'convertCSV', 'convertRows')  # functions
+__version__ = '17.02.07'
+
+# input and output kinds, each the number of columns and
+# the default precision, LCC is supported for output only
+KINDS = {'latlon': (2, 6),  # lat, lon in degrees or DMS
+         'lcc':    (2, 0),  # easting, northing
+         'mgrs':   (1, 10),
+         'osgr':   (1, 10),
+         'utm':    (1, 0)}
+
+_headers = {'latlon': ['lat', 'lon'],
+            'lcc':    ['easting', 'northing']}
+
+
+def _fromLatLon(lat, lon, datum):
+    # parse lat-/longitude, degrees or DMS
+    try:
+        return LatLon.fromDegrees(float(lat), float(lon), 0, datum)
+    except ValueError:
+        return LatLon(lat, lon, datum=datum)
+
+
+def _fromMgrs(s, datum):
+    return parseMGRS(s, datum=datum).toUtm().toLatLon(LatLon)
+
+
+def _fromOsgr(s, datum):
+    return parseOSGR(s).toLatLon(LatLon, datum=datum)
+
+
+def _fromUtm(s, datum):
+    return parseUTM(s, datum=datum).toLatLon(LatLon)
+
+
+_froms = {'latlon': _fromLatLon,
+          'mgrs':   _fromMgrs,
+          'osgr':   _fromOsgr,
+          'utm':    _fromUtm}
+
+
+def _toLatLon(ll, prec, unused):
+    return ['%.*f' % (prec, ll.lat), '%.*f' % (prec, ll.lon)]
+
+
+def _toLcc(ll, prec, conic):
+    return toLcc(ll, conic=conic).toStr(prec=prec).split()[:2]
+
+
+def _toMgrs(ll, prec, unused):
+    return [toUtm(ll).toMgrs().toStr(prec=prec)]
+
+
+def _toOsgr(ll, prec, unused):
+    return [toOsgr(ll).toStr(prec=prec)]
+
+
+def _toUtm(ll, prec, unused):
+    return [toUtm(ll).toStr(prec=prec)]
+
+
+_tos = {'latlon': _toLatLon,
+        'lcc':    _toLcc,
+        'mgrs':   _toMgrs,
+        'osgr':   _toOsgr,
+        'utm':    _toUtm}
+
+
+def _convertChunk(rows_cfg):
+    # convert one chunk of rows, the datums and conic by name
+    # to avoid pickling those to and from pool processes
+    rows, (fro, to, cols, datum, toDatum, conic, prec, errors) = rows_cfg
+
+    d = Datums[datum]
+    p = _froms[fro]
+    lls, rs = [], []
+    for r in rows:
+        try:
+            lls.append(p(*([r[c] for c in cols] + [d])))
+        except (IndexError, TypeError, ValueError):
+            if errors == 'raise':
+                raise ValueError('%s invalid: %r' % ('row', r))
+            lls.append(None)
+        rs.append(r)
+
+    if toDatum != datum:  # batch datum conversion
+        T = DatumTransformer(d, Datums[toDatum])
+        i = [j for j, ll in enumerate(lls) if ll is not None]
+        for j, ll in zip(i, T.convertAll([lls[j] for j in i])):
+            lls[j] = ll
+
+    f = _tos[to]
+    c = Conics[conic]
+    b = [''] * KINDS[to][0]
+    for r, ll in zip(rs, lls):
+        if ll is None:
+            r.extend(b)
+        else:
+            try:
+                r.extend(f(ll, prec, c))
+            except (TypeError, ValueError):
+                if errors == 'raise':
+                    raise ValueError('%s invalid: %r' % ('row', r))
+                r.extend(b)
+    return rs
+
+
+def convertRows(rows, fro='latlon', to='utm', cols=None,
+                      datum=Datums.WGS84, toDatum=None,
+                      conic=Conics.WRF_Lb, prec=None,
+                      errors='raise', chunk=10000, processes=0):
+    '''Convert the coordinates in rows of strings, chunk by chunk.
+
+       @param {string[][]} rows - Iterable of rows, each a list of strings.
+       @param {string} [fro='latlon'] - Input kind, see KINDS.
+       @param {string} [to='utm'] - Output kind, see KINDS.
+       @param {int[]} [cols=None] - Index of the input column(s), by
+                                    default the first one or two.
+       @param {Datum} [datum=Datums.WGS84] - Registered input datum.
+       @param {Datum} [toDatum=None] - Registered output datum or None
+                                       for the input datum.
+       @param {Conic} [conic=Conics.WRF_Lb] - Registered conic for LCC.
+       @param {int} [prec=None] - Output precision or None for the
+                                  default precision of each kind.
+       @param {string} [errors='raise'] - Raise an error for invalid
+                                          rows or leave output 'blank'.
+       @param {int} [chunk=10000] - Number of rows per chunk.
+       @param {int} [processes=0] - Number of pool processes to convert
+                                    chunks or 0 to convert serially.
+
+       @returns {iterator} Yielding each row with the output
+                           column(s) appended, in input order.
+
+       @throws {ValueError} Invalid kind, columns or row.
+
+       @example
+       for r in convertRows([['48.8582', '2.2945']], to='mgrs'):
+           print(r)  # ['48.8582', '2.2945', '31U DQ 48251 11932']
+    '''
+    if fro not in _froms:
+        raise ValueError('%s invalid: %r' % ('fro', fro))
+    if to not in _tos:
+        raise ValueError('%s invalid: %r' % ('to', to))
+    if errors not in ('blank', 'raise'):
+        raise ValueError('%s invalid: %r' % ('errors', errors))
+
+    n = KINDS[fro][0]
+    cols = list(range(n)) if cols is None else list(cols)
+    if len(cols) != n:
+        raise ValueError('%s invalid: %r' % ('cols', cols))
+
+    if prec is None:
+        prec = KINDS[to][1]
+    toDatum = toDatum or datum
+    cfg = fro, to, cols, datum.name, toDatum.name, conic.name, prec, errors
+
+    tasks = ((c, cfg) for c in _chunks(rows, chunk))
+    if processes > 0:
+        cs = _pooled(_convertChunk, tasks, processes)
+    else:
+        cs = (_convertChunk(t) for t in tasks)
+    for c in cs:
+        for r in c:
+            yield r
+
+
+def _open(name, mode):
+    # open a csv file, in binary mode for Python 2
+    if sys.version_info[0] > 2:
+        return open(name, mode, newline='')
+    return open(name, mode + 'b')
+
+
+def convertCSV(infile, outfile, fro='latlon', to='utm', cols=None,
+                               delimiter=',', header=False, **options):
+    '''Convert the coordinates in a CSV or TSV file to another file,
+       reading, converting and writing chunk by chunk.
+
+       @param {string|file} infile - Input file name or file object.
+       @param {string|file} outfile - Output file name or file object.
+       @param {string} [fro='latlon'] - Input kind, see KINDS.
+       @param {string} [to='utm'] - Output kind, see KINDS.
+       @param {int[]} [cols=None] - Index of the input column(s).
+       @param {string} [delimiter=','] - Column delimiter, '\\t' for TSV.
+       @param {bool} [header=False] - Input has a header row, to be
+                                      extended with the output names.
+       @param {keywords} options - Other options, see convertRows.
+
+       @returns {int} Number of converted rows.
+
+       @example
+       n = convertCSV('in.csv', 'out.csv', to='osgr', processes=4)
+    '''
+    fi = _open(infile, 'r') if isinstance(infile, str) else infile
+    fo = _open(outfile, 'w') if isinstance(outfile, str) else outfile
+    try:
+        r = csv.reader(fi, delimiter=delimiter)
+        w = csv.writer(fo, delimiter=delimiter, lineterminator='\n')
+        if header:
+            h = next(r, None)
+            if h is not None:
+                w.writerow(h + _headers.get(to, [to]))
+
+        n = 0
+        for c in _chunks(convertRows(r, fro=fro, to=to, cols=cols,
+                                     **options), 1000):
+            w.writerows(c)
+            n += len(c)
+        return n
+    finally:
+        if fi is not infile:
+            fi.close()
+        if fo is not outfile:
+            fo.close()
+
+
+def _main(argv0, args):
+    # command line tool
+    u = '''usage: python -m geodesy.convert [-from latlon|mgrs|osgr|utm]
+       [-to latlon|lcc|mgrs|osgr|utm] [-columns i[,j]] [-delimiter ,|tab]
+       [-header] [-datum name] [-todatum name] [-conic name] [-prec n]
+       [-errors raise|blank] [-chunk n] [-processes n] [infile [outfile]]'''
+
+    kwds = {}
+    while args and args[0].startswith('-') and len(args[0]) > 1:
+        arg = args.pop(0)
+        try:
+            if '-help'.startswith(arg):
+                print(u)
+                return 0
+            elif '-header'.startswith(arg):
+                kwds['header'] = True
+            elif '-from'.startswith(arg):
+                kwds['fro'] = args.pop(0)
+            elif '-to'.startswith(arg) and len(arg) > 2:
+                kwds['to'] = args.pop(0)
+            elif '-todatum'.startswith(arg) and len(arg) > 3:
+                kwds['toDatum'] = Datums[args.pop(0)]
+            elif '-columns'.startswith(arg) and len(arg) > 3:
+                kwds['cols'] = [int(c) for c in args.pop(0).split(',')]
+            elif '-conic'.startswith(arg) and len(arg) > 3:
+                kwds['conic'] = Conics[args.pop(0)]
+            elif '-chunk'.startswith(arg) and len(arg) > 2:
+                kwds['chunk'] = int(args.pop(0))
+            elif '-delimiter'.startswith(arg) and len(arg) > 2:
+                d = args.pop(0)
+                kwds['delimiter'] = '\t' if d.lower() in ('tab', '\\t') else d
+            elif '-datum'.startswith(arg) and len(arg) > 2:
+                kwds['datum'] = Datums[args.pop(0)]
+            elif '-errors'.startswith(arg):
+                kwds['errors'] = args.pop(0)
+            elif '-prec'.startswith(arg) and len(arg) > 2:
+                kwds['prec'] = int(args.pop(0))
+            elif '-processes'.startswith(arg) and len(arg) > 2:
+                kwds['processes'] = int(args.pop(0))
+            else:
+                raise ValueError
+        except (IndexError, KeyError, ValueError):
+            sys.stderr.write('%s invalid option: %s\n%s\n' % (argv0, arg, u))
+            return 1
+
+    if len(args) > 2:
+        sys.stderr.write('%s invalid args: %s\n%s\n' % (argv0, ' '.join(args), u))
+        return 1
+
+    fi = args[0] if len(args) > 0 and args[0] != '-' else sys.stdin
+    fo = args[1] if len(args) > 1 and args[1] != '-' else sys.stdout
+    try:
+        convertCSV(fi, fo, **kwds)
+    except ValueError as x:
+        sys.stderr.write('%s %s\n' % (argv0, x))
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+
+    # use the functions of the imported module, not this
+    # __main__ copy, to allow pickling for pool processes
+    from convert import _main  # PYCHOK expected
+
+    sys.exit(_main('python -m geodesy.convert', sys.argv[1:]))
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1@Gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
@@ -44,7 +44,7 @@ from utils import fdot, fStr, radians
 __all__ = ('R_KM', 'R_M', 'R_NM', 'R_SM',  # constants
            'Datum',  'Ellipsoid',  'Transform',  # classes
            'Datums', 'Ellipsoids', 'Transforms')  # enum-like
-__version__ = '16.12.06'
+__version__ = '17.02.07'
 
 
 class _Enum(dict):  # enum-like
@@ -76,11 +76,20 @@ Datums     = _Enum('Datums')
 
 class _Based(_Base):
 
-    name = ''
+    _enum = None
+    name  = ''
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __reduce_ex__(self, protocol):
+        # pickle a registered instance by enum and name, such
+        # that unpickling returns the same, registered instance
+        e = self._enum
+        if e is not None and e.get(self.name, None) is self:
+            return _registered, (self.__class__.__module__, e.name, self.name)
+        return _Base.__reduce_ex__(self, protocol)
+
     def _fStr(self, prec, *attrs, **others):
         t = fStr([getattr(self, a) for a in attrs], prec=prec, sep=' ', ints=True)
         t = ['%s=%s' % (a, v) for a, v in zip(attrs, t.split())]
@@ -95,6 +104,13 @@ class _Based(_Base):
                 raise NameError('%s.%s exists' % (enum.name, name))
             enum[name] = self
             self.name = name
+            self._enum = enum
+
+
+def _registered(module, enum, name):
+    # unpickle a registered instance, see _Based.__reduce_ex__
+    from importlib import import_module
+    return getattr(import_module(module), enum)[name]
 
 
 class Ellipsoid(_Based):
@@ -341,6 +357,20 @@ class Transform(_Based):
                                  self.rz == other.rz and
                                  self.s  == other.s)
 
+    def _affine(self, inverse=False):
+        # return the 3 rows (t, x, y, z) of the affine matrix
+        # of this transform, forward or inverse, with the same
+        # coefficients and approximations as method transform
+        if inverse:
+            _s1 = 2 - self.s1  # inverse: 1 - s * 1.e-6
+            return ((-self.tx,      _s1,  self.rz, -self.ry),
+                    (-self.ty, -self.rz,      _s1,  self.rx),
+                    (-self.tz,  self.ry, -self.rx,      _s1))
+        else:
+            return ((self.tx,  self.s1, -self.rz,  self.ry),
+                    (self.ty,  self.rz,  self.s1, -self.rx),
+                    (self.tz, -self.ry,  self.rx,  self.s1))
+
     def toStr(self, prec=4):  # PYCHOK expected
         '''Return this transform as a string.
 
@@ -6,21 +6,159 @@
 # and published under the same MIT Licence**, see for example
 # <http://www.movable-type.co.uk/scripts/geodesy/docs/latlon-ellipsoidal.js.html>
 
-from bases import _LatLonHeightBase
+from bases import _LatLonHeightBase, _latlonRef
 from datum import Datum, Datums
 from dms import parse3llh
-from utils import EPS2, degrees90, degrees180, hypot1
+from utils import EPS2, degrees90, degrees180, fdot, hypot1, radians
 from vector3d import Vector3d
 from math import atan2, copysign, cos, hypot, sin, sqrt
 
 # all public constants, classes and functions
-__all__ = ()  # none
-__version__ = '17.02.01'
+__all__ = ('DatumTransformer',  # classes
+           'to3llhs', 'to3xyzs')  # functions
+__version__ = '17.02.07'
+
+
+_Transformers = {}  # cache DatumTransformers, keyed by datum ids
+
+
+def _to3llh(E, x, y, z):
+    # convert geocentric x, y, z to geodetic lat-, longitude
+    # and height on ellipsoid E, see _CartesianBase.to3llh
+    p = hypot(x, y)  # distance from minor axis
+    r = hypot(p, z)  # polar radius
+
+    if min(p, r) > EPS2 and z:  # z == 0 is equatorial
+        # parametric latitude (Bowring eqn 17, replaced)
+        t = (E.b * z) / (E.a * p) * (1 + E.e22 * E.b / r)
+        s = t / hypot1(t)
+        c = s / t
+
+        # geodetic latitude (Bowring eqn 18)
+        a = atan2(z + E.e22 * E.b * s * s * s,
+                  p - E.e2  * E.a * c * c * c)
+        b = atan2(y, x)  # ... and longitude
+
+        # height above ellipsoid (Bowring eqn 7)
+        ca, sa = cos(a), sin(a)
+#       r = E.a / E.e2s2(sa)  # length of normal terminated by minor axis
+#       h = p * ca + z * sa - (E.a * E.a / r)
+        h = p * ca + z * sa - (E.a * E.e2s2(sa))
+
+        a, b = degrees90(a), degrees180(b)
+
+    # see <http://GIS.StackExchange.com/questions/28446/>
+    elif p > EPS2:  # latitude arbitrarily zero
+        a, b, h = 0.0, degrees180(atan2(y, x)), p - E.a
+    else:  # polar latitude, longitude arbitrarily zero
+        a, b, h = copysign(90.0, z), 0.0, abs(z) - E.b
+
+    return a, b, h
+
+
+def _transformer(fromDatum, toDatum):
+    # return a cached DatumTransformer
+    k = id(fromDatum), id(toDatum)
+    T = _Transformers.get(k, None)
+    if T is None or T.fromDatum is not fromDatum \
+                 or T.toDatum   is not toDatum:
+        if len(_Transformers) > 255:  # XXX bound
+            _Transformers.clear()
+        T = _Transformers[k] = DatumTransformer(fromDatum, toDatum)
+    return T
+
+
+class DatumTransformer(object):
+    '''Precomposed Helmert transformation between two datums.
+
+       Converting between two datums, neither of which is WGS84,
+       combines the inverse transform to and the forward transform
+       from WGS84 into a single affine matrix, such that a point
+       needs only one geodetic-to-cartesian round trip.
+    '''
+    _rows3 = ()  # affine matrix rows
+
+    def __init__(self, fromDatum, toDatum):
+        '''Create a transformer between two datums.
+
+           @param {Datum} fromDatum - Datum to convert from.
+           @param {Datum} toDatum - Datum to convert to.
+
+           @throws {TypeError} If either datum is not a Datum.
+
+           @example
+           from geodesy import Datums, DatumTransformer
+           T = DatumTransformer(Datums.OSGB36, Datums.ED50)
+           ps = T.convertAll(pOSGB36s)  # LatLons on ED50
+        '''
+        for n, d in (('fromDatum', fromDatum), ('toDatum', toDatum)):
+            if not isinstance(d, Datum):
+                raise TypeError('%s not a %s: %r' % (n, Datum.__name__, d))
+        self.fromDatum = fromDatum
+        self.toDatum   = toDatum
+
+        W = Datums.WGS84
+        if fromDatum == toDatum:  # identity
+            self._rows3 = W.transform._affine()
+        elif fromDatum == W:  # from WGS84
+            self._rows3 = toDatum.transform._affine()
+        elif toDatum == W:  # to WGS84, use inverse transform
+            self._rows3 = fromDatum.transform._affine(inverse=True)
+        else:  # inverse to WGS84 followed by forward from WGS84
+            r3 = fromDatum.transform._affine(inverse=True)
+            R3 = toDatum.transform._affine()
+            c3 = tuple(zip(*r3))  # columns t, x, y, z
+            self._rows3 = tuple((fdot(c3[0], *R[1:]) + R[0],
+                                 fdot(c3[1], *R[1:]),
+                                 fdot(c3[2], *R[1:]),
+                                 fdot(c3[3], *R[1:])) for R in R3)
+
+    def convert(self, latlon):
+        '''Convert an (ellipsoidal) LatLon point.
+
+           @param {LatLon} latlon - Point on this fromDatum.
+
+           @returns {LatLon} The point converted to this toDatum,
+                             an instance of the latlon class.
+
+           @throws {ValueError} If latlon datum is not this fromDatum.
+        '''
+        if latlon.datum != self.fromDatum:
+            raise ValueError('%s mismatch: %r vs %r' % ('datum',
+                             latlon.datum.name, self.fromDatum.name))
+        x, y, z = self.transform(*latlon.to3xyz())
+        a, b, h = _to3llh(self.toDatum.ellipsoid, x, y, z)
+        return latlon.Top(a, b, height=h, datum=self.toDatum)
+
+    def convertAll(self, latlons):
+        '''Convert any number of (ellipsoidal) LatLon points.
+
+           @param {LatLon[]} latlons - Points on this fromDatum.
+
+           @returns {LatLon[]} List of points on this toDatum.
+
+           @throws {ValueError} If a latlon datum is not this fromDatum.
+        '''
+        return [self.convert(ll) for ll in latlons]
+
+    def transform(self, x, y, z):
+        '''Transform a (geocentric) Cartesian point.
+
+           @param {meter} x - X coordinate on this fromDatum.
+           @param {meter} y - Y coordinate on this fromDatum.
+           @param {meter} z - Z coordinate on this fromDatum.
+
+           @returns {(meter, meter, meter)} 3-Tuple (x, y, z)
+                                            on this toDatum.
+        '''
+        xyz = 1, x, y, z
+        return tuple(fdot(xyz, *r) for r in self._rows3)
 
 
 class _CartesianBase(Vector3d):
     '''Base class for ellipsoidal Cartesian.
     '''
+    __slots__ = ()
 
     def _applyHelmert(self, transform, inverse=False):
         '''Return a new (geocentric) Cartesian point by
@@ -50,38 +188,7 @@ class _CartesianBase(Vector3d):
            height equations', B. R. Bowring, Survey Review, Vol
            28, 218, Oct 1985.
         '''
-        E = datum.ellipsoid
-        x, y, z = self.to3xyz()
-
-        p = hypot(x, y)  # distance from minor axis
-        r = hypot(p, z)  # polar radius
-
-        if min(p, r) > EPS2:
-            # parametric latitude (Bowring eqn 17, replaced)
-            t = (E.b * z) / (E.a * p) * (1 + E.e22 * E.b / r)
-            s = t / hypot1(t)
-            c = s / t
-
-            # geodetic latitude (Bowring eqn 18)
-            a = atan2(z + E.e22 * E.b * s * s * s,
-                      p - E.e2  * E.a * c * c * c)
-            b = atan2(y, x)  # ... and longitude
-
-            # height above ellipsoid (Bowring eqn 7)
-            ca, sa = cos(a), sin(a)
-#           r = E.a / E.e2s2(sa)  # length of normal terminated by minor axis
-#           h = p * ca + z * sa - (E.a * E.a / r)
-            h = p * ca + z * sa - (E.a * E.e2s2(sa))
-
-            a, b = degrees90(a), degrees180(b)
-
-        # see <http://GIS.StackExchange.com/questions/28446/>
-        elif p > EPS2:  # latitude arbitrarily zero
-            a, b, h = 0.0, degrees180(atan2(y, x)), p - E.a
-        else:  # polar latitude, longitude arbitrarily zero
-            a, b, h = copysign(90.0, z), 0.0, abs(z) - E.b
-
-        return a, b, h
+        return _to3llh(datum.ellipsoid, *self.to3xyz())
 
     def toStr(self, prec=3, fmt='[%s]', sep=', '):  # PYCHOK expected
         '''String representation of this cartesion.
@@ -98,9 +205,8 @@ class _CartesianBase(Vector3d):
 class _LatLonHeightDatumBase(_LatLonHeightBase):
     '''Base class for ellipsoidal LatLon.
     '''
-    _datum = Datums.WGS84
-    _osgr  = None  # cache toOsgr
-    _utm   = None  # cache toUtm
+    __slots__ = ('_datum',
+                 'convergence', 'scale')  # set by Utm.toLatLon only
 
     def __init__(self, lat, lon, height=0, datum=None):
         '''Create an (ellipsoidal) LatLon point frome the given
@@ -118,14 +224,10 @@ class _LatLonHeightDatumBase(_LatLonHeightBase):
            p = LatLon(51.4778, -0.0016)  # height=0, datum=Datums.WGS84
         '''
         _LatLonHeightBase.__init__(self, lat, lon, height=height)
+        self._datum = Datums.WGS84
         if datum:
             self.datum = datum
 
-    def _update(self, updated):
-        if updated:  # reset caches
-            self._osgr = self._utm = None
-#           _LatLonHeightBase._update(self, updated)
-
     def convertDatum(self, toDatum):
         '''Converts this LatLon instance to new coordinate system.
 
@@ -139,19 +241,9 @@ class _LatLonHeightDatumBase(_LatLonHeightBase):
         '''
         if self.datum == toDatum:
             return self.copy()
-
-        elif self.datum == Datums.WGS84:
-            # converting from WGS 84
-            ll, t, i = self, toDatum.transform, False
-
-        elif toDatum == Datums.WGS84:
-            # converting to WGS84, use inverse transform
-            ll, t, i = self, self.datum.transform, True
-
-        else:  # neither self.datum nor toDatum is WGS84, convert to WGS84 first
-            ll, t, i = self.convertDatum(Datums.WGS84), toDatum.transform, False
-
-        return ll.toCartesian()._applyHelmert(t, i).toLatLon(datum=toDatum)
+        # if neither self.datum nor toDatum is WGS84, the
+        # transformer combines both Helmert transforms
+        return _transformer(self.datum, toDatum).convert(self)
 
     toDatum = convertDatum  # alternate name
 
@@ -185,8 +277,9 @@ class _LatLonHeightDatumBase(_LatLonHeightBase):
         E = datum.ellipsoid
         if not E.a > E.R > E.b:
             raise ValueError('%r not %s: %r' % ('datum', 'ellipsoidal', E))
-        self._update(datum != self._datum)
+        u = datum != self._datum
         self._datum = datum
+        self._update(u)
 
     def ellipsoid(self, datum=Datums.WGS84):
         '''Return the ellipsoid of this or the given datum.
@@ -262,11 +355,14 @@ class _LatLonHeightDatumBase(_LatLonHeightBase):
 
            @returns {Osgr} The OSGR coordinate.
         '''
-        if self._osgr is None:
-            from osgr import toOsgr  # PYCHOK recursive import
-            self._osgr = toOsgr(self, datum=self.datum)
-            self._osgr._latlon = self
-        return self._osgr
+        return self._cached('_osgr', self._toOsgr)
+
+    def _toOsgr(self):
+        from osgr import toOsgr  # PYCHOK recursive import
+        r = _latlonRef(self)
+        g = toOsgr(self, datum=r[4])
+        g._latlon = r
+        return g
 
     def toUtm(self):
         '''Convert this lat-/longitude to a UTM coordinate.
@@ -275,11 +371,119 @@ class _LatLonHeightDatumBase(_LatLonHeightBase):
 
            @returns {Utm} The UTM coordinate.
         '''
-        if self._utm is None:
-            from utm import toUtm  # PYCHOK recursive import
-            self._utm = toUtm(self, datum=self.datum)
-            self._utm._latlon = self
-        return self._utm
+        return self._cached('_utm', self._toUtm)
+
+    def _toUtm(self):
+        from utm import toUtm  # PYCHOK recursive import
+        r = _latlonRef(self)
+        u = toUtm(self, datum=r[4])
+        u._latlon = r
+        return u
+
+
+def to3llhs(xyzs, datum=Datums.WGS84):
+    '''Convert any number of (geocentric) x/y/z coordinates to
+       (ellipsoidal geodetic) lat-, longitude and height, using
+       Bowring's method as in method _CartesianBase.to3llh.
+
+       @param {(meter, meter, meter)[]} xyzs - Sequence or iterable
+                                               of 3-tuples (x, y, z).
+       @param {Datum} [datum=Datums.WGS84] - Datum to use.
+
+       @returns {(degrees90, degrees180, meter)[]} List of 3-tuples
+                                                   (lat, lon, height).
+
+       @example
+       llhs = to3llhs(((3980581, 97, 4966825), (0, 0, 6356752.3)))
+    '''
+    E = datum.ellipsoid
+    a, b, e2, e22 = E.a, E.b, E.e2, E.e22
+    ae2, be22 = a * e2, b * e22
+    d90, d180, e2s2 = degrees90, degrees180, E.e2s2
+
+    llhs = []
+    _llh = llhs.append
+    for x, y, z in xyzs:
+        p = hypot(x, y)  # distance from minor axis
+        r = hypot(p, z)  # polar radius
+
+        if min(p, r) > EPS2 and z:
+            # parametric latitude (Bowring eqn 17, replaced)
+            t = (b * z) / (a * p) * (1 + be22 / r)
+            s = t / hypot1(t)
+            c = s / t
+            # geodetic latitude (Bowring eqn 18)
+            t = atan2(z + be22 * s * s * s,
+                      p - ae2  * c * c * c)
+            # height above ellipsoid (Bowring eqn 7)
+            s = sin(t)
+            h = p * cos(t) + z * s - a * e2s2(s)
+            _llh((d90(t), d180(atan2(y, x)), h))
+
+        elif p > EPS2:  # latitude arbitrarily zero
+            _llh((0.0, d180(atan2(y, x)), p - a))
+        else:  # polar latitude, longitude arbitrarily zero
+            _llh((copysign(90.0, z), 0.0, abs(z) - b))
+    return llhs
+
+
+def to3xyzs(llhs, datum=Datums.WGS84):
+    '''Convert any number of (ellipsoidal geodetic) lat-, longitudes
+       and heights to (geocentric) x/y/z coordinates, using the radius
+       of curvature in the prime vertical as in method to3xyz of the
+       ellipsoidal LatLon classes.
+
+       @param {(degrees, degrees[, meter])[]} llhs - Sequence or iterable
+                                 of 2-tuples (lat, lon) or 3-tuples (lat,
+                                 lon, height).
+       @param {Datum} [datum=Datums.WGS84] - Datum to use.
+
+       @returns {(meter, meter, meter)[]} List of 3-tuples (x, y, z).
+
+       @example
+       xyzs = to3xyzs(((51.4778, -0.0016), (52.205, 0.119, 42)))
+    '''
+    E = datum.ellipsoid
+    a, e2, e12 = E.a, E.e2, E.e12
+
+    xyzs = []
+    _xyz = xyzs.append
+    for llh in llhs:
+        if len(llh) > 2:
+            lat, lon, h = llh
+        else:
+            (lat, lon), h = llh, 0
+        lat, lon = radians(lat), radians(lon)
+        ca, sa = cos(lat), sin(lat)
+        # radius of curvature in prime vertical
+        r = a / sqrt(1 - e2 * sa * sa)
+        c = (h + r) * ca
+        _xyz((c * cos(lon), c * sin(lon), (h + r * e12) * sa))
+    return xyzs
+
+
+if __name__ == '__main__':
+
+    from timeit import timeit
+
+    # benchmark the scalar to3llh and to3xyz against the
+    # array-level to3llhs and to3xyzs for n random points
+    from random import random, seed
+    seed(42)
+    n = 10000
+    llhs = [(random() * 180 - 90, random() * 360 - 180,
+             random() * 9000 - 1000) for _ in range(n)]
+    lls = [_LatLonHeightDatumBase(*llh) for llh in llhs]
+    xyzs = to3xyzs(llhs)
+    cs = [_CartesianBase(*xyz) for xyz in xyzs]
+
+    for t, f in (('to3xyz ', lambda: [ll.to3xyz() for ll in lls]),
+                 ('to3xyzs', lambda: to3xyzs(llhs)),
+                 ('to3llh ', lambda: [c.to3llh() for c in cs]),
+                 ('to3llhs', lambda: to3llhs(xyzs))):
+        s = timeit(f, number=10) / 10
+        print('%s: %.3f ms, %.3f us/point' % (t, s * 1e3, s * 1e6 / n))
+
 
 # **) MIT License
 #
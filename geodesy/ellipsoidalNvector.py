@@ -25,16 +25,22 @@ from vector3d import Vector3d
 from math import asin, atan2, cos, hypot, sin, sqrt
 
 # all public contants, classes and functions
-__all__ = ('Cartesian', 'LatLon', 'Ned', 'Nvector',  # classes
-           'meanOf', 'toNed')  # functions
-__version__ = '17.02.01'
+__all__ = ('Cartesian', 'LatLon', 'LocalFrame', 'Ned', 'Nvector',  # classes
+           'meanOf', 'toCartesians', 'toNed', 'toNvectors')  # functions
+__version__ = '17.02.07'
 
 
 class Cartesian(_CartesianBase):
     '''Extend with method to convert Cartesian to Nvector and
        Nvector-based LatLon.
     '''
-    _Nv = None  # cache Nvector
+    __slots__ = ('_Nv',)  # cache Nvector
+
+    def __init__(self, x, y, z):
+        '''See Vector3d.__init__.
+        '''
+        _CartesianBase.__init__(self, x, y, z)
+        self._Nv = None
 
     def toLatLon(self, datum=Datums.WGS84):  # PYCHOK XXX
         '''Converts this (geocentric) Cartesian (x/y/z) point to
@@ -58,7 +64,8 @@ class Cartesian(_CartesianBase):
            c = Cartesian(3980581, 97, 4966825)
            n = c.toNvector()  # (0.6228, 0.0, 0.7824, 0.0)
         '''
-        if self._Nv is None or datum != self._Nv.datum:
+        n = self._Nv
+        if n is None or datum != n.datum:
             E = datum.ellipsoid
             x, y, z = self.to3xyz()
 
@@ -81,8 +88,8 @@ class Cartesian(_CartesianBase):
             h = (k + E.e2 - 1) / k * t
 
             s = e / t
-            self._Nv = Nvector(x * s, y * s, z / t, h=h, datum=datum)
-        return self._Nv
+            self._Nv = n = Nvector(x * s, y * s, z / t, h=h, datum=datum)
+        return n
 
 
 class LatLon(_LatLonNvectorBase, _LatLonHeightDatumBase):
@@ -99,24 +106,20 @@ class LatLon(_LatLonNvectorBase, _LatLonHeightDatumBase):
        from ellipsoidalNvector import LatLon
        p = LatLon(52.205, 0.119)  # height=0, datum=Datums.WGS84
     '''
-    _Nv = None  # cache Nvector
-    _r3 = None  # cache _rotation3
+    __slots__ = ()
 
-    def _rotation3(self):
+    def _r3(self):
         # build rotation matrix from n-vector coordinate frame axes
-        if self._r3 is None:
-            nv = self.toNvector()  # local (n-vector) coordinate frame
+        nv = self.toNvector()  # local (n-vector) coordinate frame
 
-            d = nv.negate()  # down (opposite to n-vector)
-            e = NorthPole.cross(nv).unit()  # east (pointing perpendicular to the plane)
-            n = e.cross(d)  # north (by right hand rule)
+        d = nv.negate()  # down (opposite to n-vector)
+        e = NorthPole.cross(nv).unit()  # east (pointing perpendicular to the plane)
+        n = e.cross(d)  # north (by right hand rule)
 
-            self._r3 = n, e, d  # matrix rows
-        return self._r3
+        return n, e, d  # matrix rows
 
-    def _update(self, updated):
-        if updated:  # reset caches
-            self._Nv = self._r3 = None
+    def _rotation3(self):
+        return self._cached('_r3', self._r3)
 
 #     def bearingTo(self, other):
 #         '''Return the initial bearing (forward azimuth) from this
@@ -555,10 +558,11 @@ class LatLon(_LatLonNvectorBase, _LatLonHeightDatumBase):
            n = p.toNvector()
            n.toStr()  # [0.50000, 0.50000, 0.70710]
         '''
-        if self._Nv is None:
-            x, y, z, h = self.to4xyzh()  # nvector._LatLonNvectorBase
-            self._Nv = Nvector(x, y, z, h=h, datum=self.datum)
-        return self._Nv
+        return self._cached('_Nv', self._Nv)
+
+    def _Nv(self):
+        x, y, z, h = self.to4xyzh()  # nvector._LatLonNvectorBase
+        return Nvector(x, y, z, h=h, datum=self.datum)
 
 #     def toVector3d(self):
 #         '''Converts this point to a Vector3d (normal to earth's surface).
@@ -577,6 +581,152 @@ class LatLon(_LatLonNvectorBase, _LatLonHeightDatumBase):
 #         return self._v3d
 
 
+class LocalFrame(object):
+    '''Local tangent plane at an origin point, to convert any number
+       of (geocentric) cartesian x/y/z target coordinates to NED, ENU
+       or azimuth/elevation/range and back.
+
+       The origin's cartesian coordinates and rotation matrix are
+       computed once, results are plain tuples, not Ned or Cartesian
+       instances.  Targets must be on the datum of the origin, see
+       function to3xyzs in module ellipsoidalBase to convert points.
+    '''
+
+    def __init__(self, origin):
+        '''Create a local frame at an origin point.
+
+           @param {LatLon} origin - The origin of the local frame.
+
+           @throws {TypeError} Origin not an ellipsoidalNvector.LatLon.
+
+           @example
+           from ellipsoidalNvector import LatLon, LocalFrame
+           f = LocalFrame(LatLon(49.66618, 3.45063))
+           neds = f.toNeds(to3xyzs(((48.88667, 2.37472),)))  # [(-86126, -78900, 1069)]
+        '''
+        if not isinstance(origin, LatLon):
+            raise TypeError('%s not a %s.%s' % ('origin', LatLon.__module__, LatLon.__name__))
+
+        self.origin = origin
+        self.datum  = origin.datum
+
+        self._xyz = origin.to3xyz()
+        # rotation matrix rows, NED to ECEF matrix columns
+        self._ned3 = tuple(v.to3xyz() for v in origin._rotation3())
+        self._ecef3 = tuple(zip(*self._ned3))
+
+    def __str__(self):
+        return '%s(%s)' % (self.__class__.__name__, self.origin)
+
+    def fromAers(self, aers):
+        '''Convert any number of azimuth/elevation/range triples
+           to (geocentric) cartesian coordinates.
+
+           @param {(degrees, degrees, meter)[]} aers - Sequence or
+                            iterable of 3-tuples (azimuth, elevation,
+                            range), see function toNed.
+
+           @returns {(meter, meter, meter)[]} List of 3-tuples (x, y, z).
+        '''
+        def _neds(aers):
+            for a, e, r in aers:
+                a, e = radians(a), radians(e)
+                rce = r * cos(e)
+                yield cos(a) * rce, sin(a) * rce, -sin(e) * r
+
+        return self.fromNeds(_neds(aers))
+
+    def fromEnus(self, enus):
+        '''Convert any number of east/north/up deltas in this frame
+           to (geocentric) cartesian coordinates.
+
+           @param {(meter, meter, meter)[]} enus - Sequence or iterable
+                                    of 3-tuples (east, north, up).
+
+           @returns {(meter, meter, meter)[]} List of 3-tuples (x, y, z).
+        '''
+        return self.fromNeds((n, e, -u) for e, n, u in enus)
+
+    def fromNeds(self, neds):
+        '''Convert any number of north/east/down deltas in this frame
+           to (geocentric) cartesian coordinates, like method
+           LatLon.destinationNed.
+
+           @param {(meter, meter, meter)[]} neds - Sequence or iterable
+                                    of 3-tuples (north, east, down).
+
+           @returns {(meter, meter, meter)[]} List of 3-tuples (x, y, z).
+
+           @example
+           f = LocalFrame(LatLon(49.66618, 3.45063))
+           xyzs = f.fromNeds(((-86126, -78900, 1069),))
+           llhs = to3llhs(xyzs)  # [(48.88667, 2.37472, ...)]
+        '''
+        x0, y0, z0 = self._xyz
+        x, y, z = self._ecef3
+
+        xyzs = []
+        _xyz = xyzs.append
+        for dn in neds:
+            _xyz((x0 + fdot(dn, *x),
+                  y0 + fdot(dn, *y),
+                  z0 + fdot(dn, *z)))
+        return xyzs
+
+    def toAers(self, xyzs):
+        '''Convert any number of (geocentric) cartesian coordinates
+           to azimuth, elevation and range from the origin.
+
+           @param {(meter, meter, meter)[]} xyzs - Sequence or iterable
+                                    of 3-tuples (x, y, z).
+
+           @returns {(degrees360, degrees90, meter)[]} List of 3-tuples
+                                    (azimuth, elevation, range), like
+                                    Ned properties bearing, elevation
+                                    and length.
+        '''
+        aers = []
+        _aer = aers.append
+        for n, e, d in self.toNeds(xyzs):
+            r = hypot3(n, e, d)
+            a = degrees360(atan2(e, n))
+            _aer((a, -degrees90(asin(d / r)) if r > EPS else 0.0, r))
+        return aers
+
+    def toEnus(self, xyzs):
+        '''Convert any number of (geocentric) cartesian coordinates
+           to east/north/up deltas in this frame.
+
+           @param {(meter, meter, meter)[]} xyzs - Sequence or iterable
+                                    of 3-tuples (x, y, z).
+
+           @returns {(meter, meter, meter)[]} List of 3-tuples (east,
+                                              north, up).
+        '''
+        return [(e, n, -d) for n, e, d in self.toNeds(xyzs)]
+
+    def toNeds(self, xyzs):
+        '''Convert any number of (geocentric) cartesian coordinates
+           to north/east/down deltas in this frame, like method
+           LatLon.deltaTo.
+
+           @param {(meter, meter, meter)[]} xyzs - Sequence or iterable
+                                    of 3-tuples (x, y, z).
+
+           @returns {(meter, meter, meter)[]} List of 3-tuples (north,
+                                              east, down).
+        '''
+        x0, y0, z0 = self._xyz
+        n, e, d = self._ned3
+
+        neds = []
+        _ned = neds.append
+        for x, y, z in xyzs:
+            dc = x - x0, y - y0, z - z0
+            _ned((fdot(dc, *n), fdot(dc, *e), fdot(dc, *d)))
+        return neds
+
+
 class Ned(object):
     '''North-Eeast-Down (NED), also known as Local Tangent Plane (LTP),
        is a vector in the local coordinate frame of a body.
@@ -690,7 +840,7 @@ class Nvector(_NvectorBase):
 
        Note commonality with sphericalNvector.Nvector.
     '''
-    datum = Datums.WGS84
+    __slots__ = ('datum',)
 
     def __init__(self, x, y, z, h=0, datum=None):
         '''Create a 3d n-vector normal to the earth's surface.
@@ -707,8 +857,7 @@ class Nvector(_NvectorBase):
            v.toLatLon()  # 45.0000°N, 045.0000°E, +1.00m
         '''
         _NvectorBase.__init__(self, x, y, z, h)
-        if datum and datum is not Nvector.datum:
-            self.datum = datum
+        self.datum = datum or Datums.WGS84
 
     def copy(self):
         '''Copy this vector.
@@ -778,6 +927,39 @@ def meanOf(points, datum=Datums.WGS84):
     return LatLon(a, b, height=h, datum=datum)
 
 
+def toCartesians(nvectors, datum=Datums.WGS84):
+    '''Convert any number of n-vectors to (geocentric) cartesian
+       x/y/z coordinates, like method Nvector.toCartesian but without
+       creating Nvector or Cartesian instances.
+
+       @param {(number, number, number[, meter])[]|Vector3dArray} nvectors -
+                         Sequence or iterable of 3-tuples (x, y, z) or
+                         4-tuples (x, y, z, h) of n-vector components
+                         and height.
+       @param {Datum} [datum=Datums.WGS84] - Datum to use.
+
+       @returns {(meter, meter, meter)[]} List of 3-tuples (x, y, z).
+
+       @example
+       xyzs = toCartesians(((0.5, 0.5, 0.7071), (0.6228, 0, 0.7824, 10)))
+    '''
+    E = datum.ellipsoid
+    a2b2, b = E.a2b2, E.b
+
+    xyzs = []
+    _xyz = xyzs.append
+    for n in nvectors:
+        if len(n) > 3:
+            x, y, z, h = n
+        else:
+            (x, y, z), h = n, 0
+        # Kenneth Gade eqn (22)
+        n = b / sqrt(z * z + (x * x + y * y) * a2b2)
+        r = a2b2 * n + h
+        _xyz((x * r, y * r, z * (n + h)))
+    return xyzs
+
+
 def toNed(distance, bearing, elevation):
     '''Create an NED vector from distance, bearing and elevation
        (in local coordinate system).
@@ -804,6 +986,89 @@ def toNed(distance, bearing, elevation):
 
 fromDistanceBearingElevation = toNed  # XXX original name
 
+
+def toNvectors(xyzs, datum=Datums.WGS84):
+    '''Convert any number of (geocentric) cartesian x/y/z coordinates
+       to n-vectors and heights, like method Cartesian.toNvector but
+       without creating Cartesian or Nvector instances.
+
+       @param {(meter, meter, meter)[]|Vector3dArray} xyzs - Sequence
+                         or iterable of 3-tuples (x, y, z).
+       @param {Datum} [datum=Datums.WGS84] - Datum to use.
+
+       @returns {(number, number, number, meter)[]} List of 4-tuples
+                         (x, y, z, h) of n-vector components and height.
+
+       @example
+       nvs = toNvectors(((3980581, 97, 4966825), (3194434, 3194434, 4487327)))
+    '''
+    E = datum.ellipsoid
+    a2, e2, e4, e12 = E.a2, E.e2, E.e4, E.e12
+    _cbrt = cbrt
+
+    nvs = []
+    _nv = nvs.append
+    for x, y, z in xyzs:
+        # Kenneth Gade eqn 23
+        p = (x * x + y * y) * a2
+        q = (z * z * e12) * a2
+        r = (p + q - e4) / 6
+        s = (p * q * e4) / (4 * r * r * r)
+        t = _cbrt(1 + s + sqrt(s * (2 + s)))
+
+        u = r * (1 + t + 1 / t)
+        v = sqrt(u * u + e4 * q)
+        w = e2 * (u + v - q) / (2 * v)
+
+        k = sqrt(u + v + w * w) - w
+        e = k / (k + e2)
+        d = e * hypot(x, y)
+
+        t = hypot(d, z)
+        h = (k + e2 - 1) / k * t
+
+        s = e / t
+        _nv((x * s, y * s, z / t, h))
+    return nvs
+
+
+if __name__ == '__main__':
+
+    from timeit import timeit
+
+    # benchmark the scalar Cartesian.toNvector and Nvector.toCartesian
+    # against the array-level toNvectors and toCartesians for n points
+    from random import random, seed
+    seed(42)
+    n = 10000
+    cs = [LatLon(random() * 180 - 90, random() * 360 - 180,
+                 random() * 9000 - 1000).toCartesian() for _ in range(n)]
+    xyzs = [c.to3xyz() for c in cs]
+    nvs = toNvectors(xyzs)
+    ns = [Nvector(*nv) for nv in nvs]
+
+    def _toNvector():
+        for c in cs:
+            c._Nv = None  # clear cache
+            c.toNvector()
+
+    for t, f in (('toNvector   ', _toNvector),
+                 ('toNvectors  ', lambda: toNvectors(xyzs)),
+                 ('toCartesian ', lambda: [n.toCartesian() for n in ns]),
+                 ('toCartesians', lambda: toCartesians(nvs))):
+        s = timeit(f, number=10) / 10
+        print('%s: %.3f ms, %.3f us/point' % (t, s * 1e3, s * 1e6 / n))
+
+    # benchmark LatLon.deltaTo against LocalFrame.toNeds
+    o = LatLon(49.66618, 3.45063)
+    lf = LocalFrame(o)
+    lls = [c.toLatLon() for c in cs]
+
+    for t, f in (('deltaTo     ', lambda: [o.deltaTo(ll) for ll in lls]),
+                 ('toNeds      ', lambda: lf.toNeds(xyzs))):
+        s = timeit(f, number=10) / 10
+        print('%s: %.3f ms, %.3f us/point' % (t, s * 1e3, s * 1e6 / n))
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1@Gmail.com
@@ -51,7 +51,7 @@ from math import atan2, cos, hypot, sin, tan
 
 # all public contants, classes and functions
 __all__ = ('Cartesian', 'LatLon', 'VincentyError')  # classes
-__version__ = '17.02.01'
+__version__ = '17.02.07'
 
 
 class VincentyError(Exception):
@@ -65,6 +65,8 @@ class Cartesian(_CartesianBase):
     '''Extend with method to convert Cartesian to
        Vincenty-based LatLon.
     '''
+    __slots__ = ()
+
     def toLatLon(self, datum=Datums.WGS84):  # PYCHOK XXX
         '''Converts this (geocentric) Cartesian (x/y/z) point to
            (ellipsoidal geodetic) LatLon point on the specified datum.
@@ -93,8 +95,14 @@ class LatLon(_LatLonHeightDatumBase):
        and/or the iteration limit, see LatLon properties epsilon and
        iterations.
     '''
-    _epsilon    = 1.0e-12  # about 0.006 mm
-    _iterations = 50
+    __slots__ = ('_epsilon', '_iterations')
+
+    def __init__(self, lat, lon, height=0, datum=None):
+        '''See _LatLonHeightDatumBase.__init__.
+        '''
+        _LatLonHeightDatumBase.__init__(self, lat, lon, height=height, datum=datum)
+        self._epsilon    = 1.0e-12  # about 0.006 mm
+        self._iterations = 50
 
     def copy(self):
         '''Return a copy of this point.
@@ -8,20 +8,20 @@
 
 from bases import _LatLonHeightBase
 from utils import fsum, len2
-from vector3d import Vector3d, sumOf as _sumOf
+from vector3d import Vector3d, Vector3dArray, sumOf as _sumOf
 # from math import cos, sin
 
 # all public constants, classes and functions
 __all__ = ('NorthPole', 'SouthPole',  # constants
            'Nvector',  # classes
            'sumOf')  # functions
-__version__ = '17.02.01'
+__version__ = '17.02.07'
 
 
 class Nvector(Vector3d):  # XXX kept private
     '''Base class for ellipsoidal and spherical Nvector.
     '''
-    _h = 0
+    __slots__ = ('_h',)
 
     H = ''  # or '↑' XXX
 
@@ -39,8 +39,7 @@ class Nvector(Vector3d):  # XXX kept private
            v.toLatLon()  # 45.0°N, 045.0°E, +1.00m
         '''
         Vector3d.__init__(self, x, y, z)
-        if h:
-            self._h = float(h)
+        self._h = float(h) if h else 0
 
     def copy(self):
         '''Copy this vector.
@@ -122,6 +121,7 @@ SouthPole = Nvector(0, 0, -1)
 class _LatLonNvectorBase(_LatLonHeightBase):
     '''Base class for n-vector-based ellipsoidal and spherical LatLon.
     '''
+    __slots__ = ()
 
     def others(self, other, name='other'):
         '''Refine class comparison.
@@ -149,7 +149,8 @@ class _LatLonNvectorBase(_LatLonHeightBase):
 def sumOf(nvectors, Vector=Nvector, **kwds):
     '''Return the vectorial sum of any number of n-vectors.
 
-       @param {Nvector[]} nvectors - The n-vectors to be added.
+       @param {Nvector[]|Vector3dArray} nvectors - The n-vectors
+                                                   to be added.
        @param {Nvector} Vector - Vector class to instantiate.
        @param kwds - Optional, additional Vector keyword arguments.
 
@@ -157,6 +158,8 @@ def sumOf(nvectors, Vector=Nvector, **kwds):
 
        @throws {ValueError} No nvectors.
     '''
+    if isinstance(nvectors, Vector3dArray):  # no heights
+        return _sumOf(nvectors, Vector=Vector, **kwds)
     n, nvectors = len2(nvectors)
     if n < 1:
         raise ValueError('no nvectors: %r' & (n,))
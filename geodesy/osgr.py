@@ -8,7 +8,7 @@
 # and <http://www.movable-type.co.uk/scripts/geodesy/docs/module-osgridref.html>
 
 from math import cos, sin, sqrt, tan
-from bases import _Base
+from bases import _Base, _latlonOf, _latlonRef
 from datum import Datums
 from utils import degrees90, degrees180, false2f, fdot, \
                   halfs, isscalar, radians
@@ -59,7 +59,7 @@ class Osgr(_Base):
     '''
     _datum    = _OSGB36
     _easting  = 0
-    _latlon   = None  # also set by ellipsoidalBase._LatLonHeightDatumBase.toUtm.
+    _latlon   = None  # also set by ellipsoidalBase._LatLonHeightDatumBase.toOsgr.
     _northing = 0
 
     def __init__(self, easting, northing):
@@ -120,9 +120,9 @@ class Osgr(_Base):
            # to obtain (historical) OSGB36 lat-/longitude point
            p = g.toLatLon(ev.LatLon, datum=Datums.OSGB36)  # 52°39′27.253″N, 001°43′04.518″E
         '''
-        if self._latlon and self._latlon.__class__ is LatLon \
-                        and self._latlon.datum == datum:
-            return self._latlon  # set below
+        ll = _latlonOf(self._latlon, LatLon, datum)
+        if ll is not None:
+            return ll  # set below
 
         if not hasattr(LatLon, 'convertDatum'):
             raise TypeError('%s not ellipsoidal: %r' % ('LatLon', LatLon))
@@ -181,7 +181,7 @@ class Osgr(_Base):
             ll = ll.convertDatum(datum)
             ll = LatLon(ll.lat, ll.lon, datum=datum)
 
-        self._latlon = ll
+        self._latlon = _latlonRef(ll)
         return ll
 
     def toStr(self, prec=10, sep=' '):  # PYCHOK expected
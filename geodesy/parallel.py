@@ -0,0 +1,316 @@
+
+# -*- coding: utf-8 -*-
+
+# Parallel execution of per-point conversions and of batch functions
+# on a pool of processes, for large numbers of points.
+
+# The input is split into chunks, each chunk is converted by a pool
+# process and the results are reassembled in input order.  Batches
+# of floats are exchanged through shared memory, on Python 3.8+, to
+# avoid pickling the input and output records.  Small inputs and a
+# single process are converted serially, in the calling process.
+
+from array import array
+from collections import deque
+from itertools import chain, islice
+
+# all public contants, classes and functions
+__all__ = ('parallelBatch', 'parallelMap')  # functions
+__version__ = '17.02.07'
+
+_shared = {}  # per pool process, see _attach
+
+
+class _Method(object):
+    '''(INTERNAL) Picklable callable, invoking a method by name.
+    '''
+    __slots__ = ('_args', '_name')
+
+    def __init__(self, name, args):
+        self._args = tuple(args)
+        self._name = name
+
+    def __call__(self, item):
+        return getattr(item, self._name)(*self._args)
+
+    def __getstate__(self):
+        return self._name, self._args
+
+    def __setstate__(self, state):
+        self._name, self._args = state
+
+
+class _Partial(_Method):
+    '''(INTERNAL) Picklable callable, invoking a function with
+       the item and any additional arguments.
+    '''
+    __slots__ = ()
+
+    def __call__(self, item):
+        return self._name(item, *self._args)
+
+
+def _attach(func, args, names, w, ow):
+    # attach a pool process to the shared input and output memory
+    from multiprocessing.shared_memory import SharedMemory  # PYCHOK expected
+
+    i, o = [SharedMemory(name=n) for n in names]
+    _shared.update(func=func, args=args, w=w, ow=ow, shms=(i, o),
+                   i=i.buf.cast('d'), o=o.buf.cast('d'))
+
+
+def _batchChunk(start_end):
+    # convert one chunk of records in shared memory
+    s, e = start_end
+    w, ow = _shared['w'], _shared['ow']
+    i = _shared['i']
+    rs = _shared['func'](list(zip(*[i[s * w + j:e * w:w].tolist()
+                                    for j in range(w)])), *_shared['args'])
+    _shared['o'][s * ow:e * ow] = _floats(rs, e - s, ow)
+    return e - s
+
+
+def _chunks(items, chunk):
+    # split items into lists of chunk items
+    items = iter(items)
+    while True:
+        c = list(islice(items, chunk))
+        if not c:
+            break
+        yield c
+
+
+def _floats(records, n, width):
+    # flatten n records of width floats
+    fs = array('d', chain.from_iterable(records))
+    if len(fs) != n * width:
+        raise ValueError('%s mismatch: %s vs %s' % ('records', len(fs), n * width))
+    return fs
+
+
+def _mapChunk(func_items):
+    # convert one chunk of items, pickled
+    func, items = func_items
+    return [func(i) for i in items]
+
+
+def _pooled(func, tasks, processes, initializer=None, initargs=()):
+    # run func for each task on a process pool, yielding the results
+    # in order and keeping at most 2 tasks per process queued at any
+    # time, each pool process initialized by initializer(*initargs)
+    from multiprocessing import Pool  # PYCHOK expected
+
+    p = Pool(processes, initializer, initargs)
+    try:
+        q = deque()
+        for t in tasks:
+            q.append(p.apply_async(func, (t,)))
+            if len(q) > 2 * processes:
+                yield q.popleft().get()
+        while q:
+            yield q.popleft().get()
+        p.close()
+    finally:
+        p.terminate()
+        p.join()
+
+
+def _processes(processes):
+    # number of pool processes, by default one per CPU
+    if processes is None:
+        from multiprocessing import cpu_count  # PYCHOK expected
+        try:
+            processes = cpu_count()
+        except NotImplementedError:
+            processes = 1
+    return processes
+
+
+def _sizes(n, chunk, processes):
+    # chunk size, by default about 4 chunks per process
+    return chunk or max(1, -(-n // (processes * 4)))
+
+
+def parallelBatch(func, records, args=(), chunk=None, processes=None, serial=10000):
+    '''Apply a batch function to a large number of records of floats,
+       in parallel on a pool of processes, using shared memory for the
+       input and output records, if available.
+
+       @param {function} func - Batch function, called with a list of
+                                records and any args and returning a
+                                list of records of floats, like to3xyzs
+                                or to3llhs.  Must be picklable, a module
+                                level function.
+       @param {tuple[]|PackedPoints} records - Sequence of records of
+                                               floats, each the same length.
+       @param {tuple} [args=()] - Additional arguments for func, each
+                                  picklable, like a registered Datum.
+       @param {int} [chunk=None] - Number of records per chunk or None
+                                   for about 4 chunks per process.
+       @param {int} [processes=None] - Number of pool processes or None
+                                       for the number of CPUs.
+       @param {int} [serial=10000] - Apply func serially in this process
+                                     for fewer records.
+
+       @returns {tuple[]} List of output records, in input order.
+
+       @throws {ValueError} Mismatch in number or length of records.
+
+       @example
+       xyzs = parallelBatch(to3xyzs, llhs, args=(Datums.OSGB36,), processes=4)
+    '''
+    n = len(records)
+    processes = _processes(processes)
+    if n < serial or processes < 2:
+        return func(records, *args)
+
+    try:
+        from multiprocessing.shared_memory import SharedMemory  # PYCHOK expected
+    except ImportError:  # Python 3.7-, pickle the records
+        f = _Partial(func, args)
+        rs = []
+        for r in _pooled(f, _chunks(records, _sizes(n, chunk, processes)), processes):
+            rs.extend(r)
+        if len(rs) != n:
+            raise ValueError('%s mismatch: %s vs %s' % ('records', len(rs), n))
+        return rs
+
+    # the record lengths of the input and of the output
+    w = len(getattr(records, 'fields', None) or records[0])
+    ow = len(func(records[:1], *args)[0])
+    chunk = _sizes(n, chunk, processes)
+
+    i = SharedMemory(create=True, size=n * w * 8)
+    o = SharedMemory(create=True, size=n * ow * 8)
+    vi = vo = None
+    try:
+        vi, vo = i.buf.cast('d'), o.buf.cast('d')
+        if getattr(records, 'typecode', '') == 'd':  # PackedPoints
+            vi[:] = records.floats
+        else:
+            for s in range(0, n, chunk):
+                e = min(s + chunk, n)
+                vi[s * w:e * w] = _floats(records[s:e], e - s, w)
+
+        tasks = ((s, min(s + chunk, n)) for s in range(0, n, chunk))
+        for _ in _pooled(_batchChunk, tasks, processes,
+                         _attach, (func, args, (i.name, o.name), w, ow)):
+            pass
+
+        return list(zip(*[vo[j::ow].tolist() for j in range(ow)]))
+    finally:
+        for v in (vi, vo):
+            if v is not None:
+                v.release()
+        for m in (i, o):
+            m.close()
+            m.unlink()
+
+
+def parallelMap(func, items, args=(), chunk=None, processes=None, serial=10000):
+    '''Convert a large number of items, in parallel on a pool of
+       processes, like the builtin map.
+
+       @param {string|function} func - Name of the method to invoke
+                                       for each item, like 'toUtm' or
+                                       'convertDatum' or a picklable,
+                                       module level function, called
+                                       with each item and any args.
+       @param {object[]} items - Sequence or iterable of picklable
+                                 items, like LatLon, Utm or Osgr.
+       @param {tuple} [args=()] - Additional arguments for the method
+                                  or function, each picklable.
+       @param {int} [chunk=None] - Number of items per chunk or None
+                                   for about 4 chunks per process.
+       @param {int} [processes=None] - Number of pool processes or None
+                                       for the number of CPUs.
+       @param {int} [serial=10000] - Convert serially in this process
+                                     for fewer items.
+
+       @returns {object[]} List of converted items, in input order.
+
+       @example
+       utms = parallelMap('toUtm', latlons, processes=4)
+       lls = parallelMap('convertDatum', latlons, args=(Datums.OSGB36,))
+       ds = parallelMap(distance, latlons, args=(LatLon(51.5, 0),))
+    '''
+    if isinstance(func, str):
+        f = _Method(func, args)
+    elif args:
+        f = _Partial(func, args)
+    else:
+        f = func
+    if not hasattr(items, '__len__'):
+        items = list(items)
+
+    n = len(items)
+    processes = _processes(processes)
+    if n < serial or processes < 2:
+        return [f(i) for i in items]
+
+    tasks = ((f, c) for c in _chunks(items, _sizes(n, chunk, processes)))
+    rs = []
+    for r in _pooled(_mapChunk, tasks, processes):
+        rs.extend(r)
+    return rs
+
+
+if __name__ == '__main__':
+
+    from time import time
+
+    # use the functions of the imported module, not this
+    # __main__ copy, to allow pickling for pool processes
+    from parallel import parallelBatch, parallelMap  # PYCHOK expected
+    from datum import Datums
+    from ellipsoidalBase import to3xyzs
+    from ellipsoidalVincenty import LatLon
+
+    n = 200000
+    llhs = [(-60 + (i % 1200) * 0.1, -170 + (i % 3400) * 0.1, i % 100)
+            for i in range(n)]
+    for p in (1, 2, 4):
+        t = time()
+        parallelBatch(to3xyzs, llhs, args=(Datums.OSGB36,), processes=p)
+        t = time() - t
+        print('parallelBatch %d to3xyzs, %d processes: %.2f sec' % (n, p, t))
+
+    n //= 4
+    lls = LatLon.fromArrays([ll[0] for ll in llhs[:n]], [ll[1] for ll in llhs[:n]])
+    for p in (1, 2, 4):
+        t = time()
+        parallelMap('toUtm', lls, processes=p)
+        t = time() - t
+        print('parallelMap %d toUtm, %d processes: %.2f sec' % (n, p, t))
+
+    # Typical result (on Python 3.11.7 64bit, with a single CPU,
+    # showing the pool overhead, which more CPUs amortize):
+
+    # parallelBatch 200000 to3xyzs, 1 processes: 0.16 sec
+    # parallelBatch 200000 to3xyzs, 2 processes: 0.50 sec
+    # parallelBatch 200000 to3xyzs, 4 processes: 0.53 sec
+    # parallelMap 50000 toUtm, 1 processes: 1.05 sec
+    # parallelMap 50000 toUtm, 2 processes: 1.79 sec
+    # parallelMap 50000 toUtm, 4 processes: 2.05 sec
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1@Gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
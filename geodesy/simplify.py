@@ -0,0 +1,296 @@
+
+# -*- coding: utf-8 -*-
+
+# Simplification of polylines on a spherical earth model, like GPS
+# tracks, by the Ramer-Douglas-Peucker and the Visvalingam-Whyatt
+# algorithms and for unbounded tracks by an opening window.
+
+# All vertices are converted to n-vectors once.  The distance from
+# each vertex to a segment is the cross-track distance, abeam the
+# segment, otherwise the distance to the nearest segment end, see
+# also module sphericalRoute.  Douglas-Peucker uses an explicit stack,
+# not recursion, and Visvalingam-Whyatt a heap of triangle areas.
+
+from datum import R_M
+from sphericalPolygon import _2ll, _cross, _dot, _xyz
+from utils import EPS, len2
+from math import atan2, sin, sqrt
+from heapq import heapify, heappop, heappush
+
+# all public contants, classes and functions
+__all__ = ('simplifyDP', 'simplifyStream', 'simplifyVW')  # functions
+__version__ = '17.02.07'
+
+
+def _chord2s(ws, v1, v2):
+    # return the chord length squared, on a unit sphere, of the
+    # distance from each n-vector of ws to the segment v1 to v2
+    (x1, y1, z1), (x2, y2, z2) = v1, v2
+    g = _cross(v1, v2)
+    s = sqrt(_dot(g, g))
+    if s < EPS:  # coincident or antipodal ends
+        return [(x - x1)**2 + (y - y1)**2 + (z - z1)**2 for x, y, z in ws]
+
+    gx, gy, gz = g = g[0] / s, g[1] / s, g[2] / s
+    (ax, ay, az), (bx, by, bz) = _cross(g, v1), _cross(g, v2)
+    # abeam the segment, the chord for sin(crossTrack) is
+    # 2 * (1 - cos) or 2 * sin**2 / (1 + cos), otherwise
+    # the chord to the nearest segment end
+    return [_2s2(gx * x + gy * y + gz * z)
+            if (ax * x + ay * y + az * z) >= 0 and
+               (bx * x + by * y + bz * z) <= 0 else
+            min((x - x1)**2 + (y - y1)**2 + (z - z1)**2,
+                (x - x2)**2 + (y - y2)**2 + (z - z2)**2)
+            for x, y, z in ws]
+
+
+def _chord2(tolerance, radius):
+    # return the tolerance as chord length squared
+    if not 0 <= tolerance < radius:
+        raise ValueError('%s invalid: %r' % ('tolerance', tolerance))
+    return (sin(tolerance / float(radius) * 0.5) * 2)**2
+
+
+def _excess(v1, v2, v3):
+    # return the spherical excess of a triangle of n-vectors
+    t = abs(_dot(v1, _cross(v2, v3)))
+    return atan2(t, 1 + _dot(v1, v2) + _dot(v2, v3) + _dot(v3, v1)) * 2
+
+
+def _2s2(s):
+    # chord length squared for sin
+    s *= s
+    return s * 2 / (1 + sqrt(max(0.0, 1 - s)))
+
+
+def _result(ps, ks, indices):
+    # return the kept points or indices
+    return ks if indices else [ps[i] for i in ks]
+
+
+def simplifyDP(points, tolerance, radius=R_M, indices=False):
+    '''Simplify a polyline by the Ramer-Douglas-Peucker algorithm,
+       keeping the vertices farther than the tolerance from the
+       simplified polyline.
+
+       @param {LatLon[]|(degrees, degrees)[]} points - Ordered
+                      sequence of LatLon or (lat, lon) vertices.
+       @param {number} tolerance - Maximum distance, in the units
+                                   of radius.
+       @param {number} [radius=R_M] - Mean radius of earth, defaults
+                                      to meter.
+       @param {bool} [indices=False] - Return indices, not points.
+
+       @returns {list} The kept points, including the first and the
+                       last, or their indices.
+
+       @throws {ValueError} Invalid tolerance.
+
+       @example
+       t = simplifyDP(track, 5)  # within 5 meter
+    '''
+    c = _chord2(tolerance, radius)
+    n, ps = len2(points)
+    if n < 3:
+        return _result(ps, list(range(n)), indices)
+
+    vs = [_xyz(*_2ll(p)) for p in ps]
+    ks = [False] * n
+    ks[0] = ks[-1] = True
+    se = [(0, n - 1)]  # explicit stack
+    while se:
+        s, e = se.pop()
+        if e - s > 1:
+            ds = _chord2s(vs[s + 1:e], vs[s], vs[e])
+            d = max(ds)
+            if d > c:  # split at the farthest vertex
+                k = s + 1 + ds.index(d)
+                ks[k] = True
+                se.append((k, e))
+                se.append((s, k))
+    return _result(ps, [i for i in range(n) if ks[i]], indices)
+
+
+def simplifyStream(points, tolerance, radius=R_M, window=64):
+    '''Simplify an unbounded polyline by an opening window, keeping
+       a vertex whenever the segment from the last kept vertex to the
+       next one passes farther than the tolerance from any vertex in
+       between.
+
+       Unlike function simplifyDP, only the vertices since the last
+       kept one are held, at most window many.
+
+       @param {LatLon[]|(degrees, degrees)[]} points - Iterable of
+                      LatLon or (lat, lon) vertices, any stream.
+       @param {number} tolerance - Maximum distance, in the units
+                                   of radius.
+       @param {number} [radius=R_M] - Mean radius of earth, defaults
+                                      to meter.
+       @param {int} [window=64] - Maximum number of vertices held,
+                                  each new vertex takes O(window).
+
+       @returns {iterator} Generating the kept points, including the
+                           first and the last.
+
+       @throws {ValueError} Invalid tolerance or window.
+
+       @example
+       for p in simplifyStream(gps, 5):  # within 5 meter
+           out.write(p)
+    '''
+    c = _chord2(tolerance, radius)
+    if window < 2:
+        raise ValueError('%s invalid: %r' % ('window', window))
+
+    v0, vs, ps = None, [], []  # last kept, held vectors and points
+    for p in points:
+        v = _xyz(*_2ll(p))
+        if v0 is None:
+            v0 = v
+            yield p
+        elif len(vs) < window and max(_chord2s(vs, v0, v) or (0,)) <= c:
+            vs.append(v)
+            ps.append(p)
+        else:  # keep the previous vertex
+            v0 = vs[-1]
+            yield ps[-1]
+            vs, ps = [v], [p]
+    if ps:
+        yield ps[-1]
+
+
+def simplifyVW(points, area, radius=R_M, indices=False):
+    '''Simplify a polyline by the Visvalingam-Whyatt algorithm,
+       removing the vertex with the smallest triangle area until
+       all remaining triangles are at least the given area.
+
+       @param {LatLon[]|(degrees, degrees)[]} points - Ordered
+                      sequence of LatLon or (lat, lon) vertices.
+       @param {number} area - Minimum triangle area, in the units
+                              of radius squared.
+       @param {number} [radius=R_M] - Mean radius of earth, defaults
+                                      to meter.
+       @param {bool} [indices=False] - Return indices, not points.
+
+       @returns {list} The kept points, including the first and the
+                       last, or their indices.
+
+       @throws {ValueError} Invalid area.
+
+       @example
+       t = simplifyVW(track, 50)  # 50 meter squared
+    '''
+    r2 = float(radius)**2
+    if area < 0:
+        raise ValueError('%s invalid: %r' % ('area', area))
+    n, ps = len2(points)
+    if n < 3:
+        return _result(ps, list(range(n)), indices)
+
+    E = area / r2  # as spherical excess
+    vs = [_xyz(*_2ll(p)) for p in ps]
+    ps_ = list(range(-1, n - 1))  # previous and
+    ns_ = list(range(1, n + 1))  # next vertex
+    es = [None] * n  # current excess by vertex
+    h = []
+    for i in range(1, n - 1):
+        es[i] = e = _excess(vs[i - 1], vs[i], vs[i + 1])
+        h.append((e, i))
+    heapify(h)
+
+    while h:
+        e, i = heappop(h)
+        if e != es[i]:  # outdated
+            continue
+        if e >= E:
+            break
+        # remove vertex i, update its neighbours, each at
+        # least the removed excess, keeping areas monotonic
+        es[i] = None
+        a, b = ps_[i], ns_[i]
+        ns_[a], ps_[b] = b, a
+        for j in (a, b):
+            if 0 < j < n - 1:
+                es[j] = t = max(e, _excess(vs[ps_[j]], vs[j], vs[ns_[j]]))
+                heappush(h, (t, j))
+
+    ks, i = [], 0
+    while i < n:
+        ks.append(i)
+        i = ns_[i]
+    return _result(ps, ks, indices)
+
+
+if __name__ == '__main__':
+
+    from math import cos
+    from random import gauss, seed
+    from time import time
+    from sphericalTrigonometry import LatLon
+
+    seed(42)
+    n = 100000  # noisy track of about 1 meter steps
+    a, b, lls = 52.0, 0.0, []
+    for i in range(n):
+        a += 1e-5 + gauss(0, 2e-6)
+        b += 1e-5 * cos(i * 1e-3) + gauss(0, 2e-6)
+        lls.append((a, b))
+
+    for f, t in ((simplifyDP, 5), (simplifyVW, 50), (simplifyStream, 5)):
+        s = time()
+        k = len(list(f(lls, t)))
+        s = time() - s
+        print('%s %d points, %d kept: %.3f sec, %.2f usec/point' % (f.__name__, n, k, s, s * 1e6 / n))
+
+    def _dp(ps, s, e, tolerance, ks):
+        # recursive Douglas-Peucker with LatLon methods
+        d, k = max((abs(ps[i].crossTrackDistanceTo(ps[s], ps[e])), i) for i in range(s + 1, e))
+        if d > tolerance:
+            ks.add(k)
+            if k - s > 1:
+                _dp(ps, s, k, tolerance, ks)
+            if e - k > 1:
+                _dp(ps, k, e, tolerance, ks)
+
+    m = n // 10
+    s = time()
+    k = len(simplifyDP(lls[:m], 5))
+    s = time() - s
+    print('%s %d points, %d kept: %.3f sec, %.2f usec/point' % ('simplifyDP', m, k, s, s * 1e6 / m))
+
+    ps = [LatLon(*ll) for ll in lls[:m]]
+    s = time()
+    ks = set((0, m - 1))
+    _dp(ps, 0, m - 1, 5, ks)
+    s = time() - s
+    print('%s %d points, %d kept: %.3f sec, %.2f usec/point' % ('crossTrackDistanceTo', m, len(ks), s, s * 1e6 / m))
+
+    # Typical result (on Python 3.11.7 64bit):
+
+    # simplifyDP 100000 points, 426 kept: 2.609 sec, 26.09 usec/point
+    # simplifyVW 100000 points, 1556 kept: 2.407 sec, 24.07 usec/point
+    # simplifyStream 100000 points, 1564 kept: 4.138 sec, 41.38 usec/point
+    # simplifyDP 10000 points, 40 kept: 0.101 sec, 10.06 usec/point
+    # crossTrackDistanceTo 10000 points, 40 kept: 0.524 sec, 52.45 usec/point
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1@Gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
@@ -16,7 +16,7 @@ from math import acos, atan2, cos, hypot, log, sin
 
 # all public contants, classes and functions
 __all__ = ()  # classes
-__version__ = '16.11.11'
+__version__ = '17.02.07'
 
 
 class _LatLonSphericalBase(_LatLonHeightBase):
@@ -24,8 +24,13 @@ class _LatLonSphericalBase(_LatLonHeightBase):
        sphericalNvector and -Trig flavors.  Otherwise, such
        methods would have to be duplicated in both flavors.
     '''
+    __slots__ = ('_datum',)
 
-    _datum = Datums.Sphere  # XXX TBD
+    def __init__(self, lat, lon, height=0):
+        '''See _LatLonHeightBase.__init__.
+        '''
+        _LatLonHeightBase.__init__(self, lat, lon, height=height)
+        self._datum = Datums.Sphere  # XXX TBD
 
     @property
     def datum(self):
@@ -47,8 +52,9 @@ class _LatLonSphericalBase(_LatLonHeightBase):
         E = datum.ellipsoid
         if not E.a == E.b == E.R:
             raise ValueError('%r not %s: %r' % ('datum', 'spherical', E))
-        self._update(datum != self._datum)
+        u = datum != self._datum
         self._datum = datum
+        self._update(u)
 
     def finalBearingTo(self, other):
         '''Return the final bearing (reverse azimuth) from this
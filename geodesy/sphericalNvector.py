@@ -26,15 +26,16 @@ from datum import R_M
 from nvector import NorthPole, _LatLonNvectorBase, \
                     Nvector as _NvectorBase, sumOf
 from sphericalBase import _LatLonSphericalBase
-from utils import EPS, EPS1, PI, PI2, PI_2, degrees360, \
+from utils import EPS, EPS1, EPS2, PI, PI2, PI_2, degrees360, \
                   fsum, isscalar, len2
+from vector3d import Vector3dArray
 from math import atan2, cos, radians, sin
 
 # all public contants, classes and functions
 __all__ = ('LatLon',  # classes
            'areaOf', 'intersection', 'meanOf',  # functions
            'triangulate', 'trilaterate')
-__version__ = '17.02.01'
+__version__ = '17.02.07'
 
 
 class LatLon(_LatLonNvectorBase, _LatLonSphericalBase):
@@ -52,12 +53,7 @@ class LatLon(_LatLonNvectorBase, _LatLonSphericalBase):
        from sphericalNvector import LatLon
        p = LatLon(52.205, 0.119)
     '''
-    _Nv = None  # cache Nvector
-
-    def _update(self, updated):
-        if updated:  # reset caches
-            self._Nv = None
-#           _LatLonNvectorBase._update(self, updated)
+    __slots__ = ()
 
     def _gc3(self, start, end, name):
         # private, return great circle, start and end
@@ -494,10 +490,11 @@ class LatLon(_LatLonNvectorBase, _LatLonSphericalBase):
            n = p.toNvector()
            n.toStr()  # [0.50000, 0.50000, 0.70710]
         '''
-        if self._Nv is None:
-            x, y, z, h = self.to4xyzh()
-            self._Nv = Nvector(x, y, z, h)
-        return self._Nv
+        return self._cached('_Nv', self._Nv)
+
+    def _Nv(self):
+        x, y, z, h = self.to4xyzh()
+        return Nvector(x, y, z, h)
 
     def triangulate(self, bearing1, other, bearing2):
         '''Locate a LatLon point given two points and bearings
@@ -544,6 +541,7 @@ class Nvector(_NvectorBase):
        On a spherical model earth, an n-vector is equivalent to an
        earth-centred earth-fixed (ECEF) vector.
     '''
+    __slots__ = ()
 
     def toLatLon(self, height=None):
         '''Convert this n-vector to a (sphericalNvector) LatLon point.
@@ -589,8 +587,8 @@ def areaOf(points, radius=R_M):
     '''Calculate the area of a spherical polygon where the sides
        of the polygon are great circle arcs joining the vertices.
 
-       @param {LatLon[]} points - Ordered set of points defining
-                                  the vertices of polygon.
+       @param {LatLon[]|Vector3dArray} points - Ordered set of points
+                         or n-vectors defining the vertices of polygon.
        @param {number} [radius=R_M] - Earth radius (default, mean
                                       WGS84 radius in meter).
 
@@ -598,6 +596,9 @@ def areaOf(points, radius=R_M):
                          squared.
     '''
     # uses Girard’s theorem: A = [Σθᵢ − (n−2)·π]·R²
+    if isinstance(points, Vector3dArray):
+        return _areaOf(points, radius)
+
     n, points = len2(points)
     if n > 0 and points[0].equals(points[n-1]):
         n -= 1
@@ -617,6 +618,22 @@ def areaOf(points, radius=R_M):
     return (s - PI2 - n * PI) * radius * radius
 
 
+def _areaOf(nvectors, radius):
+    # areaOf for a Vector3dArray of n-vectors
+    vs = nvectors.to3xyzs()
+    n = len(vs)
+    if n > 0 and max(abs(a - b) for a, b in zip(vs[0], vs[n-1])) < EPS2:
+        n -= 1
+    if n < 3:
+        raise ValueError('too few polygon points: %s' % (n,))
+
+    # great-circle vector for each edge, all at once
+    gc = Vector3dArray(vs[n-1:n] + vs[:n-1]).cross(Vector3dArray(vs[:n]))
+    gs = gc.to3xyzs()
+    s = fsum(gc.angleTo(Vector3dArray(gs[1:] + gs[:1])))
+    return (s - PI2 - n * PI) * radius * radius
+
+
 def intersection(start1, end1, start2, end2):
     '''Return the point of intersection of two paths each defined
        by two points or a start point and bearing.
@@ -644,12 +661,17 @@ def intersection(start1, end1, start2, end2):
 def meanOf(points, height=None):
     '''Return the geographic mean of the supplied points.
 
-       @param {LatLon[]} points - Array of LatLon pionts to be averaged.
+       @param {LatLon[]|Vector3dArray} points - Array of LatLon points
+                                                or n-vectors to be averaged.
+       @param {meter} [height=None] - Height, overriding the mean height.
 
        @returns {LatLon} Point at the geographic mean and mean height.
     '''
     # geographic mean
-    m = sumOf(p.toNvector() for p in points)
+    if isinstance(points, Vector3dArray):
+        m = sumOf(points)  # height 0
+    else:
+        m = sumOf(p.toNvector() for p in points)
     lat, lon, _ = m.to3llh()
     return LatLon(lat, lon, height=m.h if height is None else height)
 
@@ -0,0 +1,789 @@
+
+# -*- coding: utf-8 -*-
+
+# Prepared polygons on a spherical earth model, for testing many
+# points against the same polygon, see also the isEnclosedBy methods
+# of modules sphericalNvector and sphericalTrigonometry.
+
+# The vertex n-vectors, the edge great-circle normals, a bounding cap
+# and a lat-/longitude bounding box are computed once, such that each
+# point test is a box check followed by dot products, without creating
+# any LatLon, Nvector or Vector3d instances.
+
+# Points inside non-convex polygons are found by counting the edges
+# crossing the meridian arc from the point to the north pole, whether
+# the north pole is inside is determined once per polygon.  Unlike the
+# angle summation, this takes only sign tests for most edges and also
+# handles polygons around a pole or larger than a hemisphere.
+
+# A PolygonIndex registers many prepared polygons in a lat-/longitude
+# grid, to test each point only against the polygons in its grid cell.
+
+# Functions areasOf and perimetersOf compute the area and perimeter of
+# many polygons at once, given all vertices in a single, flat sequence
+# and the offset of each polygon's first vertex.  Each edge contributes
+# the spherical excess of the triangle formed with the pole, from the
+# tangents of half the latitudes, avoiding the cancellation in Girard's
+# formula for small polygons.
+
+from bases import _Base
+from datum import R_M
+from utils import EPS, PI, PI2, fStr, fsum, len2, radians, wrap180
+from math import acos, atan2, cos, degrees, hypot, sin, sqrt, tan
+
+# all public contants, classes and functions
+__all__ = ('PolygonIndex', 'PreparedPolygon',  # classes
+           'areEnclosedBy', 'areasOf', 'isEnclosedBy',  # functions
+           'perimetersOf')
+__version__ = '17.02.07'
+
+_MARGIN = 1e-9  # bounding box margin in degrees
+
+
+def _2ll(point):
+    # return lat- and longitude of a LatLon or (lat, lon) point
+    if hasattr(point, 'lat'):
+        return point.lat, point.lon
+    return point[0], point[1]
+
+
+def _sc4(lat, lon):
+    # return sin and cos of lat- and longitude in degrees
+    a, b = radians(lat), radians(lon)
+    return sin(a), cos(a), sin(b), cos(b)
+
+
+def _xyz(lat, lon):
+    # return the unit n-vector for lat-, longitude in degrees
+    sa, ca, sb, cb = _sc4(lat, lon)
+    return ca * cb, ca * sb, sa
+
+
+def _cross(v1, v2):
+    x1, y1, z1 = v1
+    x2, y2, z2 = v2
+    return y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2
+
+
+def _dot(v1, v2):
+    return v1[0] * v2[0] + v1[1] * v2[1] + v1[2] * v2[2]
+
+
+class PreparedPolygon(_Base):
+    '''Polygon on a spherical earth model, prepared for repeated
+       point-in-polygon tests.
+
+       The polygon edges are great circle arcs between the vertices.
+       The interior is the smaller of the two regions bounded by the
+       edges.  Polygons may be concave, but should not intersect
+       themselves.
+    '''
+    __slots__ = ('_box', '_cap', '_convex', '_gs', '_north', '_sign', '_vs')
+
+    def __init__(self, points):
+        '''Prepare a polygon.
+
+           @constructor
+           @param {LatLon[]|(degrees, degrees)[]} points - Ordered
+                          sequence of LatLon or (lat, lon) points,
+                          the polygon vertices, spherical or other.
+
+           @throws {ValueError} Too few polygon points.
+
+           @example
+           pp = PreparedPolygon([(45, 1), (45, 2), (46, 2), (46, 1)])
+           inside = pp.contains(LatLon(45.1, 1.1))  # True
+        '''
+        n, lls = len2(_2ll(p) for p in points)
+        if n > 1 and lls[0] == lls[n-1]:
+            n -= 1
+            lls = lls[:n]
+        if n < 3:
+            raise ValueError('too few polygon points: %s' % (n,))
+
+        self._vs = vs = [_xyz(a, b) for a, b in lls]
+        # great circle normal of each edge, unnormalized
+        self._gs = gs = [_cross(v1, v2) for v1, v2 in zip(vs, vs[1:] + vs[:1])]
+
+        # bounding cap, centered at the normalized vertex sum
+        x, y, z = [sum(t) for t in zip(*vs)]
+        h = sqrt(x * x + y * y + z * z)
+        if h > EPS:
+            c = x / h, y / h, z / h
+            r = min(_dot(c, v) for v in vs)  # cos(radius)
+            self._cap = (c, r) if r > EPS else None
+        else:
+            c, self._cap = None, None
+
+        # convex if all edges turn the same way and the
+        # cap center is on the same side of all edges
+        self._convex, self._sign = False, 1
+        if c is not None:
+            ts = [_dot(_cross(g1, g2), v) for g1, g2, v in zip(gs[-1:] + gs[:-1], gs, vs)]
+            if min(ts) > -EPS or max(ts) < EPS:
+                s = -1 if _dot(gs[0], c) < 0 else 1
+                if min(_dot(g, c) * s for g in gs) > 0:
+                    self._convex, self._sign = True, s
+
+        self._north = self._northOf()
+        self._box = self._boxOf(lls)
+
+    def __len__(self):
+        return len(self._vs)
+
+    def _boxOf(self, lls):
+        # lat-/longitude bounding box, including the poleward
+        # bulges of the edges and any enclosed pole
+        vs, gs = self._vs, self._gs
+        S = min(a for a, _ in lls)
+        N = max(a for a, _ in lls)
+        for v1, v2, g in zip(vs, vs[1:] + vs[:1], gs):
+            gx, gy, gz = g
+            if hypot(gx, gy) > EPS:  # not along the equator
+                t = -gx * gz, -gy * gz, gx * gx + gy * gy
+                for t in (t, (-t[0], -t[1], -t[2])):  # max, min lat
+                    if _dot(_cross(v1, t), g) > 0 and _dot(_cross(t, v2), g) > 0:
+                        a = degrees(atan2(t[2], hypot(t[0], t[1])))
+                        S, N = min(S, a), max(N, a)
+
+        if self._exact(1.0, 0.0, 0.0, 1.0):  # north pole
+            return S - _MARGIN, -180.0, 90.0, 180.0
+        if self._exact(-1.0, 0.0, 0.0, 1.0):  # south pole
+            return -90.0, -180.0, N + _MARGIN, 180.0
+
+        # longitudes covered by the edges, each less than 180
+        # degrees, in terms of the gaps between the sorted
+        # vertex longitudes, counted in a difference array
+        bs = [wrap180(b) for _, b in lls]
+        L = sorted(set(bs))
+        m = len(L)
+        k = dict((b, i) for i, b in enumerate(L))
+        d = [0] * (m + 1)
+        for b1, b2 in zip(bs, bs[1:] + bs[:1]):
+            if wrap180(b2 - b1) < 0:
+                b1, b2 = b2, b1
+            i, j = k[b1], k[b2]
+            if i < j:
+                d[i] += 1
+                d[j] -= 1
+            elif i > j:
+                d[i] += 1
+                d[m] -= 1
+                d[0] += 1
+                d[j] -= 1
+        # the box excludes the largest gap not covered
+        g, W, E, c = -1, -180.0, 180.0, 0
+        for i in range(m):
+            c += d[i]
+            if c < 1:
+                w = L[(i + 1) % m]
+                e = L[i]
+                t = (w - e) % 360 or 360
+                if t > g:
+                    g, W, E = t, w, e
+        if g < 0:  # all longitudes
+            W, E = -180.0, 180.0
+        else:
+            W, E = wrap180(W - _MARGIN), wrap180(E + _MARGIN)
+        return S - _MARGIN, W, N + _MARGIN, E
+
+    def _contains(self, lat, lon):
+        # test a point given in degrees
+        S, W, N, E = self._box
+        if lat < S or lat > N:
+            return False
+        if lon < -180 or lon > 180:
+            lon = wrap180(lon)
+        if (lon < W or lon > E) if W <= E else (E < lon < W):
+            return False
+
+        sa, ca, sb, cb = _sc4(lat, lon)
+        if self._cap:
+            c, r = self._cap
+            if (c[0] * ca * cb + c[1] * ca * sb + c[2] * sa) < (r - EPS):
+                return False
+        return self._exact(sa, ca, sb, cb)
+
+    def _crossings(self, sa, ca, sb, cb, inside):
+        # toggle inside for each edge crossing the meridian
+        # arc from the point to the north pole, given the
+        # sin and cos of the point's lat- and longitude
+        x1, y1, z1 = self._vs[-1]
+        s1 = cb * y1 - sb * x1  # east of the meridian plane
+        for x2, y2, z2 in self._vs:
+            s2 = cb * y2 - sb * x2
+            if (s1 < 0) != (s2 < 0):
+                # edge point on the meridian plane
+                if s1 < 0:
+                    tx, ty, tz = s2 * x1 - s1 * x2, s2 * y1 - s1 * y2, s2 * z1 - s1 * z2
+                else:
+                    tx, ty, tz = s1 * x2 - s2 * x1, s1 * y2 - s2 * y1, s1 * z2 - s2 * z1
+                h = cb * tx + sb * ty
+                # on the point's half of the meridian, north of the point
+                if h > 0 and (tz * ca - h * sa) > 0:
+                    inside = not inside
+            x1, y1, z1, s1 = x2, y2, z2, s2
+        return inside
+
+    def _exact(self, sa, ca, sb, cb):
+        # exact test of a point, on the same side of all edges
+        # for a convex polygon, otherwise by counting crossings
+        if self._convex:
+            x, y, z, s = ca * cb, ca * sb, sa, self._sign
+            for gx, gy, gz in self._gs:
+                if (gx * x + gy * y + gz * z) * s < 0:
+                    return False
+            return True
+        return self._crossings(sa, ca, sb, cb, self._north)
+
+    def _northOf(self):
+        # whether the north pole is inside, from a point just left
+        # of the longest edge and the crossings from that point
+        vs, gs = self._vs, self._gs
+        i = max(range(len(gs)), key=lambda i: _dot(gs[i], gs[i]))
+        g = gs[i]
+        h = sqrt(_dot(g, g))
+        if h < EPS:
+            raise ValueError('%s invalid: %r' % ('polygon', vs[:3]))
+        v1, v2 = vs[i], vs[(i + 1) % len(vs)]
+        m = [a + b for a, b in zip(v1, v2)]
+        d = sqrt(_dot(m, m))
+        x, y, z = [a / d + b * 1e-9 / h for a, b in zip(m, g)]
+        d = hypot(x, y)
+        # the north pole is left of the edges if the point is
+        # an odd number of edge crossings from the north pole
+        t = not self._crossings(z / hypot(d, z), d / hypot(d, z),
+                                (y / d) if d else 0.0,
+                                (x / d) if d else 1.0, False)
+
+        # the left side is inside if the edges turn left in total,
+        # since the region left of the edges has area 2 * PI less
+        # the net turning, by the Gauss-Bonnet theorem, smaller than
+        # the other region of 2 * PI plus the net turning
+        ts = [atan2(_dot(_cross(g1, g2), v), _dot(g1, g2))
+              for g1, g2, v in zip(gs[-1:] + gs[:-1], gs, vs)]
+        return t if fsum(ts) > 0 else (not t)
+
+    @property
+    def box(self):
+        '''Get the bounding box (south, west, north, east) in degrees,
+           west exceeds east if the box spans the antimeridian.
+        '''
+        return self._box
+
+    @property
+    def cap(self):
+        '''Get the bounding cap as 2-tuple (center, radius), the
+           center a unit n-vector (x, y, z) and the angular radius
+           in radians or None for polygons too large for a cap.
+        '''
+        if self._cap:
+            c, r = self._cap
+            return c, acos(min(r, 1.0))
+        return None
+
+    @property
+    def convex(self):
+        '''Get convexity of this polygon (bool).
+        '''
+        return self._convex
+
+    def contains(self, point):
+        '''Test whether a point is enclosed by this polygon.
+
+           @param {LatLon|(degrees, degrees)} point - LatLon or
+                                                     (lat, lon) point.
+
+           @returns {bool} True if the point is inside.
+
+           @example
+           pp = PreparedPolygon([(45, 1), (45, 2), (46, 2), (46, 1)])
+           inside = pp.contains((45.5, 1.5))  # True
+        '''
+        return self._contains(*_2ll(point))
+
+    def containsMany(self, points):
+        '''Test whether points are enclosed by this polygon.
+
+           @param {LatLon[]|(degrees, degrees)[]} points - Sequence
+                          or iterable of LatLon or (lat, lon) points.
+
+           @returns {bool[]} List of True for each point inside.
+
+           @example
+           ins = pp.containsMany(zip(lats, lons))
+        '''
+        c = self._contains
+        return [c(*_2ll(p)) for p in points]
+
+    @property
+    def north(self):
+        '''Get whether the north pole is inside this polygon (bool).
+        '''
+        return self._north
+
+    def toStr(self, prec=6, sep=', '):  # PYCHOK expected
+        '''Return a string representation of this polygon.
+
+           @param {number} [prec=6] - Number of decimals for the box.
+           @param {string} [sep=', '] - Separator to join.
+
+           @returns {string} This polygon as "n=..., box=(...), convex=...".
+        '''
+        t = ('n=%s' % (len(self),), 'box=(%s)' % (fStr(self._box, prec=prec),),
+             'convex=%s' % (self._convex,))
+        return sep.join(t)
+
+
+class PolygonIndex(_Base):
+    '''Index of many polygons on a spherical earth model, to find
+       the polygons enclosing a point.
+
+       Each polygon is prepared and registered in the cells of a
+       lat-/longitude grid overlapping its bounding box.  A query
+       tests only the polygons registered in the point's cell,
+       each by box, by cap and finally by the exact test.
+    '''
+    __slots__ = ('_cell', '_cells', '_cols', '_keys', '_large', '_pps', '_rows')
+
+    def __init__(self, polygons=(), cell=None):
+        '''Create an index and bulk load polygons.
+
+           @constructor
+           @param {dict|LatLon[][]} [polygons=()] - Polygons keyed
+                          by any hashable or a sequence of polygons,
+                          keyed by index, each polygon an ordered
+                          sequence of LatLon or (lat, lon) vertices
+                          or a PreparedPolygon.
+           @param {degrees} [cell=None] - Grid cell size or None for
+                                          the median polygon box size.
+
+           @throws {ValueError} Too few polygon points or invalid cell.
+
+           @example
+           fences = PolygonIndex({'A': [(45, 1), (45, 2), (46, 1.5)],
+                                  'B': [(50, 0), (50, 1), (51, 1), (51, 0)]})
+           keys = fences.containing(LatLon(45.2, 1.5))  # ['A']
+        '''
+        kps = polygons.items() if hasattr(polygons, 'items') else enumerate(polygons)
+        kps = [(k, _prepared(p)) for k, p in kps]
+
+        if cell is None:  # median of the polygon box sizes
+            ds = sorted(max(N - S, (E - W) if W <= E else (E - W + 360))
+                        for S, W, N, E in (pp.box for _, pp in kps))
+            cell = ds[len(ds) // 2] if ds else 1.0
+            cell = min(max(cell, 0.01), 90.0)
+        elif not 0 < cell <= 180:
+            raise ValueError('%s invalid: %r' % ('cell', cell))
+
+        self._cell = float(cell)
+        self._cells = {}  # polygon indices by grid cell
+        self._cols = int(-(-360 // self._cell))
+        self._rows = int(-(-180 // self._cell))
+        self._keys = []
+        self._large = []  # indices of polygons spanning too many cells
+        self._pps = []
+        for k, pp in kps:
+            self.add(k, pp)
+
+    def __len__(self):
+        return len(self._pps)
+
+    def _col(self, lon):
+        return min(int((lon + 180) / self._cell), self._cols - 1)
+
+    def _row(self, lat):
+        return min(max(int((lat + 90) / self._cell), 0), self._rows - 1)
+
+    def _containing(self, lat, lon):
+        # indices of the polygons enclosing a point in degrees
+        if lon < -180 or lon > 180:
+            lon = wrap180(lon)
+        ix = self._cells.get((self._row(lat), self._col(lon)), ())
+        if self._large:
+            ix = sorted(self._large + list(ix))
+        pps = self._pps
+        return [i for i in ix if pps[i]._contains(lat, lon)]
+
+    def add(self, key, polygon):
+        '''Add a polygon to this index.
+
+           @param {any} key - Hashable key of the polygon.
+           @param {LatLon[]|PreparedPolygon} polygon - Ordered sequence
+                          of LatLon or (lat, lon) vertices or a
+                          PreparedPolygon.
+
+           @returns {PreparedPolygon} The polygon as added.
+
+           @throws {ValueError} Too few polygon points.
+        '''
+        pp = _prepared(polygon)
+        i = len(self._pps)
+        self._keys.append(key)
+        self._pps.append(pp)
+
+        S, W, N, E = pp.box
+        rs = range(self._row(S), self._row(N) + 1)
+        if W <= E:
+            cs = list(range(self._col(W), self._col(E) + 1))
+        else:  # across the antimeridian
+            cs = list(range(self._col(W), self._cols)) + \
+                 list(range(0, self._col(E) + 1))
+        if len(rs) * len(cs) > 1024:
+            self._large.append(i)
+        else:
+            cells = self._cells
+            for r in rs:
+                for c in cs:
+                    cells.setdefault((r, c), []).append(i)
+        return pp
+
+    @property
+    def cell(self):
+        '''Get the grid cell size in degrees.
+        '''
+        return self._cell
+
+    def containing(self, point):
+        '''Find the polygons enclosing a point.
+
+           @param {LatLon|(degrees, degrees)} point - LatLon or
+                                                     (lat, lon) point.
+
+           @returns {list} Keys of the enclosing polygons, in the
+                           order the polygons were added.
+        '''
+        ks = self._keys
+        return [ks[i] for i in self._containing(*_2ll(point))]
+
+    def containingMany(self, points):
+        '''Find the polygons enclosing each of many points.
+
+           @param {LatLon[]|(degrees, degrees)[]} points - Sequence
+                          or iterable of LatLon or (lat, lon) points.
+
+           @returns {list[]} List of the keys of the enclosing
+                             polygons for each point.
+
+           @example
+           keyss = fences.containingMany(zip(lats, lons))
+        '''
+        c, ks = self._containing, self._keys
+        return [[ks[i] for i in c(*_2ll(p))] for p in points]
+
+    def polygon(self, key):
+        '''Get a polygon of this index.
+
+           @param {any} key - Key of the polygon.
+
+           @returns {PreparedPolygon} The polygon.
+
+           @throws {KeyError} No polygon with that key.
+        '''
+        try:
+            return self._pps[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key)
+
+    def toStr(self, prec=6, sep=', '):  # PYCHOK expected
+        '''Return a string representation of this index.
+
+           @param {number} [prec=6] - Number of decimals for the cell.
+           @param {string} [sep=', '] - Separator to join.
+
+           @returns {string} This index as "n=..., cell=..., cells=...".
+        '''
+        t = ('n=%s' % (len(self),), 'cell=%s' % (fStr(self._cell, prec=prec),),
+             'cells=%s' % (len(self._cells),))
+        return sep.join(t)
+
+
+def _polygons(points, offsets):
+    # yield each polygon's lat- and longitudes in radians,
+    # without the closing vertex, from flat points and offsets
+    m = getattr(points, 'floats', None)
+    if m is not None:  # PackedPoints
+        if not points.layout.startswith('ll'):
+            raise ValueError('%s invalid: %r' % ('layout', points.layout))
+        f = len(points.fields)
+        lats, lons = m[0::f], m[1::f]
+    else:
+        n, ps = len2(points)
+        if n and hasattr(ps[0], 'lat'):
+            lats, lons = [p.lat for p in ps], [p.lon for p in ps]
+        else:
+            lats, lons = [p[0] for p in ps], [p[1] for p in ps]
+
+    ix = list(offsets)
+    if not ix or ix[-1] != len(lats):
+        ix.append(len(lats))
+    for s, e in zip(ix, ix[1:]):
+        if not 0 <= s <= e <= len(lats):
+            raise ValueError('%s invalid: %s..%s' % ('offsets', s, e))
+        a, b = lats[s:e], lons[s:e]
+        if e - s > 1 and a[0] == a[-1] and b[0] == b[-1]:
+            e -= 1
+        if e - s < 3:
+            raise ValueError('too few polygon points: %s' % (e - s,))
+        yield [radians(t) for t in a[:e-s]], [radians(t) for t in b[:e-s]]
+
+
+def _prepared(polygon):
+    # return a polygon as PreparedPolygon
+    if isinstance(polygon, PreparedPolygon):
+        return polygon
+    return PreparedPolygon(polygon)
+
+
+def areEnclosedBy(points, polygon):
+    '''Test whether points are enclosed by a polygon, convex or not.
+
+       @param {LatLon[]|(degrees, degrees)[]} points - Sequence or
+                      iterable of LatLon or (lat, lon) points.
+       @param {LatLon[]|(degrees, degrees)[]|PreparedPolygon} polygon -
+                      Ordered sequence of polygon vertices, LatLon or
+                      (lat, lon) points or a PreparedPolygon.
+
+       @returns {bool[]} List of True for each point inside.
+
+       @throws {ValueError} Too few polygon points.
+
+       @example
+       b = (45, 1), (45, 2), (45.5, 1.5), (46, 2), (46, 1)
+       ins = areEnclosedBy([(45.2, 1.5), (45.5, 1.8)], b)  # [True, False]
+    '''
+    return _prepared(polygon).containsMany(points)
+
+
+def areasOf(points, offsets, radius=R_M):
+    '''Calculate the areas of many spherical polygons, where the sides
+       of each polygon are great circle arcs joining the vertices.
+
+       @param {LatLon[]|(degrees, degrees)[]|PackedPoints} points - All
+                      polygon vertices as a single, flat sequence of
+                      LatLon or (lat, lon, ...) points or PackedPoints.
+       @param {int[]} offsets - Index of the first vertex of each
+                                polygon, optionally followed by the
+                                total number of points.
+       @param {number} [radius=R_M] - Earth radius (default, mean
+                                      WGS84 radius in meter).
+
+       @returns {number[]} Area of each polygon in the same units as
+                           radius squared, the smaller of the two
+                           regions bounded by the polygon edges.
+
+       @throws {ValueError} Too few polygon points or invalid offsets.
+
+       @example
+       lls = [(0, 0), (0, 1), (1, 1), (1, 0), (10, 10), (10, 11), (11, 10)]
+       m2s = areasOf(lls, [0, 4])  # 12364031798.5, 6088546207.1
+    '''
+    r2, As = radius * radius, []
+    for a, b in _polygons(points, offsets):
+        ts = [tan(t * 0.5) for t in a]
+        S, W = [], 0
+        t1, b1 = ts[-1], b[-1]
+        for t2, b2 in zip(ts, b):
+            d = b2 - b1
+            if d > PI:
+                d -= PI2
+            elif d < -PI:
+                d += PI2
+            # excess of the triangle with the pole
+            S.append(atan2(tan(d * 0.5) * (t1 + t2), 1 + t1 * t2))
+            W += d
+            t1, b1 = t2, b2
+        A = abs(fsum(S)) * 2
+        if abs(W) > PI:  # a pole is enclosed
+            A = PI2 - A
+        As.append(min(A, PI2 * 2 - A) * r2)
+    return As
+
+
+def isEnclosedBy(point, polygon):
+    '''Test whether a point is enclosed by a polygon, convex or not.
+
+       @param {LatLon|(degrees, degrees)} point - LatLon or (lat, lon)
+                                                 point.
+       @param {LatLon[]|(degrees, degrees)[]|PreparedPolygon} polygon -
+                      Ordered sequence of polygon vertices, LatLon or
+                      (lat, lon) points or a PreparedPolygon.
+
+       @returns {bool} True if the point is inside.
+
+       @throws {ValueError} Too few polygon points.
+
+       @example
+       b = LatLon(45, 1), LatLon(45, 2), LatLon(45.5, 1.5), LatLon(46, 2), LatLon(46, 1)
+       inside = isEnclosedBy(LatLon(45.5, 1.8), b)  # False
+    '''
+    return _prepared(polygon).contains(point)
+
+
+def perimetersOf(points, offsets, radius=R_M):
+    '''Calculate the perimeters of many spherical polygons, where the
+       sides of each polygon are great circle arcs joining the vertices.
+
+       @param {LatLon[]|(degrees, degrees)[]|PackedPoints} points - All
+                      polygon vertices as a single, flat sequence of
+                      LatLon or (lat, lon, ...) points or PackedPoints.
+       @param {int[]} offsets - Index of the first vertex of each
+                                polygon, optionally followed by the
+                                total number of points.
+       @param {number} [radius=R_M] - Earth radius (default, mean
+                                      WGS84 radius in meter).
+
+       @returns {number[]} Perimeter of each polygon in the same units
+                           as radius.
+
+       @throws {ValueError} Too few polygon points or invalid offsets.
+
+       @example
+       lls = [(0, 0), (0, 1), (1, 1), (1, 0), (10, 10), (10, 11), (11, 10)]
+       ms = perimetersOf(lls, [0, 4])  # 444763.4, 376642.2
+    '''
+    Ps = []
+    for a, b in _polygons(points, offsets):
+        cs = [cos(t) for t in a]
+        P = []
+        a1, b1, c1 = a[-1], b[-1], cs[-1]
+        for a2, b2, c2 in zip(a, b, cs):
+            # haversine
+            h = sin((a2 - a1) * 0.5)**2 + c1 * c2 * sin((b2 - b1) * 0.5)**2
+            P.append(atan2(sqrt(h), sqrt(max(0.0, 1 - h))))
+            a1, b1, c1 = a2, b2, c2
+        Ps.append(fsum(P) * 2 * radius)
+    return Ps
+
+
+if __name__ == '__main__':
+
+    from random import random, seed
+    from time import time
+    from sphericalNvector import LatLon as nLatLon
+    from sphericalTrigonometry import LatLon as tLatLon
+
+    seed(42)
+    n = 5000
+    b = [(45, 1), (45, 2), (46, 2.5), (46.5, 1.5), (46, 1)]
+    lls = [(44.5 + random() * 2.5, 0.5 + random() * 2.5) for _ in range(n)]
+
+    for t, L in (('sphericalNvector.isEnclosedBy     ', nLatLon),
+                 ('sphericalTrigonometry.isEnclosedBy', tLatLon)):
+        ps = [L(*ll) for ll in lls]
+        bs = [L(*ll) for ll in b]
+        s = time()
+        r1 = [p.isEnclosedBy(bs) for p in ps]
+        s = time() - s
+        print('%s %d: %.3f sec, %.2f usec/point' % (t, n, s, s * 1e6 / n))
+
+    s = time()
+    pp = PreparedPolygon(b)
+    r2 = pp.containsMany(lls)
+    s = time() - s
+    print('%s %d: %.3f sec, %.2f usec/point' % ('PreparedPolygon.containsMany      ', n, s, s * 1e6 / n))
+    print('%s %d points, %d inside, %d differ' % (pp, n, sum(r2), sum(a != b for a, b in zip(r1, r2))))
+
+    # concave star polygon with m vertices, crossings vs angle summation
+    m = 64
+    b = [(45.75 + (1.2 if i % 2 else 0.4) * sin(i * PI2 / m),
+          1.75 + (1.2 if i % 2 else 0.4) * cos(i * PI2 / m)) for i in range(m)]
+    ps = [nLatLon(*ll) for ll in lls]
+    bs = [nLatLon(*ll) for ll in b]
+    s = time()
+    r1 = [p.isEnclosedBy(bs) for p in ps]
+    s = time() - s
+    print('%s %d: %.3f sec, %.2f usec/point' % ('sphericalNvector.isEnclosedBy', n, s, s * 1e6 / n))
+
+    s = time()
+    r2 = areEnclosedBy(lls, b)
+    s = time() - s
+    print('%s %d: %.3f sec, %.2f usec/point' % ('areEnclosedBy                ', n, s, s * 1e6 / n))
+    print('%s %d points, %d inside, %d differ' % (PreparedPolygon(b), n, sum(r2), sum(a != b for a, b in zip(r1, r2))))
+
+    # index of m random, concave polygons vs testing each polygon
+    m, n = 2000, 5000
+    ps = []
+    for _ in range(m):
+        a, b = random() * 40 + 30, random() * 60 - 20
+        ps.append([(a, b), (a, b + 0.5), (a + 0.2, b + 0.25), (a + 0.5, b + 0.5), (a + 0.5, b)])
+    lls = [(random() * 41 + 30, random() * 61 - 20) for _ in range(n)]
+
+    s = time()
+    pi = PolygonIndex(ps)
+    t = time() - s
+    r2 = pi.containingMany(lls)
+    s = time() - s
+    print('%s %d: %.3f sec, %.2f usec/point, %.3f sec load' % ('PolygonIndex.containingMany', n, s - t, (s - t) * 1e6 / n, t))
+
+    pps = [PreparedPolygon(p) for p in ps]
+    s = time()
+    r1 = [[i for i, pp in enumerate(pps) if pp.contains(ll)] for ll in lls]
+    s = time() - s
+    print('%s %d: %.3f sec, %.2f usec/point' % ('PreparedPolygon.contains   ', n, s, s * 1e6 / n))
+    print('%s %d points, %d inside, %d differ' % (pi, n, sum(map(len, r2)), sum(a != b for a, b in zip(r1, r2))))
+
+    # areas and perimeters of m parcels, 5 vertices each, batch vs areaOf
+    from sphericalNvector import areaOf
+    m = 20000
+    lls = []
+    for _ in range(m):
+        a, b = random() * 40 + 30, random() * 60 - 20
+        lls.extend([(a, b), (a, b + 1e-3), (a + 4e-4, b + 5e-4), (a + 1e-3, b + 1e-3), (a + 1e-3, b)])
+    ix = list(range(0, m * 5, 5))
+
+    s = time()
+    As = areasOf(lls, ix)
+    s = time() - s
+    print('%s %d: %.3f sec, %.2f usec/polygon' % ('areasOf     ', m, s, s * 1e6 / m))
+    s = time()
+    Ps = perimetersOf(lls, ix)
+    s = time() - s
+    print('%s %d: %.3f sec, %.2f usec/polygon' % ('perimetersOf', m, s, s * 1e6 / m))
+
+    ps = [nLatLon(*ll) for ll in lls]
+    s = time()
+    for i in ix:
+        areaOf(ps[i:i + 5])
+    s = time() - s
+    print('%s %d: %.3f sec, %.2f usec/polygon' % ('areaOf      ', m, s, s * 1e6 / m))
+    print('mean area %.3f m2, perimeter %.3f m' % (fsum(As) / m, fsum(Ps) / m))
+
+    # Typical result (on Python 3.11.7 64bit):
+
+    # sphericalNvector.isEnclosedBy      5000: 0.385 sec, 76.95 usec/point
+    # sphericalTrigonometry.isEnclosedBy 5000: 0.311 sec, 62.12 usec/point
+    # PreparedPolygon.containsMany       5000: 0.008 sec, 1.51 usec/point
+    # n=5, box=(45.0, 1.0, 46.5, 2.5), convex=True 5000 points, 1274 inside, 0 differ
+    # sphericalNvector.isEnclosedBy 5000: 2.692 sec, 538.30 usec/point
+    # areEnclosedBy                 5000: 0.075 sec, 15.05 usec/point
+    # n=64, box=(44.555778, 0.555778, 46.944222, 2.944222), convex=False 5000 points, 1234 inside, 0 differ
+    # PolygonIndex.containingMany 5000: 0.025 sec, 5.03 usec/point, 0.181 sec load
+    # PreparedPolygon.contains    5000: 7.236 sec, 1447.18 usec/point
+    # n=2000, cell=0.500257, cells=5456 5000 points, 746 inside, 0 differ
+    # areasOf      20000: 0.186 sec, 9.28 usec/polygon
+    # perimetersOf 20000: 0.204 sec, 10.20 usec/polygon
+    # areaOf       20000: 1.410 sec, 70.48 usec/polygon
+    # mean area 5844.435 m2, perimeter 384.120 m
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1@Gmail.com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
@@ -13,15 +13,16 @@ import sys
 
 # all public contants, classes and functions
 __all__ = ('EPS', 'EPS1', 'EPS2', 'PI', 'PI2', 'PI_2',  # constants
+           'FastMath',  # classes
            'cbrt',
            'degrees', 'degrees90', 'degrees180', 'degrees360',
-           'false2f', 'fdot', 'fdot3', 'fStr', 'fsum',
+           'false2f', 'fastmath', 'fdot', 'fdot3', 'fStr', 'fsum',
            'halfs', 'hypot1', 'hypot3',
            'isint', 'isscalar', 'len2', 'map2',
            'radians', 'radiansPI', 'radiansPI2', 'radiansPI_2',
            'sin_2', 'tanPI_2_2',
            'wrap90', 'wrap180', 'wrapPI', 'wrapPI2', 'wrapPI_2')
-__version__ = '17.02.02'
+__version__ = '17.02.07'
 
 try:
     from math import fsum  # precision sum, Python 2.6+
@@ -49,6 +50,35 @@ PI_2 = PI / 2
 
 _3rd = 1.0 / 3.0  # float!
 
+_fastmath = False  # precision policy for fdot and fdot3
+
+
+class FastMath(object):
+    '''Context manager to temporarily change the precision
+       policy of functions fdot and fdot3, see function
+       fastmath for details.
+
+       @example
+       with FastMath():
+           u = toUtm(p)  # fast, plain multiply-add
+    '''
+
+    def __init__(self, fast=True):
+        '''Set the policy to use inside the with block.
+
+           @param {bool} [fast=True] - Use False for exact sums.
+        '''
+        self._fast = fast
+        self._prev = None
+
+    def __enter__(self):
+        self._prev = fastmath(self._fast)
+        return self
+
+    def __exit__(self, *unused):
+        fastmath(self._prev)
+        return False  # re-raise any exception
+
 
 def cbrt(x):
     '''Compute the cubic root.
@@ -122,6 +152,42 @@ def false2f(value, name='value', false=True):
     return f
 
 
+def fastmath(fast=None):
+    '''Get and set the precision policy of functions fdot and
+       fdot3 and therefore of all functions and methods using
+       those, like Datum conversions, Krüger series in utm,
+       Osgr.toLatLon, Vector3d.dot and rotate, etc.
+
+       By default, fdot and fdot3 sum all products with fsum,
+       exactly rounded.  In fast mode, products are summed with
+       plain multiply-add expressions, two to four times faster
+       for the dot products, but losing precision in the last
+       few bits when large terms cancel, typically less than a
+       nanometer for Helmert transforms, UTM and cartesian
+       coordinates.  Overall speedups depend on the share of
+       dot products in the total computation.
+
+       The policy is global for the entire process, it is not
+       thread-local.  Use context manager FastMath to change the
+       policy temporarily.
+
+       @param {bool} [fast=None] - Use True for fast, plain sums,
+                                   False for exact fsum sums or None
+                                   to leave the policy unchanged.
+
+       @returns {bool} The previous policy, True if fast.
+
+       @example
+       fastmath(True)  # plain multiply-add
+       fastmath(False)  # exact, default
+    '''
+    global _fastmath
+    f = _fastmath
+    if fast is not None:
+        _fastmath = bool(fast)
+    return f
+
+
 def fdot(a, *b):
     '''Precision dot product.
 
@@ -130,8 +196,17 @@ def fdot(a, *b):
 
        @returns {number} Dot product sum(a[i] * b[i]
                          for i in range(len(a))).
+
+       See function fastmath for precision.
     '''
-    assert len(a) == len(b)
+    n = len(a)
+    assert n == len(b)
+    if _fastmath:  # unrolled for 3- and 4-term dots
+        if n == 3:
+            return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+        elif n == 4:
+            return a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3]
+        return sum(map(mul, a, b))
     return fsum(map(mul, a, b))
 
 
@@ -145,12 +220,18 @@ def fdot3(a, b, c, start=0):
 
        @returns {number} Dot product sum(a[i] * b[i] * c[i])
                          for i in range(len(a))) + start.
-    '''
-    def mul3(a, b, c):  # map function
-        return a * b * c
 
+       See function fastmath for precision.
+    '''
     assert len(a) == len(b) == len(c)
-    m3 = map(mul3, a, b, c)
+    if _fastmath:
+        if len(a) == 6:  # unrolled for Krüger series
+            return (start + a[0] * b[0] * c[0] + a[1] * b[1] * c[1] +
+                            a[2] * b[2] * c[2] + a[3] * b[3] * c[3] +
+                            a[4] * b[4] * c[4] + a[5] * b[5] * c[5])
+        return start + sum(map(_mul3, a, b, c))
+
+    m3 = map(_mul3, a, b, c)
     if start:
         m3 = (start,) + tuple(m3)
     return fsum(m3)
@@ -401,6 +482,66 @@ def wrapPI_2(rad):
     '''
     return _wrap(rad, PI_2)
 
+
+def _mul3(a, b, c):  # map function for fdot3
+    return a * b * c
+
+
+if __name__ == '__main__':
+
+    from timeit import timeit
+
+    # benchmark exact versus fast dot products and some of the
+    # functions and methods using those (importing this module
+    # as utils, since all other modules use that and not the
+    # FastMath and fdot of this __main__)
+    from datum import Datums
+    from ellipsoidalVincenty import LatLon
+    from osgr import toOsgr
+    from utm import toUtm
+    from vector3d import Vector3d
+    import utils
+
+    a4, b4 = (1.1, 2.2, 3.3, 4.4), (5.5, 6.6, 7.7, 8.8)
+    a6 = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6)
+    p = LatLon(52.65798, 1.71605)
+    v, w = Vector3d(0.5, 0.5, 0.7071), Vector3d(1, 2, 3)
+
+    for t, f, n in (('fdot           ', lambda: utils.fdot(a4, *b4), 100000),
+                    ('fdot3          ', lambda: utils.fdot3(a6, a6, a6, start=1), 100000),
+                    ('convertDatum   ', lambda: p.convertDatum(Datums.OSGB36), 10000),
+                    ('toUtm          ', lambda: toUtm(p), 10000),
+                    ('Utm.toLatLon   ', lambda: toUtm(p).toLatLon(LatLon), 5000),
+                    ('Osgr.toLatLon  ', lambda: toOsgr(p).toLatLon(LatLon), 5000),
+                    ('Vector3d.rotate', lambda: v.rotate(w, 0.5), 10000)):
+        ts = []
+        for fast in (False, True):
+            with utils.FastMath(fast):
+                ts.append(timeit(f, number=n) * 1e6 / n)
+        print('%s: %7.3f us exact, %7.3f us fast, %.2fx' % (t, ts[0], ts[1], ts[0] / ts[1]))
+
+    # differences exact versus fast
+    xyzs, utms = [], []
+    for fast in (False, True):
+        with utils.FastMath(fast):
+            xyzs.append(p.convertDatum(Datums.OSGB36).to3xyz())
+            utms.append(toUtm(p))
+    print('convertDatum: %.3e meter max difference' % (max(abs(a - b) for a, b in zip(*xyzs)),))
+    print('toUtm: %.3e meter easting, %.3e meter northing difference' % (
+          abs(utms[0].easting - utms[1].easting), abs(utms[0].northing - utms[1].northing)))
+
+    # Typical result (on Python 3.11.7 64bit):
+
+    # fdot           :   1.421 us exact,   0.702 us fast, 2.02x
+    # fdot3          :   2.629 us exact,   0.726 us fast, 3.62x
+    # convertDatum   :  19.603 us exact,  18.690 us fast, 1.05x
+    # toUtm          :  29.367 us exact,  25.182 us fast, 1.17x
+    # Utm.toLatLon   :  73.184 us exact,  63.299 us fast, 1.16x
+    # Osgr.toLatLon  :  74.574 us exact,  69.931 us fast, 1.07x
+    # Vector3d.rotate:  11.264 us exact,   9.899 us fast, 1.14x
+    # convertDatum: 0.000e+00 meter max difference
+    # toUtm: 0.000e+00 meter easting, 9.313e-10 meter northing difference
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1@Gmail.com
@@ -10,7 +10,7 @@
 from math import asinh, atan, atanh, atan2, cos, cosh, \
                  hypot, sin, sinh, tan, tanh
 from operator import mul
-from bases import _Base
+from bases import _Base, _latlonOf, _latlonRef
 from datum import Datums
 from dms   import S_DEG
 from utils import EPS, degrees, degrees90, degrees180, \
@@ -37,7 +37,7 @@ from utils import EPS, degrees, degrees90, degrees180, \
 # all public contants, classes and functions
 __all__ = ('Utm',  # classes
            'parseUTM', 'toUtm')  # functions
-__version__ = '17.01.14'
+__version__ = '17.02.07'
 
 # Latitude bands C..X of 8° each, covering 80°S to 84°N
 _Bands         = 'CDEFGHJKLMNPQRSTUVWXX'  # X repeated for 80-84°N
@@ -140,16 +140,9 @@ def _toZBll(lat, lon):
 class Utm(_Base):
     '''UTM coordinate.
     '''
-    _band     = ''
-    _converge = None
-    _datum    = Datums.WGS84
-    _easting  = 0
-    _hemi     = ''
-    _latlon   = None  # also set by ellipsoidalBase._LatLonHeightDatumBase.toUtm.
-    _mgrs     = None
-    _northing = 0
-    _scale    = None
-    _zone     = 0
+    __slots__ = ('_band', '_converge', '_datum', '_easting', '_hemi',
+                 '_latlon',  # also set by ellipsoidalBase._LatLonHeightDatumBase.toUtm.
+                 '_mgrs', '_northing', '_scale', '_zone')
 
     def __init__(self, zone, hemisphere, easting, northing, band='',
                        datum=Datums.WGS84, convergence=None, scale=None):
@@ -195,14 +188,11 @@ class Utm(_Base):
         self._hemi     = h.upper()
         self._easting  = e
         self._northing = n
-        if self._band != B:
-            self._band = B
-        if self._datum != datum:
-            self._datum = datum
-        if self._converge != convergence:
-            self._converge = convergence
-        if self._scale != scale:
-            self._scale = scale
+        self._band     = B
+        self._datum    = datum
+        self._converge = convergence
+        self._scale    = scale
+        self._latlon   = self._mgrs = None  # caches
 
     @property
     def band(self):
@@ -259,9 +249,9 @@ class Utm(_Base):
            from geodesy import ellipsoidalVincenty as eV
            ll = g.toLatLon(eV.LatLon)  # 48°51′29.52″N, 002°17′40.20″E
         '''
-        if self._latlon and self._latlon.__class__ is LatLon \
-                        and self._latlon.datum == self._datum:
-            return self._latlon  # set below
+        ll = _latlonOf(self._latlon, LatLon, self._datum)
+        if ll is not None:
+            return ll  # set below
 
         E = self._datum.ellipsoid  # XXX vs LatLon.datum.ellipsoid
 
@@ -308,7 +298,7 @@ class Utm(_Base):
         # scale: Karney 2011 Eq 28
         ll.scale = E.e2s2(sin(a)) * hypot1(T) * H * (A0 / E.a / hypot(p, q))
 
-        self._latlon = ll
+        self._latlon = _latlonRef(ll)
         return ll
 
     def toMgrs(self):
@@ -318,10 +308,11 @@ class Utm(_Base):
 
            @returns {Mgrs} The MGRS grid reference.
         '''
-        if self._mgrs is None:
+        m = self._mgrs
+        if m is None:
             from mgrs import toMgrs  # PYCHOK recursive import
-            self._mgrs = toMgrs(self)
-        return self._mgrs
+            self._mgrs = m = toMgrs(self)
+        return m
 
     def toStr(self, prec=0, sep=' ', B=False, cs=False):  # PYCHOK expected
         '''Returns a string representation of this UTM coordinate.
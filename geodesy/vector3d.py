@@ -14,12 +14,13 @@ from bases import _VectorBase
 from utils import EPS2, \
                   degrees90, degrees180, fdot, fsum, \
                   hypot3, isscalar, fStr, len2
+from itertools import repeat
 from math import atan2, cos, hypot, sin
 
 # all public contants, classes and functions
-__all__ = ('Vector3d',  # classes
+__all__ = ('Vector3d', 'Vector3dArray',  # classes
            'sumOf')  # functions
-__version__ = '17.02.01'
+__version__ = '17.02.07'
 
 try:
     _cmp = cmp
@@ -43,13 +44,8 @@ class Vector3d(_VectorBase):
        - motion vector on earth's surface
        - etc.
     '''
-
-    _length = None  # cache length
-    _united = None  # cache normalised, unit
-
-    _x = 0
-    _y = 0
-    _z = 0
+    __slots__ = ('_length', '_united',  # caches
+                 '_x', '_y', '_z')
 
     def __init__(self, x, y, z):
         '''Create a 3-d vector.
@@ -65,6 +61,7 @@ class Vector3d(_VectorBase):
         self._x = x
         self._y = y
         self._z = z
+        self._length = self._united = None
 
     def __add__(self, other):
         return self.plus(other)
@@ -369,10 +366,244 @@ class Vector3d(_VectorBase):
         return self._z
 
 
+class Vector3dArray(_VectorBase):
+    '''Any number of 3-d vectors, held as a list of (x, y, z)
+       3-tuples, with the Vector3d algebra applied to all vectors
+       at once and without creating any Vector3d instances.
+
+       Methods with an other vector accept either a single Vector3d
+       or 3-tuple, applied to each vector or a Vector3dArray of the
+       same length, applied pairwise.  Vector results are returned
+       as Vector3dArray, scalar results as list.
+
+       Iterating over a Vector3dArray yields (x, y, z) 3-tuples, hence
+       a Vector3dArray can be passed to functions and methods taking
+       a sequence of 3-tuples, for example ellipsoidalNvector functions
+       toNvectors and toCartesians, sphericalNvector functions areaOf
+       and meanOf, etc.
+    '''
+    __slots__ = ('_xyzs',)
+
+    def __init__(self, vectors):
+        '''Create an array of 3-d vectors.
+
+           @param {Vector3d[]|(x, y, z)[]} vectors - Sequence or iterable
+                             of Vector3d instances or 3-tuples (x, y, z)
+                             or any other instances with method to3xyz.
+
+           @throws {ValueError} Not a 3-tuple.
+
+           @example
+           a = Vector3dArray(((0.5, 0.5, 0.7071), Vector3d(1, 0, 0)))
+        '''
+        self._xyzs = xyzs = []
+        for v in vectors:
+            if hasattr(v, 'to3xyz'):  # Vector3d, Nvector, LatLon, etc.
+                v = v.to3xyz()
+            elif len(v) != 3:
+                raise ValueError('%s invalid: %r' % ('vector', v))
+            xyzs.append(tuple(v))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _array(self._xyzs[index])
+        return Vector3d(*self._xyzs[index])
+
+    def __iter__(self):
+        return iter(self._xyzs)
+
+    def __len__(self):
+        return len(self._xyzs)
+
+    def _others(self, other, name='other'):
+        # return other as iterable of 3-tuples
+        if isinstance(other, Vector3dArray):
+            if len(other) != len(self):
+                raise ValueError('%s length mismatch: %s vs %s' % (name,
+                                 len(other), len(self)))
+            return other._xyzs
+        elif hasattr(other, 'to3xyz'):
+            return repeat(other.to3xyz(), len(self))
+        elif isinstance(other, tuple) and len(other) == 3:
+            return repeat(other, len(self))
+        raise TypeError('%s invalid: %r' % (name, other))
+
+    def angleTo(self, other, vSign=None):
+        '''Calculate the angle between each vector and an other vector.
+
+           @param {Vector3d|Vector3dArray} other - The other vector(s).
+           @param {Vector3d|Vector3dArray} [vSign=None] - If supplied,
+                             angle is signed, see Vector3d.angleTo.
+
+           @returns {radians[]} Angles between the vectors.
+        '''
+        x = self.cross(other)
+        s = x.length()
+        if vSign is not None:
+            s = [-t if d < 0 else t for t, d in zip(s, x.dot(vSign))]
+        return list(map(atan2, s, self.dot(other)))
+
+    def copy(self):
+        '''Copy this array.
+
+           @returns {Vector3dArray} Copy of this array.
+        '''
+        return _array(list(self._xyzs))
+
+    def cross(self, other):
+        '''Return the cross product of each vector and an other vector.
+
+           @param {Vector3d|Vector3dArray} other - The other vector(s).
+
+           @returns {Vector3dArray} Cross products.
+        '''
+        return _array([(y1 * z2 - z1 * y2,
+                         z1 * x2 - x1 * z2,
+                         x1 * y2 - y1 * x2) for (x1, y1, z1), (x2, y2, z2) in
+                       zip(self._xyzs, self._others(other))])
+
+    def dot(self, other):
+        '''Return the dot product of each vector and an other vector.
+
+           @param {Vector3d|Vector3dArray} other - The other vector(s).
+
+           @returns {number[]} Dot products.
+        '''
+        return [fdot(v, *o) for v, o in zip(self._xyzs, self._others(other))]
+
+    def length(self):
+        '''Return the length (magnitude or norm) of each vector.
+
+           @returns {number[]} Lengths.
+        '''
+        return [hypot3(x, y, z) for x, y, z in self._xyzs]
+
+    def minus(self, other):
+        '''Return the difference of each vector and an other vector.
+
+           @param {Vector3d|Vector3dArray} other - The other vector(s).
+
+           @returns {Vector3dArray} Differences.
+        '''
+        return _array([(x1 - x2, y1 - y2, z1 - z2) for (x1, y1, z1), (x2, y2, z2) in
+                       zip(self._xyzs, self._others(other))])
+
+    def negate(self):
+        '''Return the vectors in opposite direction.
+
+           @returns {Vector3dArray} Negated vectors.
+        '''
+        return _array([(-x, -y, -z) for x, y, z in self._xyzs])
+
+    def plus(self, other):
+        '''Return the sum of each vector and an other vector.
+
+           @param {Vector3d|Vector3dArray} other - The other vector(s).
+
+           @returns {Vector3dArray} Sums.
+        '''
+        return _array([(x1 + x2, y1 + y2, z1 + z2) for (x1, y1, z1), (x2, y2, z2) in
+                       zip(self._xyzs, self._others(other))])
+
+    def rotate(self, axis, theta):
+        '''Rotate each vector by the same angle around the same axis,
+           see Vector3d.rotate.
+
+           @param {Vector3d} axis - The axis being rotated around.
+           @param {number} theta - The angle of rotation (in radians).
+
+           @returns {Vector3dArray} The rotated, unit vectors.
+        '''
+        c = cos(theta)
+        a = axis.unit()  # axis being rotated around
+        b = a.times(1 - c)
+        s = a.times(sin(theta))
+        # quaternion-derived rotation matrix, computed once
+        r = ((a.x * b.x + c,   a.x * b.y - s.z, a.x * b.z + s.y),
+             (a.y * b.x + s.z, a.y * b.y + c,   a.y * b.z - s.x),
+             (a.z * b.x - s.y, a.z * b.y + s.x, a.z * b.z + c))
+        return _array([tuple(fdot(p, *m) for m in r) for p in self.unit()])
+
+    def sumOf(self, Vector=Vector3d, **kwds):
+        '''Vectorially add all vectors in this array.
+
+           @param {Vector3d} [Vector=Vector3d] - Vector class to instantiate.
+           @param kwds - Optional, additional Vector keyword arguments.
+
+           @returns {Vector} Vectorial sum.
+
+           @throws {ValueError} No vectors.
+        '''
+        if not self._xyzs:
+            raise ValueError('no vectors: %r' % (0,))
+        x, y, z = zip(*self._xyzs)
+        return Vector(fsum(x), fsum(y), fsum(z), **kwds)
+
+    def times(self, factor):
+        '''Return the vectors multiplied by a scalar.
+
+           @param {number} factor - Scale factor.
+
+           @returns {Vector3dArray} Scaled vectors.
+        '''
+        if not isscalar(factor):
+            raise TypeError('%s not scalar: %r' % ('factor', factor))
+        return _array([(x * factor, y * factor, z * factor) for x, y, z in self._xyzs])
+
+    def to2lls(self):
+        '''Convert the vectors to (geodetic) lat- and longitudes,
+           see Vector3d.to2ll.
+
+           @returns {(degrees90, degrees180)[]} List of 2-tuples (lat, lon).
+        '''
+        return [(degrees90(atan2(z, hypot(x, y))),
+                 degrees180(atan2(y, x))) for x, y, z in self._xyzs]
+
+    def to3xyzs(self):
+        '''Return the vectors as list of 3-tuples.
+
+           @returns {(x, y, z)[]} List of 3-tuples.
+        '''
+        return list(self._xyzs)
+
+    def toStr(self, prec=5, fmt='(%s)', sep=', '):  # PYCHOK expected
+        '''String representation of the vectors.
+
+           @param {number} [prec=5] - Number of decimal places.
+           @param {string} [fmt='(%s)'] - Format to use for each vector.
+           @param {string} [sep=', '] - Separator between vectors.
+
+           @returns {string} Vectors represented as "[(x, y, z), ...]".
+        '''
+        return '[%s]' % (sep.join(fmt % (fStr(v, prec=prec),) for v in self._xyzs),)
+
+    def unit(self):
+        '''Normalize the vectors to unit length, see Vector3d.unit.
+
+           @returns {Vector3dArray} Normalised vectors.
+        '''
+        def _u(x, y, z):
+            n = hypot3(x, y, z)
+            if n > EPS2 and abs(n - 1) > EPS2:
+                n = 1.0 / n
+                return x * n, y * n, z * n
+            return x, y, z
+
+        return _array([_u(*v) for v in self._xyzs])
+
+
+def _array(xyzs):
+    # create a Vector3dArray from a list of 3-tuples, without checks
+    a = Vector3dArray.__new__(Vector3dArray)
+    a._xyzs = xyzs
+    return a
+
+
 def sumOf(vectors, Vector=Vector3d, **kwds):
     '''Vectorially add a number of vectors.
 
-       @param {Vector3d[]} vectors - Array of Vector3d to be added.
+       @param {Vector3d[]|Vector3dArray} vectors - Array of Vector3d
+                                                   to be added.
        @param {Vector3d} Vector: Vector class to instantiate.
        @param kwds - Optional, additional Vector keyword arguments.
 
@@ -380,6 +611,8 @@ def sumOf(vectors, Vector=Vector3d, **kwds):
 
        @throws {ValueError} No vectors.
     '''
+    if isinstance(vectors, Vector3dArray):
+        return vectors.sumOf(Vector=Vector, **kwds)
     n, vectors = len2(vectors)
     if n < 1:
         raise ValueError('no vectors: %r' & (n,))
@@ -387,6 +620,28 @@ def sumOf(vectors, Vector=Vector3d, **kwds):
                   fsum(v.y for v in vectors),
                   fsum(v.z for v in vectors), **kwds)
 
+
+if __name__ == '__main__':
+
+    from timeit import timeit
+
+    # benchmark Vector3d against Vector3dArray for n vectors
+    from random import random, seed
+    seed(42)
+    n = 10000
+    vs = [Vector3d(random() - 0.5, random() - 0.5, random() - 0.5) for _ in range(n)]
+    va = Vector3dArray(vs)
+    o = Vector3d(0.5, 0.5, 0.7071)
+
+    for t, f in (('Vector3d.angleTo      ', lambda: [v.angleTo(o, vSign=o) for v in vs]),
+                 ('Vector3dArray.angleTo ', lambda: va.angleTo(o, vSign=o)),
+                 ('Vector3d.rotate       ', lambda: [v.rotate(o, 0.5) for v in vs]),
+                 ('Vector3dArray.rotate  ', lambda: va.rotate(o, 0.5)),
+                 ('Vector3d.unit         ', lambda: [v.copy().unit() for v in vs]),
+                 ('Vector3dArray.unit    ', lambda: va.unit())):
+        s = timeit(f, number=10) / 10
+        print('%s: %.3f ms, %.3f us/vector' % (t, s * 1e3, s * 1e6 / n))
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1@Gmail.com
@@ -0,0 +1,60 @@
+
+# -*- coding: utf-8 -*-
+
+# Test streaming CSV conversions.
+
+__version__ = '17.02.07'
+
+if __name__ == '__main__':
+
+    from tests import Tests as _Tests
+
+    from geodesy import convert, Datums
+
+    try:
+        from StringIO import StringIO  # Python 2
+    except ImportError:
+        from io import StringIO
+
+    class Tests(_Tests):
+
+        def testConvert(self):
+            rs = [['48.8582', '2.2945'], ['52.65798', '1.71605']]
+            for to, x in (('utm',    '31 N 448252 5411933'),
+                          ('mgrs',   '31U DQ 48251 11932'),
+                          ('latlon', '48.858200, 2.294500'),
+                          ('lcc',    '5979066, 4620081')):
+                r = list(convert.convertRows([list(r) for r in rs], to=to))
+                self.test('convertRows ' + to, ', '.join(r[0][2:]), x)
+            r = list(convert.convertRows([list(r) for r in rs], to='osgr', errors='blank'))
+            self.test('convertRows osgr', r[0][2:] + r[1][2:], "['', 'TG 51409 13177']")
+
+            r = list(convert.convertRows([['x', '31U DQ 48251 11932']], fro='mgrs', to='utm', cols=[1]))
+            self.test('convertRows mgrs', r[0][2], '31 N 448251 5411932')
+            r = list(convert.convertRows([['52°39′27.2531″N', '1°43′4.5177″E']], to='latlon',
+                                         toDatum=Datums.OSGB36, prec=5))
+            self.test('convertRows toDatum', r[0][2:], "['52.65716', '1.71979']")
+
+            try:
+                t = list(convert.convertRows([['bad', 'row']]))
+            except ValueError as x:
+                t = x
+            self.test('convertRows error', t, "row invalid: ['bad', 'row']")
+
+            i = StringIO('lat\tlon\tname\n48.8582\t2.2945\teiffel\nbad\trow\tx\n')
+            o = StringIO()
+            n = convert.convertCSV(i, o, to='mgrs', delimiter='\t', header=True,
+                                   errors='blank', chunk=1)
+            self.test('convertCSV', n, '2')
+            self.test('convertCSV', o.getvalue().split('\n'),
+                      "['lat\\tlon\\tname\\tmgrs', '48.8582\\t2.2945\\teiffel\\t31U DQ 48251 11932', 'bad\\trow\\tx\\t', '']")
+
+            rs = [[str(40 + i * 0.1), str(i * 0.1)] for i in range(50)]
+            r1 = list(convert.convertRows([list(r) for r in rs], chunk=7))
+            r2 = list(convert.convertRows([list(r) for r in rs], chunk=7, processes=2))
+            self.test('convertRows processes', r1 == r2, 'True')
+
+    t = Tests(__file__, __version__, convert)
+    t.testConvert()
+    t.results()
+    t.exit()
@@ -0,0 +1,63 @@
+
+# -*- coding: utf-8 -*-
+
+# Test ellipsoidal polygon areas and perimeters.
+
+__version__ = '17.02.07'
+
+if __name__ == '__main__':
+
+    from tests import Tests as _Tests
+
+    from geodesy import Datums, ellipsoidalVincenty, fStr, packLatLons, \
+                        PolygonArea, polygonArea, polygonAreas, unpack
+
+    LatLon = ellipsoidalVincenty.LatLon
+
+    class Tests(_Tests):
+
+        def testPolygonArea(self):
+            # reference areas and perimeters by GeographicLib, Karney
+            # 2013, 'Algorithms for geodesics', J. Geodesy 87, 43-55
+            ps = ([(52.2050, 0.1190), (52.2050, 0.1205), (52.2059, 0.1205), (52.2059, 0.1190)],
+                  [(-33.8568, 151.2153), (-33.8560, 151.2160), (-33.8565, 151.2171),
+                   (-33.8575, 151.2166), (-33.8572, 151.2158)],
+                  [(45, 1), (45, 2), (46, 2), (46, 1)])
+            for p, x, r in zip(ps, ((10269.255114, 405.377767),
+                                    (15653.312021, 491.240295),
+                                    (8686379301.7, 378592.222)),
+                               (1e-7, 1e-7, 2e-7)):  # relative
+                A, P = polygonArea(p)
+                self.test('polygonArea', abs(A / x[0] - 1) < r and abs(P / x[1] - 1) < 1e-6, 'True')
+                # same area and perimeter either direction, closed
+                self.test('polygonArea', polygonArea(p[::-1] + p[-1:]) == (A, P), 'True')
+
+            p = PolygonArea(Datums.WGS84)
+            self.test('PolygonArea', p.toStr(), 'n=0, area=0.0, perimeter=0.0')
+            for t in ps[0]:
+                p.add(*t)
+            self.test('PolygonArea', repr(p), 'PolygonArea(n=4, area=10269.255, perimeter=405.378)')
+            p.reset()
+            self.test('addPoints', p.addPoints(LatLon(*t) for t in ps[1]), '5')
+            self.test('area', fStr(p.area, prec=4), '15653.312')
+            self.test('datum', p.datum is Datums.WGS84, 'True')
+
+            # polygon around the north pole, 30 degree edges
+            A, P = polygonArea([(80, i) for i in range(0, 360, 30)])
+            self.test('polygonArea', fStr((A / 3736196234080.8, P / 6904500.875), prec=5), '1.00001, 1.0')
+
+            # batch, flat and packed vertices with offsets
+            lls = [LatLon(*t) for t in ps[0] + ps[1] + ps[1][:1]]
+            t = polygonAreas(lls, [0, 4])
+            self.test('polygonAreas', fStr(t[0] + t[1], prec=3), '10269.255, 405.378, 15653.312, 491.24')
+            t = polygonAreas(unpack(packLatLons(lls, height=False)), [0, 4, 10])
+            self.test('polygonAreas', fStr(t[1], prec=3), '15653.312, 491.24')
+
+            # Airy 1830 ellipsoid, 10267.347558, 405.340093
+            t = polygonArea(ps[0], datum=Datums.OSGB36)
+            self.test('polygonArea', fStr(t, prec=4), '10267.3476, 405.3401')
+
+    t = Tests(__file__, __version__)
+    t.testPolygonArea()
+    t.results()
+    t.exit()
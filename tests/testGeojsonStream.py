@@ -0,0 +1,92 @@
+
+# -*- coding: utf-8 -*-
+
+# Test streaming GeoJSON reader and writer.
+
+__version__ = '17.02.07'
+
+if __name__ == '__main__':
+
+    from tests import Tests as _Tests
+
+    from geodesy import coordinatesOf, datumConverter, Datums, \
+                        ellipsoidalVincenty, fStr, geojsonStream, \
+                        mapFeatures, readFeatures, writeFeatures
+
+    from io import StringIO
+
+    LatLon = ellipsoidalVincenty.LatLon
+
+    class Tests(_Tests):
+
+        def testGeojsonStream(self):
+            fc = u'''{"type": "FeatureCollection", "name": "test",
+                "features": [
+                  {"type": "Feature", "properties": {"id": 1},
+                   "geometry": {"type": "Point", "coordinates": [-0.0016, 51.4778, 12.345]}},
+                  {"type": "Feature", "properties": {"id": 2},
+                   "geometry": {"type": "Polygon", "coordinates":
+                     [[[0, 0], [1, 0], [1, 1], [0, 0]], [[0.2, 0.2], [0.4, 0.2], [0.2, 0.4], [0.2, 0.2]]]}},
+                  {"type": "Feature", "properties": null,
+                   "geometry": {"type": "GeometryCollection", "geometries": [
+                     {"type": "Point", "coordinates": [1, 2]},
+                     {"type": "MultiLineString", "coordinates": [[[3, 4], [5, 6]], [[7, 8]]]}]}}
+                ], "bbox": [0, 0, 1, 1]}'''
+            for c in (7, 65536):  # small chunks, many refills
+                fs = list(readFeatures(StringIO(fc), chunk=c))
+                self.test('readFeatures(%s)' % (c,), len(fs), '3')
+                self.test('readFeatures(%s)' % (c,), fs[0]['geometry']['coordinates'], '[-0.0016, 51.4778, 12.345]')
+                self.test('readFeatures(%s)' % (c,), [f['properties'] for f in fs], "[{'id': 1}, {'id': 2}, None]")
+
+            self.test('coordinatesOf', len(coordinatesOf(fs[1]['geometry'])), '8')
+            self.test('coordinatesOf', coordinatesOf(fs[2]['geometry']), '[[1, 2], [3, 4], [5, 6], [7, 8]]')
+            self.test('coordinatesOf', coordinatesOf(None), '[]')
+
+            nd = u'{"type":"Feature","properties":{},"geometry":{"type":"Point","coordinates":[1,2]}}\n' \
+                 u'{"type":"LineString","coordinates":[[1,2],[3,4]]}\n\n' \
+                 u'{"type":"FeatureCollection","features":[]}\n'
+            fs = list(readFeatures(StringIO(nd), chunk=5))
+            self.test('readFeatures(ndjson)', len(fs), '2')
+            self.test('readFeatures(ndjson)', fs[1]['geometry']['type'], 'LineString')
+
+            # top-level array, streamed element by element
+            a = u'[{"type":"Feature","properties":{"id":1},"geometry":{"type":"Point","coordinates":[1,2]}},' \
+                u' {"type":"LineString","coordinates":[[1,2],[3,4]]}, [], 3,' \
+                u' {"type":"FeatureCollection","features":[{"type":"Feature","properties":{"id":4},"geometry":null}]}]'
+            for c in (5, 65536):
+                fs = list(readFeatures(StringIO(a), chunk=c))
+                self.test('readFeatures(array)', [f['geometry'] and f['geometry']['type'] for f in fs], "['Point', 'LineString', None]")
+                self.test('readFeatures(array)', fs[2]['properties'], "{'id': 4}")
+            t = readFeatures(StringIO(a[:-120] + u'{"type": }]'), chunk=5)  # invalid after the first
+            self.test('readFeatures(array)', next(t)['properties'], "{'id': 1}")
+            self.test('readFeatures(array)', list(readFeatures(StringIO(u'[]'))), '[]')
+
+            try:
+                t = list(readFeatures(StringIO(u'{"type": "Feature", "geometry"}')))
+            except ValueError as x:
+                t = str(x).split(':')[0]
+            self.test('readFeatures(invalid)', t, 'GeoJSON invalid')
+
+            fs = list(readFeatures(StringIO(fc)))
+            o = StringIO()
+            self.test('writeFeatures', writeFeatures(fs, o), '3')
+            self.test('writeFeatures', list(readFeatures(StringIO(o.getvalue()))) == fs, 'True')
+            o = StringIO()
+            self.test('writeFeatures(ndjson)', writeFeatures(fs, o, ndjson=True), '3')
+            self.test('writeFeatures(ndjson)', len(o.getvalue().splitlines()), '3')
+
+            def _n(props, old, new):
+                props['n'] = len(new)
+
+            gs = list(mapFeatures(fs, datumConverter(Datums.WGS84, Datums.OSGB36), _n))
+            p = LatLon(51.4778, -0.0016, 12.345).convertDatum(Datums.OSGB36)
+            q = gs[0]['geometry']['coordinates']
+            self.test('mapFeatures', fStr(q, prec=6), fStr((p.lon, p.lat, p.height), prec=6))
+            self.test('mapFeatures', gs[2]['properties'], "{'n': 4}")
+            self.test('mapFeatures', gs[2]['geometry']['geometries'][1]['coordinates'][1][0][0] != 7, 'True')
+            self.test('mapFeatures', fs[0]['geometry']['coordinates'], '[-0.0016, 51.4778, 12.345]')  # unchanged
+
+    t = Tests(__file__, __version__, geojsonStream)
+    t.testGeojsonStream()
+    t.results()
+    t.exit()
@@ -0,0 +1,104 @@
+
+# -*- coding: utf-8 -*-
+
+# Test packed point batches.
+
+__version__ = '17.02.07'
+
+if __name__ == '__main__':
+
+    from tests import Tests as _Tests
+
+    from os import remove, rmdir
+    from os.path import join
+    from tempfile import mkdtemp
+
+    from geodesy import Datums, ellipsoidalVincenty, F_D, sphericalTrigonometry, \
+                        fStr, pack, PackedPoints, packLatLons, packMgrs, \
+                        packUtms, PointStore, storePoints, to3xyzs, \
+                        unpack, unpackLatLons, unpackMgrs, unpackUtms
+
+    LatLon = ellipsoidalVincenty.LatLon
+
+    class Tests(_Tests):
+
+        def testPacked(self):
+            b = pack([(52.205, 0.119, 10), (48.857, 2.351, -5)], datum=Datums.OSGB36)
+            self.test('pack', len(b), '80')
+            p = unpack(b)
+            self.test('unpack', repr(p), 'PackedPoints(layout=\'llh\', typecode=\'d\', datum=\'OSGB36\', len=2)')
+            self.test('unpack', fStr(p[1], prec=3), '48.857, 2.351, -5.0')
+            self.test('unpack', fStr(p[-2], prec=3), '52.205, 0.119, 10.0')
+            self.test('unpack', len(p[:]), '2')
+            self.test('unpack', p.datum is Datums.OSGB36, 'True')
+            self.test('unpack', ', '.join(p.fields), 'lat, lon, height')
+            self.test('unpack', len(p.floats), '6')
+
+            p = PackedPoints(bytearray(pack([(1, 2)], layout='ll', typecode='f')))
+            self.test('PackedPoints', list(p), '[(1.0, 2.0)]')
+            self.test('PackedPoints', p.datum, 'None')
+
+            for x in (b[:40], b'GDPy' + b[4:]):
+                try:
+                    unpack(x)
+                    t = None
+                except ValueError as e:
+                    t = str(e).split(':')[0]
+                self.test('ValueError', t, 'records truncated' if len(x) == 40 else 'header invalid')
+
+            ps = [LatLon(52.205, 0.119, 10, datum=Datums.NAD83),
+                  LatLon(-48.857, -2.351, datum=Datums.NAD83)]
+            qs = unpackLatLons(packLatLons(ps), LatLon)
+            self.test('unpackLatLons', qs[0].equals(ps[0]) and qs[1].equals(ps[1]), 'True')
+            self.test('unpackLatLons', qs[0].height, '10.0')
+            self.test('unpackLatLons', qs[1].datum is Datums.NAD83, 'True')
+            qs = unpackLatLons(packLatLons(ps, height=False, typecode='f'), LatLon)
+            self.test('unpackLatLons', qs[0].toStr(F_D, prec=4), '52.205°N, 000.119°E')
+
+            try:
+                packLatLons(ps + [LatLon(0, 0)])
+                t = None
+            except ValueError as e:
+                t = str(e).split(':')[0]
+            self.test('ValueError', t, 'datum mismatch')
+
+            S = sphericalTrigonometry.LatLon
+            qs = unpackLatLons(packLatLons([S(1, 2)]), S)
+            self.test('unpackLatLons', qs[0].datum is Datums.Sphere, 'True')
+
+            us = [p.toUtm() for p in ps]
+            vs = unpackUtms(packUtms(us))
+            self.test('unpackUtms', vs[0].toStr(prec=3, B=True), us[0].toStr(prec=3, B=True))
+            self.test('unpackUtms', vs[1].toStr(prec=3, B=True), us[1].toStr(prec=3, B=True))
+            self.test('unpackUtms', vs[1].datum is Datums.NAD83, 'True')
+
+            ms = [u.toMgrs() for u in us]
+            ns = unpackMgrs(packMgrs(ms))
+            self.test('unpackMgrs', ns[0], str(ms[0]))
+            self.test('unpackMgrs', ns[1], str(ms[1]))
+
+            d = mkdtemp()
+            f = join(d, 'points.bin')
+            n = storePoints(f, ((i, -i, i * 10, 1e5 + i, 2e5 + i) for i in range(10)),
+                            layout='llhen', datum=Datums.NAD83, chunk=4)
+            self.test('storePoints', n, '10')
+            with PointStore(f) as s:
+                self.test('PointStore', len(s), '10')
+                self.test('PointStore', s.datum is Datums.NAD83, 'True')
+                self.test('PointStore', s[9], '(9.0, -9.0, 90.0, 100009.0, 200009.0)')
+                self.test('PointStore', s[2:4], '[(2.0, -2.0, 20.0, 100002.0, 200002.0), (3.0, -3.0, 30.0, 100003.0, 200003.0)]')
+                self.test('PointStore', [len(c) for c in s.chunks(4)], '[4, 4, 2]')
+                self.test('PointStore', list(s.column('northing'))[-3:], '[200007.0, 200008.0, 200009.0]')
+                ps = s.toLatLons(LatLon, 8)
+                self.test('PointStore', ps[0].toStr(F_D, prec=1), '08.0°N, 008.0°W, +80.00m')
+                self.test('PointStore', ps[1].datum is Datums.NAD83, 'True')
+                xyzs = to3xyzs((r[:3] for r in next(s.chunks(2))), datum=s.datum)
+                self.test('PointStore', fStr(xyzs[1], prec=0), '6376211, -111297, 110569')
+            self.test('PointStore', s.closed, 'True')
+            remove(f)
+            rmdir(d)
+
+    t = Tests(__file__, __version__)
+    t.testPacked()
+    t.results()
+    t.exit()
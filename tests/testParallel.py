@@ -0,0 +1,67 @@
+
+# -*- coding: utf-8 -*-
+
+# Test parallel conversions.
+
+__version__ = '17.02.07'
+
+if __name__ == '__main__':
+
+    from tests import Tests as _Tests
+
+    import pickle
+
+    from geodesy import Conics, Datums, ellipsoidalVincenty, fStr, \
+                        packLatLons, PackedPoints, parallelBatch, \
+                        parallelMap, to3xyzs, unpack
+
+    LatLon = ellipsoidalVincenty.LatLon
+
+    class _Packed(PackedPoints):
+        # count slices, records[:1] only if copied as floats
+        slices = 0
+
+        def __getitem__(self, index):
+            if isinstance(index, slice):
+                _Packed.slices += 1
+            return PackedPoints.__getitem__(self, index)
+
+    class Tests(_Tests):
+
+        def testParallel(self):
+            for d in (Datums.OSGB36, Conics.WRF_Lb):
+                self.test('pickle', pickle.loads(pickle.dumps(d)) is d, 'True')
+
+            llhs = [(50 + i * 0.01, -5 + i * 0.02, i) for i in range(300)]
+            xyzs = to3xyzs(llhs, Datums.NAD27)
+            for p in (1, 2):
+                t = parallelBatch(to3xyzs, llhs, args=(Datums.NAD27,),
+                                  chunk=32, processes=p, serial=100)
+                self.test('parallelBatch', t == xyzs, 'True')
+            t = parallelBatch(to3xyzs, unpack(packLatLons([LatLon(*llh) for llh in llhs])),
+                              chunk=64, processes=2, serial=100)
+            self.test('parallelBatch', t == to3xyzs(llhs), 'True')
+            b = packLatLons([LatLon(*llh) for llh in llhs])
+            t = parallelBatch(to3xyzs, _Packed(b), chunk=64, processes=2, serial=100)
+            self.test('parallelBatch', t == to3xyzs(llhs), 'True')
+            self.test('slices', _Packed.slices, '1')
+            self.test('parallelBatch', len(parallelBatch(to3xyzs, llhs[:3])), '3')
+
+            lls = [LatLon(*llh, datum=Datums.OSGB36) for llh in llhs]
+            us = [ll.toUtm() for ll in lls]
+            for p in (1, 2):
+                t = parallelMap('toUtm', lls, chunk=50, processes=p, serial=10)
+                self.test('parallelMap', [u.toStr(prec=3) for u in t] ==
+                                         [u.toStr(prec=3) for u in us], 'True')
+                self.test('parallelMap', t[0].datum is Datums.OSGB36, 'True')
+            t = parallelMap('convertDatum', iter(lls), args=(Datums.WGS84,),
+                            processes=2, serial=10)
+            self.test('parallelMap', t[-1].toStr(prec=4), lls[-1].convertDatum(Datums.WGS84).toStr(prec=4))
+            self.test('parallelMap', t[-1].datum is Datums.WGS84, 'True')
+            t = parallelMap(fStr, llhs, args=(2,), processes=2, serial=10)
+            self.test('parallelMap', t[-1], '52.99, 0.98, 299.0')
+
+    t = Tests(__file__, __version__)
+    t.testParallel()
+    t.results()
+    t.exit()
@@ -0,0 +1,71 @@
+
+# -*- coding: utf-8 -*-
+
+# Test polyline simplification.
+
+__version__ = '17.02.07'
+
+if __name__ == '__main__':
+
+    from tests import Tests as _Tests
+
+    from geodesy import Route, simplifyDP, simplifyStream, simplifyVW, \
+                        sphericalNvector, sphericalTrigonometry
+    from math import cos
+    from random import gauss, seed
+
+    class Tests(_Tests):
+
+        def testSimplify(self, LatLon):
+            # zig-zag, vertex 1 is 111.195 meter off the equator
+            z = [(0, 0), (0.001, 1), (0, 2), (0.5, 3), (0, 4)]
+            for t, x in ((0, '[0, 1, 2, 3, 4]'), (100, '[0, 1, 2, 3, 4]'),
+                         (120, '[0, 2, 3, 4]'), (50000, '[0, 3, 4]'), (60000, '[0, 4]')):
+                self.test('simplifyDP', simplifyDP(z, t, indices=True), x)
+            for a, x in ((1e6, '[0, 1, 2, 3, 4]'), (1e8, '[0, 2, 3, 4]'), (7e9, '[0, 4]')):
+                self.test('simplifyVW', simplifyVW(z, a, indices=True), x)
+            self.test('simplifyDP', simplifyDP(z, 0.01, radius=1, indices=True), '[0, 4]')
+
+            # same points returned
+            ps = [LatLon(*ll) for ll in z]
+            t = simplifyDP(ps, 1000)
+            self.test('simplifyDP', t == [ps[0], ps[2], ps[3], ps[4]], 'True')
+            t = simplifyVW(ps, 1e8)
+            self.test('simplifyVW', t == [ps[0], ps[2], ps[3], ps[4]], 'True')
+            t = simplifyStream(iter(ps), 1000)
+            self.test('simplifyStream', type(t).__name__, 'generator')
+            self.test('simplifyStream', list(t) == [ps[0], ps[2], ps[3], ps[4]], 'True')
+            self.test('simplifyStream', list(simplifyStream(z[:1], 1)), '[(0, 0)]')
+            self.test('simplifyStream', list(simplifyStream(z, 60000, window=2)), '[(0, 0), (0, 2), (0, 4)]')
+            self.test('simplifyDP', simplifyDP(z[:2], 1e6), str(z[:2]))
+
+            # noisy track, each removed vertex within
+            # the tolerance of the simplified track
+            seed(42)
+            a, b, lls = 52.0, 0.0, []
+            for i in range(2000):
+                a += 1e-5 + gauss(0, 2e-6)
+                b += 1e-5 * cos(i * 1e-2) + gauss(0, 2e-6)
+                lls.append((a, b))
+            for s in (simplifyDP(lls, 2, indices=True),
+                      [lls.index(p) for p in simplifyStream(lls, 2)]):
+                self.test('kept', s[0] == 0 and s[-1] == len(lls) - 1 and len(s) < len(lls) // 4, 'True')
+                r = Route([lls[i] for i in s])
+                d = max(abs(d) for _, d, _ in r.nearestToMany(lls))
+                self.test('within', d <= 2, 'True')
+
+            for f, t, x in ((simplifyDP, -1, 'tolerance invalid: -1'),
+                            (simplifyVW, -1, 'area invalid: -1'),
+                            (simplifyStream, 1, 'window invalid: 1')):
+                try:
+                    list(f(z, t) if t < 0 else f(z, 1, window=t))
+                    t = None
+                except ValueError as e:
+                    t = e
+                self.test('ValueError', t, x)
+
+    t = Tests(__file__, __version__)
+    t.testSimplify(sphericalNvector.LatLon)
+    t.testSimplify(sphericalTrigonometry.LatLon)
+    t.results()
+    t.exit()
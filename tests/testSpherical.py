@@ -7,7 +7,35 @@ __version__ = '17.02.01'
 
 if __name__ == '__main__':
 
-    from tests import Tests
+    from tests import Tests as _Tests
+
+    from geodesy import fStr
+
+    class Tests(_Tests):
+
+        def testBatch(self, T):
+            p = T.LatLon(52.205, 0.119)
+            q = T.LatLon(48.857, 2.351)
+            r = T.LatLon(51.5, -0.1)
+            lls = [(48.857, 2.351), (51.5, -0.1)]
+            ds = T.distances(p, lls)
+            self.test('distances', ds == [p.distanceTo(q), p.distanceTo(r)], 'True')
+            self.test('distances', T.distances(lls, (52.205, 0.119), radius=1)[0] * T.R_M, '%.6f' % (ds[0],), '%.6f')
+            self.test('distances', T.distances([p, q], [q, r]) == [p.distanceTo(q), q.distanceTo(r)], 'True')
+            # antipodal, rounding may push the haversine above 1
+            d = T.distances([(8, -179), (52.205, 0.119)], [(-8, 1), (-52.205, -179.881)], radius=1)
+            self.test('distances', fStr(d, prec=9), '3.141592654, 3.141592654')
+            self.test('bearings', T.bearings(p, [q, r]) == [p.bearingTo(q), p.bearingTo(r)], 'True')
+            self.test('finalBearings', T.finalBearings(p, [q, r]) == [p.finalBearingTo(q), p.finalBearingTo(r)], 'True')
+            m = T.midpoints(lls, p)
+            self.test('midpoints', T.LatLon(*m[0]), str(q.midpointTo(p)))
+            self.test('midpoints', len(m), '2')
+            self.test('midpoints', ', '.join('%.6f' % x for x in T.midpoints(p, q)[0]), '50.536327, 1.274614')
+            try:
+                t = T.distances(lls, [p])
+            except ValueError as x:
+                t = x
+            self.test('distances', t, 'points mismatch: 2 vs 1')
 
     from geodesy import sphericalNvector as N
     t = Tests(__file__, __version__, N)
@@ -20,6 +48,7 @@ if __name__ == '__main__':
     t = Tests(__file__, __version__, T)
     t.testLatLon(T.LatLon)
     t.testSpherical(T.LatLon)
+    t.testBatch(T)
     t.results()
     t.exit()
 
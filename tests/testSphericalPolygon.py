@@ -0,0 +1,141 @@
+
+# -*- coding: utf-8 -*-
+
+# Test prepared spherical polygons.
+
+__version__ = '17.02.07'
+
+if __name__ == '__main__':
+
+    from tests import Tests as _Tests
+
+    from geodesy import areasOf, areEnclosedBy, fStr, isEnclosedBy, \
+                        packLatLons, perimetersOf, PolygonIndex, \
+                        PreparedPolygon, sphericalNvector, \
+                        sphericalTrigonometry, unpack
+
+    class Tests(_Tests):
+
+        def testPreparedPolygon(self, LatLon):
+            b = LatLon(45, 1), LatLon(45, 2), LatLon(46, 2), LatLon(46, 1)
+            pp = PreparedPolygon(b + b[:1])
+            self.test('PreparedPolygon', repr(pp), 'PreparedPolygon(n=4, box=(45.0, 1.0, 46.00109, 2.0), convex=True)')
+            self.test('contains', pp.contains(LatLon(45.1, 1.1)), 'True')
+            self.test('contains', pp.contains((46.0005, 1.5)), 'True')  # bulge
+            self.test('contains', pp.contains((46.0015, 1.5)), 'False')
+            self.test('contains', pp.contains((-45.5, -178.5)), 'False')  # antipode
+            ps = [LatLon(44.95 + i * 0.1, 0.55 + i * 0.1) for i in range(20)]
+            self.test('containsMany', pp.containsMany(ps) ==
+                                      [p.isEnclosedBy(b) for p in ps], 'True')
+            c, r = pp.cap
+            self.test('cap', fStr(c + (r,), prec=6), '0.700656, 0.018347, 0.713264, 0.010688')
+
+            # across the antimeridian, around the north pole
+            pp = PreparedPolygon([(10, 170), (10, -170), (-10, -170), (-10, 170)])
+            self.test('box', fStr(pp.box, prec=3), '-10.151, 170.0, 10.151, -170.0')
+            self.test('containsMany', pp.containsMany([(0, 180), (0, -175), (5, 175), (0, 160), (0, 0)]),
+                                      '[True, True, True, False, False]')
+            pp = PreparedPolygon([(80, 0), (80, 120), (80, -120)])
+            self.test('box', fStr(pp.box, prec=1), '80.0, -180.0, 90.0, 180.0')
+            self.test('containsMany', pp.containsMany([(89, 45), (85, 300), (79, 0)]), '[True, True, False]')
+
+            # concave
+            pp = PreparedPolygon([(0, 0), (10, 10), (0, 20), (5, 10)])
+            self.test('convex', pp.convex, 'False')
+            self.test('containsMany', pp.containsMany([(2, 10), (7, 10), (3, 4), (3, 16), (0.5, 1.5)]),
+                                      '[False, True, True, True, False]')
+
+            # concave, across the antimeridian
+            c = [LatLon(0, 170), LatLon(10, -170), LatLon(0, -175), LatLon(-10, -170)]
+            self.test('isEnclosedBy', isEnclosedBy(LatLon(0, -178), c), 'True')
+            self.test('isEnclosedBy', isEnclosedBy((0, -172), c), 'False')
+            self.test('areEnclosedBy', areEnclosedBy([(5, -172), (0, 180), (0, 160)], c), '[False, True, False]')
+            self.test('areEnclosedBy', areEnclosedBy([(5, -172), (0, 180), (0, 160)], c[::-1]), '[False, True, False]')
+
+            # concave, around a pole, either direction
+            for r in ([(-80 + (i % 2) * 5, i * 30) for i in range(12)],
+                      [(80 - (i % 2) * 5, -i * 30) for i in range(12)]):
+                pp = PreparedPolygon(r)
+                self.test('north', pp.north, str(r[0][0] > 0))
+                self.test('convex', pp.convex, 'False')
+                t = areEnclosedBy([(-89, 0), (-77, 15), (-77, 30), (0, 0), (77, 15), (77, 30), (89, 0)], pp)
+                self.test('areEnclosedBy', t, '[True, False, True, False, False, False, False]' if r[0][0] < 0 else
+                                              '[False, False, False, False, False, True, True]')
+
+            try:
+                PreparedPolygon(b[:2])
+                t = None
+            except ValueError as x:
+                t = x
+            self.test('ValueError', t, 'too few polygon points: 2')
+
+        def testPolygonIndex(self, LatLon):
+            ps = {'A': [LatLon(45, 1), LatLon(45, 2), LatLon(45.5, 1.5), LatLon(46, 2), LatLon(46, 1)],
+                  'B': [(45.5, 1.2), (45.5, 3), (47, 3), (47, 1.2)],
+                  'C': [(-80, 0), (-80, 120), (-80, -120)],
+                  'D': [(0, 170), (10, -170), (0, -175), (-10, -170)]}
+            qs = [LatLon(45.2, 1.5), LatLon(45.7, 1.5), LatLon(45.6, 1.8), (46.5, 2.5),
+                  (-85, 3), (-89.9, 200), (0, 180), (0, -180), (0, -172), (0, 0)]
+            rs = [sorted(k for k, p in ps.items() if isEnclosedBy(q, p)) for q in qs]
+            self.test('containing', rs, "[['A'], ['A', 'B'], ['B'], ['B'], ['C'], ['C'], ['D'], ['D'], [], []]")
+            for c in (None, 0.25, 7, 180):
+                pi = PolygonIndex(ps, cell=c)
+                self.test('containingMany', [sorted(ks) for ks in pi.containingMany(qs)] == rs, 'True')
+            self.test('PolygonIndex', repr(pi), 'PolygonIndex(n=4, cell=180.0, cells=2)')
+
+            pi = PolygonIndex([ps[k] for k in sorted(ps.keys())], cell=0.1)
+            self.test('cell', pi.cell, '0.1')
+            self.test('containing', pi.containing(qs[1]), '[0, 1]')
+            self.test('containing', pi.containing((0, 540)), '[3]')
+            self.test('polygon', pi.polygon(2).north, 'False')
+            pp = pi.add('E', PreparedPolygon([(85, 0), (85, 120), (85, -120)]))
+            self.test('add', pi.containing((89, 45)), "['E']")
+            self.test('polygon', pi.polygon('E') is pp, 'True')
+            self.test('len', len(pi), '5')
+
+            for x, t in ((KeyError, lambda: pi.polygon('F')),
+                         (ValueError, lambda: PolygonIndex(cell=0))):
+                try:
+                    t()
+                    t = None
+                except x as e:
+                    t = e
+                self.test(x.__name__, t, "'F'" if x is KeyError else 'cell invalid: 0')
+
+        def testAreas(self, LatLon):
+            lls = [LatLon(0, 0), LatLon(0, 1), LatLon(1, 1), LatLon(1, 0),
+                   LatLon(10, 10), LatLon(10, 11), LatLon(11, 10), LatLon(10, 10)]
+            self.test('areasOf', fStr(areasOf(lls, [0, 4]), prec=1), '12364031798.5, 6088546207.1')
+            self.test('areasOf', fStr(areasOf(lls, (0, 4, 8), radius=1), prec=9), '0.00030461, 0.000150002')
+            self.test('areasOf', fStr(areasOf(unpack(packLatLons(lls, height=False)), [0, 4]), prec=1), '12364031798.5, 6088546207.1')
+            self.test('perimetersOf', fStr(perimetersOf(lls, [0, 4]), prec=1), '444763.4, 376642.2')
+            self.test('perimetersOf', fStr(perimetersOf(lls[::-1], [0, 4]), prec=1), '376642.2, 444763.4')
+            d = sum(a.distanceTo(b) for a, b in zip(lls[:4], lls[1:4] + lls[:1]))
+            self.test('perimetersOf', fStr(d, prec=1), '444763.4')
+
+            # small parcel, either direction, around and opposite the poles
+            p = [(50, 1), (50, 1.001), (50.001, 1.001), (50.001, 1)]
+            self.test('areasOf', fStr(areasOf(p + p[::-1], [0, 4]), prec=3), '7947.566, 7947.566')  # R**2 * dlon * dsin(lat)
+            r = [(80, i) for i in range(0, 360, 30)]
+            t = areasOf(r + r[::-1] + [(-a, b) for a, b in r], [0, 12, 24], radius=1)
+            self.test('areasOf', fStr(t, prec=6), '0.091246, 0.091246, 0.091246')
+            t = areasOf([(0, 0), (0, 90), (90, 0)], [0], radius=1)
+            self.test('areasOf', fStr(t, prec=6), '1.570796')  # octant, PI / 2
+
+            for t in ((0, 2), (0, 9)):
+                try:
+                    areasOf(lls, t)
+                    x = None
+                except ValueError as e:
+                    x = e
+                self.test('ValueError', x, 'too few polygon points: 2' if t[1] == 2 else 'offsets invalid: 0..9')
+
+    t = Tests(__file__, __version__)
+    t.testPreparedPolygon(sphericalNvector.LatLon)
+    t.testPreparedPolygon(sphericalTrigonometry.LatLon)
+    t.testPolygonIndex(sphericalNvector.LatLon)
+    t.testPolygonIndex(sphericalTrigonometry.LatLon)
+    t.testAreas(sphericalNvector.LatLon)
+    t.testAreas(sphericalTrigonometry.LatLon)
+    t.results()
+    t.exit()
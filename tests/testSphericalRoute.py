@@ -0,0 +1,148 @@
+
+# -*- coding: utf-8 -*-
+
+# Test spherical routes.
+
+__version__ = '17.02.07'
+
+if __name__ == '__main__':
+
+    from tests import Tests as _Tests
+
+    from geodesy import fStr, intersectionsOf, R_M, radians, Route, \
+                        Snapper, sphericalNvector, sphericalTrigonometry
+
+    class Tests(_Tests):
+
+        def testRoute(self, LatLon):
+            bs = LatLon(53.3206, -1.7297), LatLon(53.1887, 0.1334), LatLon(52.205, 0.119)
+            r = Route(bs)
+            self.test('Route', repr(r), 'Route(n=3, length=234188.002)')
+            self.test('len', len(r), '3')
+            self.test('length', fStr(r.length, prec=3), fStr(bs[0].distanceTo(bs[1]) +
+                                                              bs[1].distanceTo(bs[2]), prec=3))
+
+            p = LatLon(53.2611, -0.7972)
+            i, xt, at = r.nearestTo(p)
+            self.test('nearestTo', i, '0')
+            self.test('crossTrack', fStr(xt, prec=1), fStr(p.crossTrackDistanceTo(bs[0], bs[1]), prec=1))
+            self.test('alongTrack', fStr(at, prec=1), '62331.6')
+
+            # abeam the second segment, right of the route
+            p = LatLon(52.7, 0.3)
+            i, xt, at = r.nearestTo(p)
+            self.test('nearestTo', i, '1')
+            self.test('crossTrack', fStr(xt, prec=3), fStr(p.crossTrackDistanceTo(bs[1], bs[2]), prec=3))
+            self.test('alongTrack', fStr(at, prec=1), '179026.3')
+
+            # beyond the route ends and at a corner
+            t = r.nearestToMany([(53.5, -2), (53.19, 0.2), (52, 0.1), bs[1]])
+            self.test('nearestToMany', [i for i, _, _ in t], '[0, 0, 1, 0]')
+            self.test('crossTrack', fStr([xt for _, xt, _ in t], prec=3),
+                      fStr((-LatLon(53.5, -2).distanceTo(bs[0]), -LatLon(53.19, 0.2).distanceTo(bs[1]),
+                            LatLon(52, 0.1).distanceTo(bs[2]), 0.0), prec=3))
+            self.test('alongTrack', fStr([at for _, _, at in t], prec=1), '0.0, 124801.1, 234188.0, 124801.1')
+
+            # a few meter off, abeam and beyond the ends, to the micrometer
+            r = Route([(0, 0), (0, 1)])
+            t = r.nearestToMany([(2e-5, 0.5), (-2e-5, 0.5), (0, -2e-5), (1.5e-5, 1 + 2e-5)])
+            d = radians(2e-5) * R_M
+            self.test('crossTrack', fStr([xt for _, xt, _ in t], prec=6), fStr((-d, d, d, -d * 1.25), prec=6))
+
+            # across the antimeridian, in radians
+            r = Route([(0, 179), (0, -179), (1, -179)], radius=1)
+            t = r.nearestToMany([(0.5, 180), (-1, 179.5), (0.5, -178)])
+            self.test('nearestToMany', fStr([x for t3 in t for x in t3], prec=6),
+                      '0.0, -0.008727, 0.017453, 0.0, 0.017453, 0.008727, 1.0, 0.017453, 0.043635')
+
+            try:
+                Route(bs[:1])
+                t = None
+            except ValueError as x:
+                t = x
+            self.test('ValueError', t, 'too few route points: 1')
+
+        def testSnapper(self, LatLon):
+            rs = {'A': [LatLon(53.3206, -1.7297), LatLon(53.1887, 0.1334), LatLon(52.205, 0.119)],
+                  'B': [(0, 179), (0, -179), (1, -179)]}
+            p = LatLon(53.2611, -0.7972)
+            for c in (None, 0.01, 1, 180):
+                s = Snapper(rs, distance=1000, cell=c)
+                t = s.snap(p)
+                self.test('snap', fStr(t[2:], prec=3), '53.258, -0.798, -307.55, 62331.579')
+                self.test('snap', t[:2], "('A', 0)")
+            self.test('Snapper', repr(s), 'Snapper(n=2, distance=1000.0, cell=180.0, cells=2)')
+
+            _, xt, at = s.route('A').nearestTo(p)
+            self.test('route', fStr((xt, at), prec=3), fStr(t[4:], prec=3))
+            self.test('crossTrack', fStr(xt, prec=2), fStr(p.crossTrackDistanceTo(*rs['A'][:2]), prec=2))
+            self.test('distanceTo', fStr(p.distanceTo(LatLon(*t[2:4])), prec=2), '307.55')
+
+            # across the antimeridian, near a corner and too far
+            s = Snapper(rs, distance=1000)
+            self.test('cell', fStr(s.cell, prec=6), '1.893217')
+            t = s.snapMany([(0.001, 180), (0.005, -179.5), (0.5, -179.005), (52.7, 0.3), (10, 10)])
+            self.test('snapMany', type(t).__name__, 'generator')
+            t = list(t)
+            self.test('snapMany', [x and x[:2] for x in t], "[('B', 0), ('B', 0), ('B', 1), None, None]")
+            self.test('snapMany', fStr(t[1][2:], prec=3), '0.0, -179.5, -555.975, 166792.62')
+            self.test('snapMany', fStr(t[2][2:], prec=3), '0.5, -179.0, -555.954, 277987.7')
+
+            s.add('C', [(52.7, 0.29), (52.8, 0.31)])
+            self.test('add', s.snap((52.7, 0.3))[:2], "('C', 0)")
+            self.test('len', len(s), '3')
+
+            for x, t, e in ((KeyError, lambda: s.route('D'), "'D'"),
+                            (ValueError, lambda: Snapper(cell=0), 'cell invalid: 0'),
+                            (ValueError, lambda: Snapper(distance=-1), 'distance invalid: -1')):
+                try:
+                    t()
+                    t = None
+                except x as y:
+                    t = y
+                self.test(x.__name__, t, e)
+
+        def testIntersections(self, LatLon):
+            p1, p2, p3, p4 = LatLon(51.8853, 0.2545), LatLon(49.0034, 2.5735), LatLon(51, 0), LatLon(50, 4)
+            x = sphericalNvector.LatLon(51.8853, 0.2545).intersection(sphericalNvector.LatLon(49.0034, 2.5735),
+                                                                      sphericalNvector.LatLon(51, 0),
+                                                                      sphericalNvector.LatLon(50, 4))
+            for c in (None, 0.01, 1, 180):
+                t = intersectionsOf([(p1, p2), (p3, p4), ((52, 0), (52, 4))], cell=c)
+                self.test('intersectionsOf', len(t), '1')
+                self.test('intersectionsOf', fStr(t[0], prec=6), fStr((0, 1, x.lat, x.lon), prec=6))
+
+            # others, reversed, touching at an end and too short
+            t = intersectionsOf([(p1, p2)], [(p4, p3), (p1, p3), ((52, 0), (52, 4)), (p4, p4)])
+            self.test('intersectionsOf', [x[:2] for x in t], '[(0, 0), (0, 1)]')
+            self.test('intersectionsOf', fStr(t[1][2:], prec=4), '51.8853, 0.2545')
+
+            # across the antimeridian, at a pole and the same great circle
+            ss = [((0, 179.9), (0, -179.9)), ((-1, 180), (1, -180)), ((89.9, 0), (89.9, 180)),
+                  ((89.95, 90), (89.95, -90)), ((0, 179), (0, -178))]
+            t = intersectionsOf(ss)
+            self.test('intersectionsOf', [x[:2] for x in t], '[(0, 1), (1, 4), (2, 3)]')
+            self.test('intersectionsOf', fStr([abs(x[2]) for x in t], prec=6), '0.0, 0.0, 90.0')
+            self.test('intersectionsOf', fStr(abs(t[1][3]), prec=6), '180.0')
+
+            # consecutive segments of a route, touching and crossing
+            r = [(0, 0), (1, 1), (0, 2), (1, 3), (0, 1)]
+            t = intersectionsOf(list(zip(r, r[1:])))
+            self.test('intersectionsOf', [x[:2] for x in t], '[(0, 1), (1, 2), (1, 3), (2, 3)]')
+
+            try:
+                intersectionsOf(ss, cell=-1)
+                t = None
+            except ValueError as x:
+                t = x
+            self.test('ValueError', t, 'cell invalid: -1')
+
+    t = Tests(__file__, __version__)
+    t.testRoute(sphericalNvector.LatLon)
+    t.testRoute(sphericalTrigonometry.LatLon)
+    t.testSnapper(sphericalNvector.LatLon)
+    t.testSnapper(sphericalTrigonometry.LatLon)
+    t.testIntersections(sphericalNvector.LatLon)
+    t.testIntersections(sphericalTrigonometry.LatLon)
+    t.results()
+    t.exit()
@@ -3,13 +3,15 @@
 
 # Test UTM functions and methods.
 
-__version__ = '17.01.12'
+__version__ = '17.02.07'
 
 if __name__ == '__main__':
 
     from tests import Tests as _Tests
 
-    from geodesy import ellipsoidalVincenty, F_DMS, utm
+    from geodesy import ellipsoidalVincenty, F_DMS, FastMath, fastmath, fdot, utm
+
+    from threading import Thread
 
     LatLon = ellipsoidalVincenty.LatLon
 
@@ -79,6 +81,46 @@ if __name__ == '__main__':
                         x = u = str(e)
                 self.test('toUtm(%s)' % (p,), u, x)
 
+            # fast math, plain multiply-add
+            ll = LatLon(48.8582, 2.2945)
+            with FastMath():
+                self.test('FastMath', fastmath(), 'True')
+                u = utm.toUtm(ll)
+                self.test('toUtm1', u.toStr(prec=3), '31 N 448251.795 5411932.678')
+                self.test('Utm.toLatLon1', u.toLatLon(LatLon), '48.8582°N, 002.2945°E')
+                for b in ((1, 2, 3), (1, 2, 3, 4, 5)):  # lengths checked
+                    try:
+                        t = fdot([1, 2, 3, 4], *b)
+                    except AssertionError:
+                        t = 'AssertionError'
+                    self.test('fdot', t, 'AssertionError')
+                self.test('fdot', fdot([1, 2, 3, 4], 1, 2, 3, 4), '30')
+            self.test('FastMath', fastmath(), 'False')
+
+            # caches, reset after an update, also by other threads
+            ll = LatLon(48.8582, 2.2945)
+            u = ll.toUtm()
+            self.test('toUtm cache', ll.toUtm() is u and u.toLatLon(LatLon) is ll, 'True')
+            ll.lat = 48.9
+            self.test('toUtm cache', ll.toUtm() is u or u.toLatLon(LatLon) is ll, 'False')
+
+            def _update(n):
+                for i in range(n):
+                    ll.lat = 48 + (i % 2)
+
+            def _toUtm(n):
+                for _ in range(n):
+                    ll.toUtm().toMgrs()
+
+            ts = [Thread(target=_update, args=(2000,))] + \
+                 [Thread(target=_toUtm, args=(2000,)) for _ in range(3)]
+            for t in ts:
+                t.start()
+            for t in ts:
+                t.join()
+            self.test('toUtm threads', ll.toUtm().toStr(prec=3),
+                                       utm.toUtm(LatLon(ll.lat, ll.lon)).toStr(prec=3))
+
     t = Tests(__file__, __version__, utm)
     t.testUtm()
     t.results()
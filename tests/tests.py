@@ -18,12 +18,12 @@ except ImportError:
 from inspect import isclass, isfunction, ismethod, ismodule
 
 from geodesy import R_M, R_NM, F_D, F_DM, F_DMS, F_RAD, Datums, \
-                    compassDMS, compassPoint, degrees, fStr, \
+                    DatumTransformer, compassDMS, compassPoint, degrees, fStr, \
                     lonDMS, normDMS, parseDMS, parse3llh, \
-                    precision, toDMS
+                    precision, toDMS, to3llhs, to3xyzs
 
 __all__ = ('Tests',)
-__version__ = '17.02.01'
+__version__ = '17.02.07'
 
 try:
     _int = int, long
@@ -209,6 +209,26 @@ class Tests(object):
         self.test('convertDatum', d, '51.477284°N, 000.00002°E, -45.91m')  # 51.4773°N, 000.0000°E, -45.91m
         self.test('convertDatum', d.toStr(F_D, prec=4), '51.4773°N, 000.0°E, -45.91m')
 
+        # neither datum WGS84, precomposed Helmert transforms
+        p = LatLon(51.4778, -0.0016, 0, Datums.OSGB36)
+        d = p.convertDatum(Datums.ED50)
+        self.test('convertDatum', d, '51.479177°N, 000.001826°W, -4.82m')
+        q = p.convertDatum(Datums.WGS84).convertDatum(Datums.ED50)
+        self.test('convertDatum', d.equals(q, eps=1e-9), 'True')
+        T = DatumTransformer(Datums.OSGB36, Datums.ED50)
+        d = T.convertAll((p, p))
+        self.test('DatumTransformer', d[1], '51.479177°N, 000.001826°W, -4.82m')
+        self.test('DatumTransformer', d[0].__class__.__name__, 'LatLon')
+
+        # array-level geodetic <-> geocentric, incl. equatorial and polar
+        ps = p, LatLon(0, 45, 0, Datums.OSGB36), LatLon(-90, 0, 10, Datums.OSGB36)
+        xyzs = to3xyzs(((q.lat, q.lon, q.height) for q in ps), datum=Datums.OSGB36)
+        self.test('to3xyzs', xyzs == [q.to3xyz() for q in ps], 'True')
+        llhs = to3llhs(xyzs, datum=Datums.OSGB36)
+        self.test('to3llhs', fStr(llhs[0], prec=6), '51.4778, -0.0016, 0.0')
+        self.test('to3llhs', fStr(llhs[1], prec=6), '0.0, 45.0, 0.0')
+        self.test('to3llhs', fStr(llhs[2], prec=3), '-90.0, 0.0, 10.0')
+
         if Cartesian:
             c = Cartesian(3980581, 97, 4966825)
             n = c.toNvector()  # {x: 0.6228, y: 0.0000, z: 0.7824, h: 0.0000}  # XXX height
@@ -216,6 +236,28 @@ class Tests(object):
             c = n.toCartesian()
             self.test('toCartesian', c.toStr(0), '[3980581, 97, 4966825]')
 
+            from geodesy import ellipsoidalNvector as N
+            toCartesians, toNvectors = N.toCartesians, N.toNvectors
+            c = Cartesian(3194434, 3194434, 4487327)
+            ns = toNvectors((c.to3xyz(), (3980581, 97, 4966825)))
+            self.test('toNvectors', ns[0] == c.toNvector().to4xyzh(), 'True')
+            self.test('toNvectors', fStr(ns[1], prec=4), '0.6228, 0.0, 0.7824, 0.2429')
+            cs = toCartesians(ns)
+            self.test('toCartesians', fStr(cs[0], prec=0), '3194434, 3194434, 4487327')
+            self.test('toCartesians', fStr(cs[1], prec=0), '3980581, 97, 4966825')
+
+            a, b = LatLon(49.66618, 3.45063), LatLon(48.88667, 2.37472, 100)
+            f = N.LocalFrame(a)
+            ns = f.toNeds((b.to3xyz(),))
+            self.test('toNeds', ns[0] == a.deltaTo(b).to3ned(), 'True')
+            self.test('toNeds', fStr(ns[0], prec=0), '-86127, -78901, 969')
+            self.test('toEnus', fStr(f.toEnus((b.to3xyz(),))[0], prec=0), '-78901, -86127, -969')
+            self.test('toAers', fStr(f.toAers((b.to3xyz(),))[0], prec=4), '222.4929, -0.4754, 116808.6392')
+            p = LatLon(*to3llhs(f.fromNeds(ns))[0])
+            self.test('fromNeds', p.toStr(F_D, prec=5), '48.88667°N, 002.37472°E, +100.00m')
+            p = LatLon(*to3llhs(f.fromAers(f.toAers((b.to3xyz(),))))[0])
+            self.test('fromAers', p.toStr(F_D, prec=5), '48.88667°N, 002.37472°E, +100.00m')
+
         if Nvector:
             n = Nvector(0.5, 0.5, 0.7071)
             c = n.toCartesian()  # [3194434, 3194434, 4487327]
@@ -256,6 +298,13 @@ class Tests(object):
         c = p.copy()
         self.test('copy', p.equals(c), 'True')
 
+        f = LatLon.fromDegrees(52.205, 0.119)
+        self.test('fromDegrees', f.equals(p) and f.distanceTo(q) == p.distanceTo(q), 'True')
+        f = LatLon.fromRadians(*p.toradians())
+        self.test('fromRadians', f.equals(p), 'True')
+        fs = LatLon.fromArrays((52.205, 48.857), (0.119, 2.351))
+        self.test('fromArrays', fs[1].equals(q) and fs[1].__class__ is LatLon, 'True')
+
         d = p.distanceTo(q)
         self.test('distanceTo', d, '404279.720589', '%.6f')  # 404300
         d = q.distanceTo(p)
@@ -373,6 +422,27 @@ class Tests(object):
         self.test('rhumbMidpointo', m, '51.0455°N, 001.595727°E')  # 51.0455°N, 001.5957°E
 
     def testVectorial(self, LatLon, Nvector, sumOf):
+        # __slots__, no instance __dict__
+        self.test('__dict__', hasattr(LatLon(0, 0), '__dict__'), 'False')
+        self.test('__dict__', hasattr(Nvector(0, 0, 1), '__dict__'), 'False')
+
+        # batch vector algebra
+        from geodesy import vector3d
+        ps = LatLon(52.205, 0.119), LatLon(48.857, 2.351), LatLon(0, 0)
+        ns = [p.toNvector() for p in ps]
+        a = vector3d.Vector3dArray(ns)
+        v = Nvector(0.5, 0.5, 0.7071)
+        self.test('Vector3dArray', len(a), '3')
+        z = Nvector(0, 0, 1)
+        self.test('angleTo', a.angleTo(v, vSign=z) == [n.angleTo(v, vSign=z) for n in ns], 'True')
+        self.test('cross', a.cross(v).to3xyzs() == [n.cross(v).to3xyz() for n in ns], 'True')
+        self.test('dot', a.dot(v) == [n.dot(v) for n in ns], 'True')
+        self.test('rotate', a.rotate(v, 0.5).to3xyzs() == [n.rotate(v, 0.5).to3xyz() for n in ns], 'True')
+        self.test('unit', a.times(2).unit().to3xyzs() == [n.times(2).unit().to3xyz() for n in ns], 'True')
+        self.test('length', a.minus(v).length() == [n.minus(v).length() for n in ns], 'True')
+        self.test('to2lls', a[1:].to2lls()[0] == ns[1].to2ll(), 'True')
+        self.test('sumOf', sumOf(a, h=0), str(sumOf(ns, h=0)))
+
         if hasattr(LatLon, 'crossTrackDistanceTo'):
             p = LatLon(53.2611, -0.7972)
             s = LatLon(53.3206, -1.7297)
@@ -441,6 +511,11 @@ class Tests(object):
         m = Newport_RI.distanceTo(Cleveland_OH)
         self.test('distanceTo' + n, '%.5f' % m, '866455.43292')
 
+        p, q = LatLon.fromArrays((41.49008, 41.499498), (-71.312796, -81.695391), (0, 0), datum=d)
+        self.test('fromArrays' + n, p.datum == d and p.distanceTo(q) == m, 'True')
+        p = LatLon.fromDegrees(41.49008, -71.312796, 10)
+        self.test('fromDegrees' + n, p.datum == Datums.WGS84 and p.height == 10, 'True')
+
         try:
             t = None
             m = Newport_RI.distanceTo(Newport_RI)
@@ -485,19 +560,26 @@ class Tests(object):
 
 if __name__ == '__main__':
 
-    from geodesy import datum, dms, lcc, mgrs, osgr, \
-                        ellipsoidalNvector, ellipsoidalVincenty, \
-                        sphericalNvector, sphericalTrigonometry, \
-                        nvector, vector3d, utm, utils
+    from geodesy import convert, datum, dms, lcc, mgrs, osgr, ellipsoidalBase, \
+                        ellipsoidalPolygon, geojsonStream, ellipsoidalNvector, ellipsoidalVincenty, \
+                        simplify, sphericalNvector, sphericalPolygon, sphericalRoute, sphericalTrigonometry, \
+                        nvector, packed, parallel, vector3d, utm, utils
     import geodesy
 
     t = Tests(__file__, __version__)
     # check that __all__ names exist in each module
     t.testModule(geodesy, 'geodesy')
-    for m in (datum, dms, lcc, mgrs, osgr,
-              ellipsoidalNvector, ellipsoidalVincenty,
-              sphericalNvector, sphericalTrigonometry,
-              nvector, vector3d, utm, utils):
+    # check that all lifted names are listed, also for lazy imports
+    a = set(('convert', 'ellipsoidalNvector', 'ellipsoidalVincenty', 'VincentyError',
+             'sphericalNvector', 'sphericalTrigonometry', 'vector3d'))
+    for m in (datum, dms, ellipsoidalBase, ellipsoidalPolygon, geojsonStream, lcc, mgrs, osgr,
+              packed, parallel, simplify, sphericalPolygon, sphericalRoute, utm, utils):
+        a.update(m.__all__)
+    t.test('geodesy.__all__', ', '.join(sorted(a.symmetric_difference(geodesy.__all__))), '')
+    for m in (convert, datum, dms, lcc, mgrs, osgr, ellipsoidalBase, ellipsoidalPolygon,
+              geojsonStream, ellipsoidalNvector, ellipsoidalVincenty,
+              simplify, sphericalNvector, sphericalPolygon, sphericalRoute, sphericalTrigonometry,
+              nvector, packed, parallel, vector3d, utm, utils):
         t.testModule(m)
     t.testLatLonAttr(ellipsoidalNvector, ellipsoidalVincenty,
                      sphericalNvector, sphericalTrigonometry)